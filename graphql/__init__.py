@@ -59,6 +59,8 @@ from .type import (  # no import order
     GraphQLSkipDirective,
     GraphQLIncludeDirective,
     GraphQLDeprecatedDirective,
+    GraphQLDeferDirective,
+    GraphQLStreamDirective,
     # Constant Deprecation Reason
     DEFAULT_DEPRECATION_REASON,
     # GraphQL Types for introspection.
@@ -198,6 +200,8 @@ __all__ = (
     "GraphQLSkipDirective",
     "GraphQLIncludeDirective",
     "GraphQLDeprecatedDirective",
+    "GraphQLDeferDirective",
+    "GraphQLStreamDirective",
     "DEFAULT_DEPRECATION_REASON",
     "TypeKind",
     "DirectiveLocation",
@@ -2,7 +2,10 @@ from hashlib import sha1
 
 from six import string_types
 
+from ..error import GraphQLSyntaxError
+from ..pyutils.lru_cache import LRUCache
 from ..type import GraphQLSchema
+from ..utils.normalize_document import get_normalized_document_hash
 from .base import GraphQLBackend
 
 # Necessary for static type checking
@@ -41,13 +44,29 @@ def get_unique_document_id(query_str):
 
 class GraphQLCachedBackend(GraphQLBackend):
     """GraphQLCachedBackend will cache the document response from the backend
-    given a key for that document"""
+    given a key for that document
+
+    With `normalize_documents=True`, documents are cached by the hash of
+    their canonical form (see `normalize_document`), so request strings only
+    differing by whitespace, comments or the order of their definitions or
+    arguments share the same cache entry. The key of the last
+    `max_normalized_keys` request strings is kept in `normalized_keys`, so
+    they are only normalized once.
+
+    Since the locations of errors and `document_string` come from the parsed
+    text, the cached document is only returned for its own request string.
+    Equivalent request strings formatted differently are parsed once, their
+    documents being kept in `formatted_documents` (at most
+    `max_normalized_keys` of them).
+    """
 
     def __init__(
         self,
         backend,  # type: GraphQLBackend
         cache_map=None,  # type: Optional[Dict[Hashable, GraphQLDocument]]
         use_consistent_hash=False,  # type: bool
+        normalize_documents=False,  # type: bool
+        max_normalized_keys=1024,  # type: int
     ):
         # type: (...) -> None
         assert isinstance(
@@ -58,6 +77,9 @@ class GraphQLCachedBackend(GraphQLBackend):
         self.backend = backend
         self.cache_map = cache_map
         self.use_consistent_hash = use_consistent_hash
+        self.normalize_documents = normalize_documents
+        self.normalized_keys = LRUCache(max_normalized_keys)
+        self.formatted_documents = LRUCache(max_normalized_keys)
 
     def get_key_for_schema_and_document_string(self, schema, request_string):
         # type: (GraphQLSchema, str) -> int
@@ -68,13 +90,45 @@ class GraphQLCachedBackend(GraphQLBackend):
             return hash((schema_id, document_id))
         return hash((schema, request_string))
 
+    def get_normalized_key(self, schema, request_string):
+        # type: (GraphQLSchema, str) -> Hashable
+        """This method returns a key given a schema and a request_string, which
+        is the same for request strings with the same canonical form"""
+        key = self.get_key_for_schema_and_document_string(schema, request_string)
+        normalized_key = self.normalized_keys.get(key)
+        if normalized_key is None:
+            try:
+                document_hash = get_normalized_document_hash(request_string)
+            except GraphQLSyntaxError:
+                # Let the backend report the error
+                normalized_key = key
+            else:
+                if self.use_consistent_hash:
+                    schema_id = get_unique_schema_id(schema)
+                    normalized_key = hash((schema_id, document_hash))
+                else:
+                    normalized_key = hash((schema, document_hash))
+            self.normalized_keys[key] = normalized_key
+        return normalized_key
+
     def document_from_string(self, schema, request_string):
         # type: (GraphQLSchema, str) -> Optional[GraphQLDocument]
         """This method returns a GraphQLQuery (from cache if present)"""
-        key = self.get_key_for_schema_and_document_string(schema, request_string)
+        if self.normalize_documents:
+            key = self.get_normalized_key(schema, request_string)
+        else:
+            key = self.get_key_for_schema_and_document_string(schema, request_string)
         if key not in self.cache_map:
             self.cache_map[key] = self.backend.document_from_string(
                 schema, request_string
             )
 
-        return self.cache_map[key]
+        document = self.cache_map[key]
+        if self.normalize_documents and document.document_string != request_string:
+            # Parsed from an equivalent request string formatted differently
+            key = self.get_key_for_schema_and_document_string(schema, request_string)
+            document = self.formatted_documents.get(key)
+            if document is None:
+                document = self.backend.document_from_string(schema, request_string)
+                self.formatted_documents[key] = document
+        return document
@@ -3,6 +3,7 @@ from functools import partial
 from six import string_types
 
 from ..execution import execute, ExecutionResult
+from ..execution.tracing import get_time_ns, get_tracer
 from ..language.base import parse, print_ast
 from ..language import ast
 from ..validation import validate
@@ -25,7 +26,12 @@ def execute_and_validate(
     # type: (...) -> Union[ExecutionResult, Observable]
     do_validation = kwargs.get("validate", True)
     if do_validation:
+        tracer = kwargs["tracing"] = get_tracer(kwargs.get("tracing"))
+        if tracer is not None:
+            validation_start_ns = get_time_ns()
         validation_errors = validate(schema, document_ast)
+        if tracer is not None:
+            tracer.record_phase("validation", validation_start_ns)
         if validation_errors:
             return ExecutionResult(errors=validation_errors, invalid=True)
 
@@ -34,11 +40,19 @@ def execute_and_validate(
 
 class GraphQLCoreBackend(GraphQLBackend):
     """GraphQLCoreBackend will return a document using the default
-    graphql executor"""
+    graphql executor.
 
-    def __init__(self, executor=None):
-        # type: (Optional[Any]) -> None
+    `max_length`, `max_tokens` and `max_depth` limit the documents it parses
+    (see `parse`), documents over a limit failing with a GraphQLSyntaxError."""
+
+    def __init__(self, executor=None, max_length=None, max_tokens=None, max_depth=None):
+        # type: (Optional[Any], Optional[int], Optional[int], Optional[int]) -> None
         self.execute_params = {"executor": executor}
+        self.parse_params = {
+            "max_length": max_length,
+            "max_tokens": max_tokens,
+            "max_depth": max_depth,
+        }
 
     def document_from_string(self, schema, document_string):
         # type: (GraphQLSchema, Union[Document, str]) -> GraphQLDocument
@@ -49,7 +63,7 @@ class GraphQLCoreBackend(GraphQLBackend):
             assert isinstance(
                 document_string, string_types
             ), "The query must be a string"
-            document_ast = parse(document_string)
+            document_ast = parse(document_string, **self.parse_params)
         return GraphQLDocument(
             schema=schema,
             document_string=document_string,
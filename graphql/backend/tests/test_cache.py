@@ -6,6 +6,7 @@ import pytest
 
 from ..core import GraphQLCoreBackend
 from ..cache import GraphQLCachedBackend
+from graphql.error import GraphQLSyntaxError
 from graphql.execution.executors.sync import SyncExecutor
 from .schema import schema
 
@@ -26,3 +27,77 @@ def test_cached_backend_with_use_consistent_hash():
     document1 = cached_backend.document_from_string(schema, "{ hello }")
     document2 = cached_backend.document_from_string(schema, "{ hello }")
     assert document1 == document2
+
+
+def test_cached_backend_with_normalize_documents():
+    # type: () -> None
+    cached_backend = GraphQLCachedBackend(
+        GraphQLCoreBackend(), normalize_documents=True
+    )
+    document1 = cached_backend.document_from_string(schema, "{ hello }")
+    document2 = cached_backend.document_from_string(
+        schema, "# Say hello\n{\n  hello\n}"
+    )
+    document3 = cached_backend.document_from_string(schema, "{ hello }")
+    assert document1 is document3
+    assert len(cached_backend.cache_map) == 1
+    assert len(cached_backend.normalized_keys) == 2
+    assert document2.execute().data == {"hello": "World"}
+
+
+def test_cached_backend_with_normalize_documents_keeps_locations():
+    # type: () -> None
+    cached_backend = GraphQLCachedBackend(
+        GraphQLCoreBackend(), normalize_documents=True
+    )
+    cached_backend.document_from_string(schema, "{ unknown }")
+    request_string = "# Comment\n\n\n\n{\n      unknown\n}"
+    document = cached_backend.document_from_string(schema, request_string)
+    assert document.document_string == request_string
+    result = document.execute()
+    assert [(loc.line, loc.column) for loc in result.errors[0].locations] == [
+        (6, 7)
+    ]
+
+
+def test_cached_backend_with_normalize_documents_parses_each_string_once():
+    # type: () -> None
+    class CountingBackend(GraphQLCoreBackend):
+        parse_count = 0
+
+        def document_from_string(self, schema, document_string):
+            self.parse_count += 1
+            return super(CountingBackend, self).document_from_string(
+                schema, document_string
+            )
+
+    backend = CountingBackend()
+    cached_backend = GraphQLCachedBackend(backend, normalize_documents=True)
+    cached_backend.document_from_string(schema, "{ hello }")
+    for _ in range(5):
+        document = cached_backend.document_from_string(schema, "{hello}")
+        assert document.document_string == "{hello}"
+    cached_backend.document_from_string(schema, "{ hello }")
+    assert backend.parse_count == 2
+    assert len(cached_backend.formatted_documents) == 1
+
+
+def test_cached_backend_bounds_normalized_keys():
+    # type: () -> None
+    cached_backend = GraphQLCachedBackend(
+        GraphQLCoreBackend(), normalize_documents=True, max_normalized_keys=2
+    )
+    for i in range(5):
+        cached_backend.document_from_string(schema, "{ hello }" + " " * i)
+    assert len(cached_backend.normalized_keys) == 2
+    assert len(cached_backend.formatted_documents) == 2
+    assert len(cached_backend.cache_map) == 1
+
+
+def test_cached_backend_with_normalize_documents_and_syntax_errors():
+    # type: () -> None
+    cached_backend = GraphQLCachedBackend(
+        GraphQLCoreBackend(), normalize_documents=True
+    )
+    with pytest.raises(GraphQLSyntaxError):
+        cached_backend.document_from_string(schema, "{ hello")
@@ -3,6 +3,7 @@
 """Tests for `graphql.backend.core` module."""
 
 import pytest
+from graphql.error import GraphQLSyntaxError
 from graphql.execution.executors.sync import SyncExecutor
 
 from ..base import GraphQLBackend, GraphQLDocument
@@ -52,3 +53,22 @@ def test_backend_can_execute_custom_executor():
     assert not result.errors
     assert result.data == {"hello": "World"}
     assert executor.executed
+
+
+def test_backend_limits_parsed_documents():
+    # type: () -> None
+    backend = GraphQLCoreBackend(max_length=100, max_tokens=10, max_depth=2)
+    document = backend.document_from_string(schema, "{ hello }")
+    assert document.execute().data == {"hello": "World"}
+
+    with pytest.raises(GraphQLSyntaxError) as excinfo:
+        backend.document_from_string(schema, "{ hello " * 3 + "}" * 3)
+    assert "Document is nested deeper than 2 levels." in excinfo.value.message
+
+    with pytest.raises(GraphQLSyntaxError) as excinfo:
+        backend.document_from_string(schema, "{ hello }" * 4)
+    assert "Document contains more than 10 tokens." in excinfo.value.message
+
+    with pytest.raises(GraphQLSyntaxError) as excinfo:
+        backend.document_from_string(schema, "{ hello }" + " " * 100)
+    assert "Document is longer than 100 characters." in excinfo.value.message
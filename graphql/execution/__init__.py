@@ -19,15 +19,39 @@ single level of the query. These include:
 3) inline fragment "spreads" e.g. "...on Type { a }"
 """
 from .executor import execute, subscribe
-from .base import ExecutionResult, ResolveInfo
-from .middleware import middlewares, MiddlewareManager
+from .base import (
+    ExecutionResult,
+    ExecutionPatchResult,
+    IncrementalExecutionResult,
+    ResolveInfo,
+)
+from .error_policy import (
+    CountingErrorPolicy,
+    ErrorPolicy,
+    LazyErrorPolicy,
+    NoStackErrorPolicy,
+)
+from .middleware import middlewares, MiddlewareManager, ScopedMiddleware
+from .profiler import SamplingProfiler
+from .stats import FieldStatsCollector
+from .tracing import ExecutionTracer
 
 
 __all__ = [
     "execute",
     "subscribe",
     "ExecutionResult",
+    "ExecutionPatchResult",
+    "IncrementalExecutionResult",
     "ResolveInfo",
     "MiddlewareManager",
     "middlewares",
+    "ScopedMiddleware",
+    "ExecutionTracer",
+    "FieldStatsCollector",
+    "SamplingProfiler",
+    "ErrorPolicy",
+    "LazyErrorPolicy",
+    "CountingErrorPolicy",
+    "NoStackErrorPolicy",
 ]
@@ -19,6 +19,7 @@ if False:  # flake8: noqa
     from ..language.ast import Field, OperationDefinition
     from ..type.definition import GraphQLList, GraphQLObjectType, GraphQLScalarType
     from ..type.schema import GraphQLSchema
+    from .loaders import LoaderRegistry
 
 
 class ExecutionResult(object):
@@ -66,6 +67,86 @@ class ExecutionResult(object):
         return response
 
 
+class IncrementalExecutionResult(ExecutionResult):
+    """The initial result of an execution that deferred or streamed parts of
+    the response. The remaining payloads are produced by iterating over
+    `subsequent_results` (or asynchronously iterating, when the execution
+    uses an asynchronous executor)."""
+
+    __slots__ = ("subsequent_results",)
+
+    def __init__(
+        self,
+        data=None,  # type: Optional[Dict]
+        errors=None,  # type: Optional[List[Exception]]
+        subsequent_results=None,  # type: Any
+        extensions=None,  # type: Optional[Any]
+    ):
+        # type: (...) -> None
+        super(IncrementalExecutionResult, self).__init__(
+            data=data, errors=errors, extensions=extensions
+        )
+        self.subsequent_results = subsequent_results
+
+    @property
+    def has_next(self):
+        # type: () -> bool
+        return True
+
+    def to_dict(self, format_error=None, dict_class=OrderedDict):
+        # type: (Optional[Callable[[Exception], Dict]], Type[Dict]) -> Dict[str, Any]
+        response = super(IncrementalExecutionResult, self).to_dict(
+            format_error, dict_class
+        )
+        response["hasNext"] = True
+        return response
+
+
+class ExecutionPatchResult(ExecutionResult):
+    """A subsequent payload of an incremental execution. `path` points to the
+    object (for @defer) or list item (for @stream) that `data` completes."""
+
+    __slots__ = "path", "label", "has_next"
+
+    def __init__(
+        self,
+        data=None,  # type: Any
+        errors=None,  # type: Optional[List[Exception]]
+        path=None,  # type: Optional[List[Union[int, str]]]
+        label=None,  # type: Optional[str]
+        has_next=False,  # type: bool
+        extensions=None,  # type: Optional[Any]
+    ):
+        # type: (...) -> None
+        super(ExecutionPatchResult, self).__init__(
+            data=data, errors=errors, extensions=extensions
+        )
+        self.path = path
+        self.label = label
+        self.has_next = has_next
+
+    def __eq__(self, other):
+        # type: (Any) -> bool
+        return super(ExecutionPatchResult, self).__eq__(other) and (
+            self is other
+            or (
+                isinstance(other, ExecutionPatchResult)
+                and self.path == other.path
+                and self.label == other.label
+                and self.has_next == other.has_next
+            )
+        )
+
+    def to_dict(self, format_error=None, dict_class=OrderedDict):
+        # type: (Optional[Callable[[Exception], Dict]], Type[Dict]) -> Dict[str, Any]
+        response = super(ExecutionPatchResult, self).to_dict(format_error, dict_class)
+        response["path"] = self.path
+        if self.label is not None:
+            response["label"] = self.label
+        response["hasNext"] = self.has_next
+        return response
+
+
 class ResolveInfo(object):
     __slots__ = (
         "field_name",
@@ -79,6 +160,7 @@ class ResolveInfo(object):
         "variable_values",
         "context",
         "path",
+        "loaders",
     )
 
     def __init__(
@@ -94,6 +176,7 @@ class ResolveInfo(object):
         variable_values,  # type: Dict
         context,  # type: Optional[Any]
         path=None,  # type: Union[List[Union[int, str]], List[str]]
+        loaders=None,  # type: Optional[LoaderRegistry]
     ):
         # type: (...) -> None
         self.field_name = field_name
@@ -107,10 +190,13 @@ class ResolveInfo(object):
         self.variable_values = variable_values
         self.context = context
         self.path = path
+        self.loaders = loaders
 
 
 __all__ = [
     "ExecutionResult",
+    "IncrementalExecutionResult",
+    "ExecutionPatchResult",
     "ResolveInfo",
     "ExecutionContext",
     "SubscriberExecutionContext",
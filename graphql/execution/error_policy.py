@@ -0,0 +1,143 @@
+import logging
+import sys
+import threading
+from collections import defaultdict
+from traceback import format_exception
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from .base import ResolveInfo
+    from types import TracebackType
+    from typing import DefaultDict, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Key of the errors reported outside of any field by CountingErrorPolicy
+NO_FIELD = ("", "")  # type: Tuple[str, str]
+
+
+def format_error_traceback(error, traceback=None):
+    # type: (Exception, Optional[TracebackType]) -> str
+    """Formats the error with the traceback it was raised with."""
+    return "".join(
+        format_exception(type(error), error, getattr(error, "stack", None) or traceback)
+    )
+
+
+def drop_error_traceback(error):
+    # type: (Exception) -> None
+    """Drops the traceback kept by the error, and by its original error, so
+    their frames can be freed."""
+    for exception in (error, getattr(error, "original_error", None)):
+        if exception is None:
+            continue
+        exception.stack = None  # type: ignore
+        if getattr(exception, "__traceback__", None) is not None:
+            exception.__traceback__ = None
+
+
+class ErrorPolicy(object):
+    """Decides what is done with the errors raised while executing a query,
+    when passed to `execute()` (or `graphql()`) as `error_policy`.
+
+    `resolver_error` is called from the `except` clause catching an error
+    raised by a resolver, and `report_error` for every error added to the
+    errors of the result, with the info of the field it nulls, if any. This
+    base policy logs errors as soon as they are raised and reported, like
+    executions without a policy. On paths failing in bulk, prefer
+    `LazyErrorPolicy`, `CountingErrorPolicy` or `NoStackErrorPolicy`, which
+    don't format any traceback.
+    """
+
+    __slots__ = ()
+
+    def resolver_error(self, error, info):
+        # type: (Exception, ResolveInfo) -> Exception
+        logger.exception(
+            "An error occurred while resolving field {}.{}".format(
+                info.parent_type.name, info.field_name
+            )
+        )
+        error.stack = sys.exc_info()[2]  # type: ignore
+        return error
+
+    def report_error(self, errors, error, traceback=None, info=None):
+        # type: (List[Exception], Exception, Optional[TracebackType], Optional[ResolveInfo]) -> None
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(format_error_traceback(error, traceback))
+        errors.append(error)
+
+
+class LazyErrorPolicy(ErrorPolicy):
+    """Keeps the traceback of errors without formatting or logging them.
+    Use `log_errors` or `format_error_traceback` when they are needed."""
+
+    __slots__ = ()
+
+    def resolver_error(self, error, info):
+        # type: (Exception, ResolveInfo) -> Exception
+        error.stack = sys.exc_info()[2]  # type: ignore
+        return error
+
+    def report_error(self, errors, error, traceback=None, info=None):
+        # type: (List[Exception], Exception, Optional[TracebackType], Optional[ResolveInfo]) -> None
+        if traceback is not None and not getattr(error, "stack", None):
+            error.stack = traceback  # type: ignore
+        errors.append(error)
+
+    @staticmethod
+    def log_errors(errors):
+        # type: (List[Exception]) -> None
+        for error in errors:
+            logger.error(format_error_traceback(error))
+
+
+class CountingErrorPolicy(LazyErrorPolicy):
+    """Counts the errors reported for each field, keyed by the name of the
+    parent type and the name of the field, across executions. Every error
+    is counted once, for the field it nulls: resolver and completion errors
+    count for their own field, errors of non-null fields for the nullable
+    field they propagate to. Errors outside of any field are keyed by
+    `NO_FIELD`. Errors are kept like with `LazyErrorPolicy`."""
+
+    __slots__ = ("counts", "_lock")
+
+    def __init__(self):
+        # type: () -> None
+        self.counts = defaultdict(int)  # type: DefaultDict[Tuple[str, str], int]
+        self._lock = threading.Lock()
+
+    def report_error(self, errors, error, traceback=None, info=None):
+        # type: (List[Exception], Exception, Optional[TracebackType], Optional[ResolveInfo]) -> None
+        if info is None:
+            key = NO_FIELD
+        else:
+            key = (info.parent_type.name, info.field_name)
+        with self._lock:
+            self.counts[key] += 1
+        super(CountingErrorPolicy, self).report_error(errors, error, traceback, info)
+
+    def snapshot(self, reset=False):
+        # type: (bool) -> Dict[Tuple[str, str], int]
+        with self._lock:
+            counts = dict(self.counts)
+            if reset:
+                self.counts = defaultdict(int)
+        return counts
+
+
+class NoStackErrorPolicy(ErrorPolicy):
+    """Drops the traceback of errors without logging them, so that failing
+    resolvers don't keep their frames alive until the result is sent."""
+
+    __slots__ = ()
+
+    def resolver_error(self, error, info):
+        # type: (Exception, ResolveInfo) -> Exception
+        drop_error_traceback(error)
+        return error
+
+    def report_error(self, errors, error, traceback=None, info=None):
+        # type: (List[Exception], Exception, Optional[TracebackType], Optional[ResolveInfo]) -> None
+        drop_error_traceback(error)
+        errors.append(error)
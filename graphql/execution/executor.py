@@ -1,9 +1,9 @@
 import collections
 
 try:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 except ImportError:  # Python < 3.3
-    from collections import Iterable
+    from collections import Iterable, Iterator
 import functools
 import logging
 import sys
@@ -18,6 +18,8 @@ from ..pyutils.default_ordered_dict import DefaultOrderedDict
 from ..pyutils.ordereddict import OrderedDict
 from ..utils.undefined import Undefined
 from ..type import (
+    SchemaMetaFieldDef,
+    TypeMetaFieldDef,
     GraphQLEnumType,
     GraphQLInterfaceType,
     GraphQLList,
@@ -29,7 +31,9 @@ from ..type import (
 )
 from .base import (
     ExecutionContext,
+    ExecutionPatchResult,
     ExecutionResult,
+    IncrementalExecutionResult,
     ResolveInfo,
     collect_fields,
     default_resolve_fn,
@@ -39,11 +43,19 @@ from .base import (
 )
 from .executors.sync import SyncExecutor
 from .middleware import MiddlewareManager
+from .profiler import ExecutionProfile
+from .tracing import get_time_ns, get_tracer
+from .utils import copy_result
 
 # Necessary for static type checking
 if False:  # flake8: noqa
     from typing import Any, Optional, Union, Dict, List, Callable
-    from ..language.ast import Document, OperationDefinition, Field
+    from ..language.ast import Document, OperationDefinition, Field, SelectionSet
+    from .error_policy import ErrorPolicy
+    from .profiler import SamplingProfiler
+    from .stats import FieldStatsCollector
+    from .tracing import ExecutionTracer
+    from .utils import DeferredFragment
 
 logger = logging.getLogger(__name__)
 
@@ -67,9 +79,34 @@ def execute(
     return_promise=False,  # type: bool
     middleware=None,  # type: Optional[Any]
     allow_subscriptions=False,  # type: bool
+    loaders=None,  # type: Optional[Dict[Any, Callable]]
+    memoize_resolvers=False,  # type: bool
+    tracing=False,  # type: Union[bool, ExecutionTracer]
+    field_stats=None,  # type: Optional[FieldStatsCollector]
+    profiler=None,  # type: Optional[SamplingProfiler]
+    profile=False,  # type: bool
+    error_policy=None,  # type: Optional[ErrorPolicy]
+    max_errors=None,  # type: Optional[int]
+    abort_on_error_count=None,  # type: Optional[int]
     **options  # type: Any
 ):
     # type: (...) -> Union[ExecutionResult, Promise[ExecutionResult]]
+    """Executes the operation of the document.
+
+    With `max_errors`, errors reported after the first `max_errors` ones are
+    only counted, and with `abort_on_error_count`, fields are no longer
+    resolved, but set to null, once that many errors have been reported.
+    Both limits apply to the whole response, including the subsequent
+    payloads of @defer and @stream. When either limit is reached, the number
+    of errors and of omitted errors so far are added to the `errorLimits` key
+    of the extensions of the result or payload."""
+    tracer = get_tracer(tracing)
+    if tracer is not None:
+        execution_start_ns = get_time_ns()
+    if profiler is not None and (profile or profiler.should_sample()):
+        execution_profile = ExecutionProfile()  # type: Optional[ExecutionProfile]
+    else:
+        execution_profile = None
 
     if root_value is None and "root" in options:
         warnings.warn(
@@ -120,6 +157,14 @@ def execute(
         executor,
         middleware,
         allow_subscriptions,
+        loaders,
+        memoize_resolvers,
+        tracer,
+        field_stats,
+        execution_profile,
+        error_policy,
+        max_errors,
+        abort_on_error_count,
     )
 
     def promise_executor(v):
@@ -136,10 +181,35 @@ def execute(
         if isinstance(data, Observable):
             return data
 
+        if execution_profile is not None:
+            profiler.add_profile(execution_profile)  # type: ignore
+
+        extensions = {}  # type: Dict[str, Any]
+        if tracer is not None:
+            tracer.record_phase("execution", execution_start_ns)
+            tracer.finish()
+            extensions["tracing"] = tracer.to_dict()
+        error_limits = get_error_limits(exe_context)
+        if error_limits is not None:
+            extensions["errorLimits"] = error_limits
+
+        if exe_context.subsequent_jobs and data is not None:
+            return IncrementalExecutionResult(
+                data=data,
+                errors=exe_context.errors or None,
+                subsequent_results=SubsequentResults(exe_context),
+                extensions=extensions,
+            )
+
+        if exe_context.loaders is not None:
+            exe_context.loaders.clear()
+
         if not exe_context.errors:
-            return ExecutionResult(data=data)
+            return ExecutionResult(data=data, extensions=extensions)
 
-        return ExecutionResult(data=data, errors=exe_context.errors)
+        return ExecutionResult(
+            data=data, errors=exe_context.errors, extensions=extensions
+        )
 
     promise = (
         Promise.resolve(None).then(promise_executor).catch(on_rejected).then(on_resolve)
@@ -156,6 +226,18 @@ def execute(
     return promise
 
 
+def get_error_limits(exe_context):
+    # type: (ExecutionContext) -> Optional[Dict[str, Any]]
+    """Returns the `errorLimits` extension once an error limit is reached."""
+    if not (exe_context.omitted_error_count or exe_context.aborted):
+        return None
+    return {
+        "errorCount": exe_context.error_count,
+        "omittedErrorCount": exe_context.omitted_error_count,
+        "aborted": exe_context.aborted,
+    }
+
+
 def execute_operation(
     exe_context,  # type: ExecutionContext
     operation,  # type: OperationDefinition
@@ -163,9 +245,23 @@ def execute_operation(
 ):
     # type: (...) -> Union[Dict, Promise[Dict], Observable]
     type = get_operation_root_type(exe_context.schema, operation)
+    if operation.operation == "subscription":
+        # Incremental delivery is not supported for subscriptions
+        exe_context.subsequent_jobs = None
+
+    deferred = (
+        [] if exe_context.subsequent_jobs is not None else None
+    )  # type: Optional[List[DeferredFragment]]
     fields = collect_fields(
-        exe_context, type, operation.selection_set, DefaultOrderedDict(list), set()
+        exe_context,
+        type,
+        operation.selection_set,
+        DefaultOrderedDict(list),
+        set(),
+        deferred,
     )
+    if deferred:
+        defer_fragments(exe_context, type, root_value, [], None, deferred)
 
     if operation.operation == "mutation":
         return execute_fields_serially(exe_context, type, root_value, [], fields)
@@ -330,11 +426,40 @@ def resolve_field(
     if not field_def:
         return Undefined
 
+    if exe_context.aborted:
+        # Too many errors were reported, stop resolving fields. Skipped
+        # non-null fields fail so that null propagates to a nullable parent.
+        if isinstance(field_def.type, GraphQLNonNull):
+            raise GraphQLError(
+                "Execution aborted after too many errors.", field_asts, path=field_path
+            )
+        return None
+
+    if (
+        (field_def is SchemaMetaFieldDef or field_def is TypeMetaFieldDef)
+        and parent_info is None
+        and len(field_asts) == 1
+        and not exe_context.middleware
+    ):
+        # Introspection results only depend on the schema and the selection
+        introspection_key = exe_context.get_introspection_key(field_ast)
+        if introspection_key is not None:
+            cached_result = exe_context.schema.get_introspection_cache().get(
+                introspection_key, Undefined
+            )
+            if cached_result is not Undefined:
+                return copy_result(cached_result)
+            error_count = len(exe_context.errors)
+    else:
+        introspection_key = None
+
     return_type = field_def.type
     resolve_fn = field_def.resolver or default_resolve_fn
 
     # We wrap the resolve_fn from the middleware
-    resolve_fn_middleware = exe_context.get_field_resolver(resolve_fn)
+    resolve_fn_middleware = exe_context.get_field_resolver(
+        resolve_fn, parent_type, field_name, field_def
+    )
 
     # Build a dict of arguments from the field.arguments AST, using the variables scope to
     # fulfill any variable references.
@@ -359,14 +484,190 @@ def resolve_field(
         variable_values=exe_context.variable_values,
         context=context,
         path=field_path,
+        loaders=exe_context.loaders,
     )
 
     executor = exe_context.executor
-    result = resolve_or_error(resolve_fn_middleware, source, info, args, executor)
+    resolver_cache = exe_context.resolver_cache
+    cache_key = None
+    cached = None
+    if (
+        resolver_cache is not None
+        and field_def.resolver
+        and field_def.memoize
+        # Root mutation fields are never memoized
+        and (parent_info or exe_context.operation.operation != "mutation")
+    ):
+        cache_key = exe_context.get_resolver_cache_key(field_def, field_ast, source)
+        if cache_key is not None:
+            cached = resolver_cache.get(cache_key)
+
+    profile = exe_context.execution_profile
+    if profile is not None:
+        field_start_ns = profile.enter_field()
+
+    # Keys hold the id of the source, entries are only reused for the
+    # source they keep
+    if cached is not None and cached[0] is source:
+        result = cached[1]
+    else:
+        time_resolvers = exe_context.time_resolvers
+        if time_resolvers:
+            start_ns = get_time_ns()
+        result = resolve_or_error(
+            resolve_fn_middleware,
+            source,
+            info,
+            args,
+            executor,
+            exe_context.error_policy,
+        )
+        if time_resolvers:
+            resolved_ns = get_time_ns()
+            if exe_context.only_trace_resolvers and not is_thenable(result):
+                # Inlined record_resolved, as tracing is mostly used alone
+                exe_context.tracer.resolvers.append(  # type: ignore
+                    (
+                        field_path,
+                        parent_type,
+                        field_name,
+                        return_type,
+                        start_ns,
+                        resolved_ns,
+                    )
+                )
+            else:
+                result = record_resolved(
+                    exe_context, info, start_ns, resolved_ns, result
+                )
+        if cache_key is not None and resolver_cache is not None:
+            # The source is kept alive so its id can't be reused
+            result = get_reusable_result(result)
+            resolver_cache[cache_key] = (source, result)
+
+    if profile is None:
+        completed = complete_value_catching_error(
+            exe_context, return_type, field_asts, info, field_path, result
+        )
+    else:
+        completion_start_ns = get_time_ns()
+        try:
+            completed = complete_value_catching_error(
+                exe_context, return_type, field_asts, info, field_path, result
+            )
+        finally:
+            profile.exit_field(field_path, field_start_ns, completion_start_ns)
+    if introspection_key is not None:
+        return cache_introspection_result(
+            exe_context, introspection_key, error_count, completed
+        )
+    return completed
+
+
+def get_reusable_result(result):
+    # type: (Any) -> Any
+    """Returns the result of a memoized resolver in a form that can be
+    completed several times: one-shot iterators, like generators, are turned
+    into lists. Errors raised while iterating are returned, to be reported
+    like errors raised by the resolver."""
+    if is_thenable(result):
+        return Promise.resolve(result).then(get_reusable_result)
+    if isinstance(result, Iterator):
+        try:
+            return list(result)
+        except Exception as e:
+            e.stack = sys.exc_info()[2]  # type: ignore
+            return e
+    return result
+
+
+def record_resolved(
+    exe_context,  # type: ExecutionContext
+    info,  # type: ResolveInfo
+    start_ns,  # type: int
+    resolved_ns,  # type: int
+    result,  # type: Any
+):
+    # type: (...) -> Any
+    """Records the duration of a resolver call in the tracer, the field stats
+    collector and the execution profile once its result is available.
+    Results available synchronously, including settled promises, are
+    recorded without waiting for them."""
+    if exe_context.execution_profile is not None:
+        exe_context.execution_profile.record(
+            info.path, "resolve", resolved_ns - start_ns
+        )
+    if is_thenable(result):
+        if not isinstance(result, Promise) or result.is_pending:
+
+            def on_resolve(value):
+                # type: (Any) -> Any
+                record_resolver(
+                    exe_context, info, start_ns, get_time_ns(), False, resolved_ns
+                )
+                return value
+
+            def on_reject(error):
+                # type: (Exception) -> Any
+                record_resolver(
+                    exe_context, info, start_ns, get_time_ns(), True, resolved_ns
+                )
+                raise error
+
+            return Promise.resolve(result).then(on_resolve, on_reject)
+        failed = result.is_rejected
+    else:
+        failed = isinstance(result, Exception)
+    record_resolver(exe_context, info, start_ns, resolved_ns, failed)
+    return result
+
+
+def record_resolver(
+    exe_context,  # type: ExecutionContext
+    info,  # type: ResolveInfo
+    start_ns,  # type: int
+    end_ns,  # type: int
+    failed,  # type: bool
+    resolved_ns=None,  # type: Optional[int]
+):
+    # type: (...) -> None
+    """Records a resolver call. `resolved_ns` is the time the resolver
+    returned the promise it was waited for, if any."""
+    tracer = exe_context.tracer
+    if tracer is not None:
+        tracer.record_resolver(info, start_ns, end_ns)
+    field_stats = exe_context.field_stats
+    if field_stats is not None:
+        field_stats.record(
+            info.parent_type.name, info.field_name, end_ns - start_ns, failed
+        )
+    profile = exe_context.execution_profile
+    if resolved_ns is not None and profile is not None:
+        profile.record(info.path, "wait", end_ns - resolved_ns)
 
-    return complete_value_catching_error(
-        exe_context, return_type, field_asts, info, field_path, result
-    )
+
+def cache_introspection_result(
+    exe_context,  # type: ExecutionContext
+    introspection_key,  # type: Any
+    error_count,  # type: int
+    completed,  # type: Any
+):
+    # type: (...) -> Any
+    """Stores the completed value of a root __schema or __type field in the
+    introspection cache of the schema, unless errors were reported while
+    completing it."""
+
+    def cache_result(result):
+        # type: (Any) -> Any
+        if len(exe_context.errors) == error_count:
+            exe_context.schema.get_introspection_cache()[
+                introspection_key
+            ] = copy_result(result)
+        return result
+
+    if is_thenable(completed):
+        return Promise.resolve(completed).then(cache_result)
+    return cache_result(completed)
 
 
 def subscribe_field(
@@ -388,7 +689,9 @@ def subscribe_field(
     resolve_fn = field_def.resolver or default_resolve_fn
 
     # We wrap the resolve_fn from the middleware
-    resolve_fn_middleware = exe_context.get_field_resolver(resolve_fn)
+    resolve_fn_middleware = exe_context.get_field_resolver(
+        resolve_fn, parent_type, field_name, field_def
+    )
 
     # Build a dict of arguments from the field.arguments AST, using the variables scope to
     # fulfill any variable references.
@@ -413,10 +716,13 @@ def subscribe_field(
         variable_values=exe_context.variable_values,
         context=context,
         path=path,
+        loaders=exe_context.loaders,
     )
 
     executor = exe_context.executor
-    result = resolve_or_error(resolve_fn_middleware, source, info, args, executor)
+    result = resolve_or_error(
+        resolve_fn_middleware, source, info, args, executor, exe_context.error_policy
+    )
 
     if isinstance(result, Exception):
         raise result
@@ -446,11 +752,14 @@ def resolve_or_error(
     info,  # type: ResolveInfo
     args,  # type: Dict
     executor,  # type: Any
+    error_policy=None,  # type: Optional[ErrorPolicy]
 ):
     # type: (...) -> Any
     try:
         return executor.execute(resolve_fn, source, info, **args)
     except Exception as e:
+        if error_policy is not None:
+            return error_policy.resolver_error(e, info)
         logger.exception(
             "An error occurred while resolving field {}.{}".format(
                 info.parent_type.name, info.field_name
@@ -485,7 +794,7 @@ def complete_value_catching_error(
             def handle_error(error):
                 # type: (Union[GraphQLError, GraphQLLocatedError]) -> Optional[Any]
                 traceback = completed._traceback  # type: ignore
-                exe_context.report_error(error, traceback)
+                exe_context.report_error(error, traceback, info)
                 return None
 
             return completed.catch(handle_error)
@@ -493,7 +802,7 @@ def complete_value_catching_error(
         return completed
     except Exception as e:
         traceback = sys.exc_info()[2]
-        exe_context.report_error(e, traceback)
+        exe_context.report_error(e, traceback, info)
         return None
 
 
@@ -595,8 +904,32 @@ def complete_list_value(
     completed_results = []
     contains_promise = False
 
+    stream = exe_context.get_stream_values(field_asts[0])
+    if stream is not None:
+        result = iter(result)
+        initial_count = stream.get("initial_count") or 0
+        if initial_count < 0:
+            raise GraphQLError(
+                "initialCount must be a non-negative integer", field_asts, path=path
+            )
+
     index = 0
     for item in result:
+        if stream is not None and index >= initial_count:
+            exe_context.subsequent_jobs.append(  # type: ignore
+                StreamJob(
+                    stream.get("label"),
+                    path,
+                    item_type,
+                    field_asts,
+                    info,
+                    result,
+                    index,
+                    item,
+                )
+            )
+            break
+
         completed_item = complete_value_catching_error(
             exe_context, item_type, field_asts, info, path + [index], item
         )
@@ -656,6 +989,11 @@ def complete_abstract_value(
             runtime_type = return_type.resolve_type(result, info)
         else:
             runtime_type = get_default_resolve_type_fn(result, info, return_type)
+            # The default resolver only returns possible types
+            if runtime_type is not None:
+                return complete_object_value(
+                    exe_context, runtime_type, field_asts, info, path, result
+                )
 
     if isinstance(runtime_type, string_types):
         runtime_type = info.schema.get_type(runtime_type)  # type: ignore
@@ -690,10 +1028,27 @@ def get_default_resolve_type_fn(
     abstract_type,  # type: Union[GraphQLInterfaceType, GraphQLUnionType]
 ):
     # type: (...) -> Optional[GraphQLObjectType]
+    python_type_map = info.schema.get_python_type_map(abstract_type)
+    if python_type_map is not None:
+        value_class = type(value)
+        try:
+            return python_type_map[value_class]
+        except KeyError:
+            runtime_type = None
+            for possible_type in info.schema.get_possible_types(abstract_type):
+                python_type = possible_type.python_type
+                if python_type is not None and isinstance(value, python_type):
+                    runtime_type = possible_type
+                    break
+            python_type_map[value_class] = runtime_type
+            return runtime_type
+
     possible_types = info.schema.get_possible_types(abstract_type)
-    for type in possible_types:
-        if callable(type.is_type_of) and type.is_type_of(value, info):
-            return type
+    for possible_type in possible_types:
+        if callable(possible_type.is_type_of) and possible_type.is_type_of(
+            value, info
+        ):
+            return possible_type
     return None
 
 
@@ -719,6 +1074,11 @@ def complete_object_value(
 
     # Collect sub-fields to execute to complete this value.
     subfield_asts = exe_context.get_sub_fields(return_type, field_asts)
+    if exe_context.subsequent_jobs is not None:
+        deferred = exe_context.get_deferred_fragments(return_type, field_asts)
+        if deferred:
+            defer_fragments(exe_context, return_type, result, path, info, deferred)
+
     return execute_fields(  # type: ignore
         exe_context, return_type, result, subfield_asts, path, info
     )
@@ -749,3 +1109,227 @@ def complete_nonnull_value(
         )
 
     return completed
+
+
+def defer_fragments(
+    exe_context,  # type: ExecutionContext
+    parent_type,  # type: GraphQLObjectType
+    source,  # type: Any
+    path,  # type: List[Union[int, str]]
+    info,  # type: Optional[ResolveInfo]
+    deferred,  # type: List[DeferredFragment]
+):
+    # type: (...) -> None
+    for fragment in deferred:
+        exe_context.subsequent_jobs.append(  # type: ignore
+            DeferJob(
+                fragment.label, path, parent_type, source, fragment.selection_set, info
+            )
+        )
+
+
+class DeferJob(object):
+    """Executes the fields of a deferred fragment on its parent object."""
+
+    __slots__ = "label", "path", "parent_type", "source", "selection_set", "info"
+
+    def __init__(
+        self,
+        label,  # type: Optional[str]
+        path,  # type: List[Union[int, str]]
+        parent_type,  # type: GraphQLObjectType
+        source,  # type: Any
+        selection_set,  # type: SelectionSet
+        info,  # type: Optional[ResolveInfo]
+    ):
+        # type: (...) -> None
+        self.label = label
+        self.path = path
+        self.parent_type = parent_type
+        self.source = source
+        self.selection_set = selection_set
+        self.info = info
+
+    @property
+    def done(self):
+        # type: () -> bool
+        return True
+
+    def run(self, exe_context):
+        # type: (ExecutionContext) -> Any
+        deferred = []  # type: List[DeferredFragment]
+        fields = collect_fields(
+            exe_context,
+            self.parent_type,
+            self.selection_set,
+            DefaultOrderedDict(list),
+            set(),
+            deferred,
+        )
+        if deferred:
+            defer_fragments(
+                exe_context,
+                self.parent_type,
+                self.source,
+                self.path,
+                self.info,
+                deferred,
+            )
+        return execute_fields(
+            exe_context, self.parent_type, self.source, fields, self.path, self.info
+        )
+
+
+class StreamJob(object):
+    """Completes the remaining items of a streamed list, one per payload."""
+
+    __slots__ = (
+        "label",
+        "list_path",
+        "path",
+        "item_type",
+        "field_asts",
+        "info",
+        "iterator",
+        "index",
+        "item",
+        "done",
+    )
+
+    def __init__(
+        self,
+        label,  # type: Optional[str]
+        list_path,  # type: List[Union[int, str]]
+        item_type,  # type: Any
+        field_asts,  # type: List[Field]
+        info,  # type: ResolveInfo
+        iterator,  # type: Iterator
+        index,  # type: int
+        item,  # type: Any
+    ):
+        # type: (...) -> None
+        self.label = label
+        self.list_path = list_path
+        self.path = list_path + [index]
+        self.item_type = item_type
+        self.field_asts = field_asts
+        self.info = info
+        self.iterator = iterator
+        self.index = index
+        self.item = item
+        self.done = False
+
+    def run(self, exe_context):
+        # type: (ExecutionContext) -> Any
+        self.path = self.list_path + [self.index]
+        item = self.item
+        # Look ahead, so we know whether another payload follows this one.
+        try:
+            self.item = next(self.iterator)
+            self.index += 1
+        except StopIteration:
+            self.item = None
+            self.done = True
+
+        return complete_value_catching_error(
+            exe_context, self.item_type, self.field_asts, self.info, self.path, item
+        )
+
+
+class SubsequentResults(object):
+    """Iterator over the payloads that were deferred or streamed during an
+    execution, in the order they were scheduled.
+
+    Iterating synchronously waits for the executor to finish each payload;
+    with an asynchronous executor use `async for` instead."""
+
+    __slots__ = ("exe_context",)
+
+    def __init__(self, exe_context):
+        # type: (ExecutionContext) -> None
+        self.exe_context = exe_context
+
+    def __iter__(self):
+        # type: () -> SubsequentResults
+        return self
+
+    def __next__(self):
+        # type: () -> ExecutionPatchResult
+        promise = self.next_promise()
+        if promise is None:
+            raise StopIteration
+        self.exe_context.executor.wait_until_finished()
+        return promise.get()
+
+    next = __next__
+
+    def __aiter__(self):
+        # type: () -> SubsequentResults
+        return self
+
+    def __anext__(self):
+        # type: () -> Promise[ExecutionPatchResult]
+        promise = self.next_promise()
+        if promise is None:
+            return Promise.rejected(StopAsyncIteration())  # type: ignore
+        clean = getattr(self.exe_context.executor, "clean", None)
+        if callable(clean):
+            clean()
+        return promise
+
+    def next_promise(self):
+        # type: () -> Optional[Promise[ExecutionPatchResult]]
+        """Starts executing the next payload, returning a promise for it, or
+        None once every payload has been delivered."""
+        exe_context = self.exe_context
+        jobs = exe_context.subsequent_jobs
+        if not jobs:
+            self.clear_loaders()
+            return None
+
+        job = jobs[0]
+        # Errors are reported per payload, but limited over the whole response
+        exe_context.delivered_error_count += len(exe_context.errors)
+        errors = []  # type: List[Exception]
+        exe_context.errors = errors
+
+        def on_resolve(data):
+            # type: (Any) -> ExecutionPatchResult
+            if not jobs:
+                # Last payload, consumers may not ask for the next one
+                self.clear_loaders()
+            extensions = {}  # type: Dict[str, Any]
+            error_limits = get_error_limits(exe_context)
+            if error_limits is not None:
+                extensions["errorLimits"] = error_limits
+            return ExecutionPatchResult(
+                data=data,
+                errors=errors or None,
+                path=path,
+                label=job.label,
+                has_next=bool(jobs),
+                extensions=extensions,
+            )
+
+        def on_rejected(error):
+            # type: (Exception) -> ExecutionPatchResult
+            errors.append(error)
+            return on_resolve(None)
+
+        try:
+            completed = job.run(exe_context)
+        except Exception as e:
+            completed = Promise.rejected(e)
+        finally:
+            path = job.path
+            if job.done:
+                jobs.popleft()
+
+        return Promise.resolve(completed).then(on_resolve, on_rejected)
+
+    def clear_loaders(self):
+        # type: () -> None
+        """Drops the loaders of the execution once every payload has been
+        executed, like executions without subsequent payloads do."""
+        if self.exe_context.loaders is not None:
+            self.exe_context.loaders.clear()
@@ -0,0 +1,178 @@
+from promise import Promise
+from promise.dataloader import DataLoader
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+__all__ = ["LoaderRegistry"]
+
+
+class LoaderRegistry(object):
+    """Per-execution registry of DataLoaders, available as `info.loaders`.
+
+    Loaders are created lazily on first access from the given factories, which
+    are called with the execution context value:
+
+        loaders = {'user': lambda context: DataLoader(load_users)}
+        execute(schema, document, loaders=loaders)
+
+        def resolve_author(post, info):
+            return info.loaders['user'].load(post.author_id)
+
+    Batching loaders created by the registry don't rely on promise's global
+    scheduler: their `batch_load_fn` is wrapped so that the batches they
+    dispatch are held, and loaded together once the executor has run every
+    resolver of the current tick. This makes batching work for resolvers
+    running on an asyncio event loop as well."""
+
+    __slots__ = (
+        "factories",
+        "context",
+        "executor",
+        "_loaders",
+        "_pending",
+        "_dispatch_scheduled",
+    )
+
+    def __init__(
+        self,
+        factories,  # type: Dict[Hashable, Callable[[Any], DataLoader]]
+        context=None,  # type: Any
+        executor=None,  # type: Any
+    ):
+        # type: (...) -> None
+        self.factories = factories
+        self.context = context
+        self.executor = executor
+        self._loaders = {}  # type: Dict[Hashable, DataLoader]
+        self._pending = []  # type: List[HeldBatchLoadFn]
+        self._dispatch_scheduled = False
+
+    def __getitem__(self, key):
+        # type: (Hashable) -> DataLoader
+        loader = self._loaders.get(key)
+        if loader is None:
+            factory = self.factories.get(key)
+            if factory is None:
+                raise KeyError(
+                    'No DataLoader factory registered for "{}".'.format(key)
+                )
+            loader = factory(self.context)
+            if isinstance(loader, DataLoader) and loader.batch:
+                loader.batch_load_fn = HeldBatchLoadFn(self, loader)
+            self._loaders[key] = loader
+        return loader
+
+    def __contains__(self, key):
+        # type: (Hashable) -> bool
+        return key in self.factories
+
+    def get(self, key, default=None):
+        # type: (Hashable, Optional[DataLoader]) -> Optional[DataLoader]
+        if key not in self.factories:
+            return default
+        return self[key]
+
+    def _enqueue(self, batch_load_fn):
+        # type: (HeldBatchLoadFn) -> None
+        self._pending.append(batch_load_fn)
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            self._schedule_dispatch()
+
+    def _schedule_dispatch(self):
+        # type: () -> None
+        loop = getattr(self.executor, "loop", None)
+        if loop is not None:
+            # Dispatch on the next iteration of the event loop, once every
+            # ready coroutine had the chance to enqueue its keys.
+            loop.call_soon(self.dispatch)
+        else:
+            # Dispatch after the promise jobs currently being run by the
+            # executor.
+            Promise.resolve(None).then(lambda _: self.dispatch())
+
+    def dispatch(self):
+        # type: () -> None
+        """Dispatches the held keys of every loader, one batch per loader."""
+        self._dispatch_scheduled = False
+        pending = self._pending
+        self._pending = []
+        for batch_load_fn in pending:
+            batch_load_fn.dispatch()
+
+    def clear(self):
+        # type: () -> None
+        """Clears the loaders created so far and their caches."""
+        for loader in self._loaders.values():
+            loader.clear_all()
+        self._loaders.clear()
+
+
+class HeldBatchLoadFn(object):
+    """Replaces the `batch_load_fn` of a loader created by a LoaderRegistry.
+    The keys of every batch dispatched by the loader are held until the
+    registry dispatches, then loaded with one call to the original function
+    (or one per `max_batch_size` keys)."""
+
+    __slots__ = ("registry", "loader", "batch_load_fn", "batches")
+
+    def __init__(self, registry, loader):
+        # type: (LoaderRegistry, DataLoader) -> None
+        self.registry = registry
+        self.loader = loader
+        self.batch_load_fn = loader.batch_load_fn
+        self.batches = []  # type: List[Tuple[List[Hashable], Promise]]
+
+    def __call__(self, keys):
+        # type: (List[Hashable]) -> Promise
+        promise = Promise()  # type: Promise
+        if not self.batches:
+            self.registry._enqueue(self)
+        self.batches.append((keys, promise))
+        return promise
+
+    def dispatch(self):
+        # type: () -> None
+        batches = self.batches
+        self.batches = []
+        keys = [key for batch_keys, _ in batches for key in batch_keys]
+
+        def resolve_batches(values):
+            # type: (Any) -> None
+            if len(batches) == 1:
+                # The loader checks the values itself
+                batches[0][1].do_resolve(values)
+                return
+            try:
+                values = list(values)
+            except TypeError:
+                for _, promise in batches:
+                    promise.do_resolve(values)
+                return
+            start = 0
+            for batch_keys, promise in batches:
+                promise.do_resolve(values[start : start + len(batch_keys)])
+                start += len(batch_keys)
+
+        def reject_batches(error):
+            # type: (Exception) -> None
+            for _, promise in batches:
+                promise.do_reject(error)
+
+        max_batch_size = self.loader.max_batch_size
+        try:
+            if max_batch_size and len(keys) > max_batch_size:
+                values = Promise.all(
+                    [
+                        self.batch_load_fn(keys[start : start + max_batch_size])
+                        for start in range(0, len(keys), max_batch_size)
+                    ]
+                ).then(lambda chunks: [value for chunk in chunks for value in chunk])
+            else:
+                values = self.batch_load_fn(keys)
+        except Exception as e:
+            reject_batches(e)
+            return
+        Promise.resolve(values).then(resolve_batches, reject_batches)
@@ -6,17 +6,31 @@ from promise import promisify
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from typing import Any, Callable, Iterator, Tuple, Dict, Iterable
+    from typing import Any, Callable, Iterator, List, Optional, Tuple, Dict, Iterable
+    from ..type.definition import GraphQLField, GraphQLObjectType
 
 MIDDLEWARE_RESOLVER_FUNCTION = "resolve"
+MIDDLEWARE_SCOPE_FUNCTION = "applies_to"
 
 
 class MiddlewareManager(object):
+    """Wraps the resolvers of the fields in the chain of middlewares.
+
+    A middleware can restrict the fields it wraps with an `applies_to`
+    method (or attribute, for functions), called once per field with the
+    parent type, the field name, the field definition and whether the field
+    uses the default resolver. Fields no middleware applies to are resolved
+    without going through the chain. Use `ScopedMiddleware` to scope a
+    middleware that has no `applies_to`.
+    """
+
     __slots__ = (
         "middlewares",
         "wrap_in_promise",
         "_middleware_resolvers",
+        "_middleware_scopes",
         "_cached_resolvers",
+        "_cached_field_resolvers",
     )
 
     def __init__(self, *middlewares, **kwargs):
@@ -26,7 +40,14 @@ class MiddlewareManager(object):
         self._middleware_resolvers = (
             list(get_middleware_resolvers(middlewares)) if middlewares else []
         )
+        scopes = list(get_middleware_scopes(middlewares)) if middlewares else []
+        self._middleware_scopes = (
+            scopes if any(scopes) else None
+        )  # type: Optional[List[Optional[Callable]]]
         self._cached_resolvers = {}  # type: Dict[Callable, Callable]
+        self._cached_field_resolvers = (
+            {}
+        )  # type: Dict[Tuple[GraphQLObjectType, str, Callable], Callable]
 
     def get_field_resolver(self, field_resolver):
         # type: (Callable) -> Callable
@@ -39,10 +60,65 @@ class MiddlewareManager(object):
 
         return self._cached_resolvers[field_resolver]
 
+    def get_resolver_for_field(
+        self,
+        field_resolver,  # type: Callable
+        parent_type,  # type: GraphQLObjectType
+        field_name,  # type: str
+        field_def,  # type: GraphQLField
+    ):
+        # type: (...) -> Callable
+        """Returns the resolver of the field wrapped in the middlewares which
+        apply to the field."""
+        if self._middleware_scopes is None:
+            return self.get_field_resolver(field_resolver)
+
+        key = parent_type, field_name, field_resolver
+        resolver = self._cached_field_resolvers.get(key)
+        if resolver is None:
+            is_default_resolver = field_def.resolver is None
+            resolver = self._cached_field_resolvers[key] = middleware_chain(
+                field_resolver,
+                [
+                    middleware
+                    for middleware, applies_to in zip(
+                        self._middleware_resolvers, self._middleware_scopes
+                    )
+                    if applies_to is None
+                    or applies_to(
+                        parent_type, field_name, field_def, is_default_resolver
+                    )
+                ],
+                wrap_in_promise=self.wrap_in_promise,
+            )
+        return resolver
+
 
 middlewares = MiddlewareManager
 
 
+class ScopedMiddleware(object):
+    """Restricts a middleware to the fields for which `applies_to` returns
+    True, e.g. `ScopedMiddleware(log_middleware, has_resolver)`."""
+
+    __slots__ = ("resolve", "applies_to")
+
+    def __init__(self, middleware, applies_to):
+        # type: (Any, Callable[[GraphQLObjectType, str, GraphQLField, bool], bool]) -> None
+        if inspect.isfunction(middleware):
+            self.resolve = middleware
+        else:
+            self.resolve = getattr(middleware, MIDDLEWARE_RESOLVER_FUNCTION)
+        self.applies_to = applies_to
+
+
+def has_resolver(parent_type, field_name, field_def, is_default_resolver):
+    # type: (GraphQLObjectType, str, GraphQLField, bool) -> bool
+    """Scope of middlewares which only apply to the fields with a resolver,
+    leaving out the fields using the default resolver."""
+    return not is_default_resolver
+
+
 def get_middleware_resolvers(middlewares):
     # type: (Tuple[Any, ...]) -> Iterator[Callable]
     for middleware in middlewares:
@@ -54,6 +130,18 @@ def get_middleware_resolvers(middlewares):
         yield getattr(middleware, MIDDLEWARE_RESOLVER_FUNCTION)
 
 
+def get_middleware_scopes(middlewares):
+    # type: (Tuple[Any, ...]) -> Iterator[Optional[Callable]]
+    """Yields the scope of each middleware resolver, or None if it applies to
+    every field, in the order of get_middleware_resolvers."""
+    for middleware in middlewares:
+        if inspect.isfunction(middleware):
+            yield getattr(middleware, MIDDLEWARE_SCOPE_FUNCTION, None)
+        if not hasattr(middleware, MIDDLEWARE_RESOLVER_FUNCTION):
+            continue
+        yield getattr(middleware, MIDDLEWARE_SCOPE_FUNCTION, None)
+
+
 def middleware_chain(func, middlewares, wrap_in_promise):
     # type: (Callable, Iterable[Callable], bool) -> Callable
     if not middlewares:
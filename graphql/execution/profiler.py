@@ -0,0 +1,95 @@
+import threading
+from collections import defaultdict
+from itertools import count
+
+from .tracing import get_time_ns
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, DefaultDict, Dict, List, Union
+
+
+class SamplingProfiler(object):
+    """Profiles one execution out of `sample_rate`, plus the executions
+    called with `profile=True`, when passed to `execute()` (or `graphql()`)
+    as `profiler`.
+
+    The time of each field is split in three frames: `resolve`, the time
+    spent in the resolver, `wait`, the time waiting for the promise returned
+    by the resolver, and `complete`, the time spent completing the value
+    without the time of the sub-fields. Times are aggregated in nanoseconds
+    by field path, list indexes being dropped, and `folded()` returns them in
+    the folded stacks format read by flamegraph tools:
+
+        hero;friends;name;resolve 52000
+    """
+
+    __slots__ = ("sample_rate", "stacks", "_counter", "_lock")
+
+    def __init__(self, sample_rate=100):
+        # type: (int) -> None
+        assert sample_rate >= 1, "sample_rate must be at least 1."
+        self.sample_rate = sample_rate
+        self.stacks = defaultdict(int)  # type: DefaultDict[str, int]
+        self._counter = count(1)
+        self._lock = threading.Lock()
+
+    def should_sample(self):
+        # type: () -> bool
+        return next(self._counter) % self.sample_rate == 0
+
+    def add_profile(self, profile):
+        # type: (ExecutionProfile) -> None
+        with self._lock:
+            for stack, duration_ns in profile.stacks.items():
+                self.stacks[stack] += duration_ns
+
+    def folded(self):
+        # type: () -> str
+        with self._lock:
+            stacks = sorted(self.stacks.items())
+        return "".join(
+            "{} {}\n".format(stack, duration_ns) for stack, duration_ns in stacks
+        )
+
+    def reset(self):
+        # type: () -> None
+        with self._lock:
+            self.stacks = defaultdict(int)
+
+
+class ExecutionProfile(object):
+    """The times recorded during one profiled execution.
+
+    `child_times` holds, for each field being completed, the time spent in
+    its sub-fields so far, to subtract it from the completion time of the
+    field."""
+
+    __slots__ = ("stacks", "child_times")
+
+    def __init__(self):
+        # type: () -> None
+        self.stacks = defaultdict(int)  # type: DefaultDict[str, int]
+        self.child_times = []  # type: List[int]
+
+    def record(self, path, frame, duration_ns):
+        # type: (Union[List[Union[int, str]], List[str], None], str, int) -> None
+        stack = ";".join(
+            [name for name in path or [] if not isinstance(name, int)] + [frame]
+        )
+        self.stacks[stack] += duration_ns
+
+    def enter_field(self):
+        # type: () -> int
+        self.child_times.append(0)
+        return get_time_ns()
+
+    def exit_field(self, path, field_start_ns, completion_start_ns):
+        # type: (List[Union[int, str]], int, int) -> None
+        end_ns = get_time_ns()
+        child_time = self.child_times.pop()
+        self.record(
+            path, "complete", max(end_ns - completion_start_ns - child_time, 0)
+        )
+        if self.child_times:
+            self.child_times[-1] += end_ns - field_start_ns
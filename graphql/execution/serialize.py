@@ -0,0 +1,194 @@
+try:
+    from collections.abc import Mapping, MutableMapping
+except ImportError:  # Python < 3.3
+    from collections import Mapping, MutableMapping
+import json
+
+from six import integer_types, string_types
+
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+    from .base import ExecutionResult
+
+__all__ = ["iter_json", "iter_execution_result", "write_execution_result"]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_SEPARATORS = (", ", ": ")
+
+
+def iter_json(
+    value,  # type: Any
+    separators=DEFAULT_SEPARATORS,  # type: Tuple[str, str]
+    release=False,  # type: bool
+):
+    # type: (...) -> Iterator[str]
+    """Yields the JSON encoding of `value` piece by piece.
+
+    The output is the same as `json.dumps(value, separators=separators)`, but
+    the value is walked with an explicit stack so deeply nested results never
+    hit the recursion limit and no intermediate string for the whole tree is
+    ever built.
+
+    If `release` is True, containers are emptied while they are being
+    serialized, so every subtree can be garbage collected as soon as it has
+    been written out. The value must not be used afterwards."""
+    item_separator, key_separator = separators
+    dumps = json.dumps
+    # Each frame is [iterator, is_mapping, is_first_item]
+    stack = []  # type: List[List[Any]]
+    pending = [value]
+
+    while True:
+        if pending:
+            current = pending.pop()
+            if isinstance(current, Mapping):
+                if not current:
+                    yield "{}"
+                else:
+                    yield "{"
+                    stack.append([_iter_items(current, release), True, True])
+            elif isinstance(current, (list, tuple)):
+                if not current:
+                    yield "[]"
+                else:
+                    yield "["
+                    stack.append([_iter_list(current, release), False, True])
+            else:
+                yield dumps(current)
+
+        if not stack:
+            return
+
+        frame = stack[-1]
+        try:
+            item = next(frame[0])
+        except StopIteration:
+            stack.pop()
+            yield "}" if frame[1] else "]"
+            continue
+
+        if frame[2]:
+            frame[2] = False
+        else:
+            yield item_separator
+
+        if frame[1]:
+            key, item = item
+            yield dumps(_key_to_text(key))
+            yield key_separator
+
+        pending.append(item)
+
+
+def _key_to_text(key):
+    # type: (Any) -> str
+    """Converts a mapping key to a string the way the json module does."""
+    if isinstance(key, string_types):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, integer_types + (float,)):
+        return json.dumps(key)
+    raise TypeError(
+        "keys must be str, int, float, bool or None, not {}".format(
+            type(key).__name__
+        )
+    )
+
+
+def _iter_items(mapping, release):
+    # type: (Mapping, bool) -> Iterator[Tuple[Any, Any]]
+    if not release or not isinstance(mapping, MutableMapping):
+        for item in mapping.items():
+            yield item
+        return
+
+    for key in list(mapping):
+        yield key, mapping.pop(key)
+
+
+def _iter_list(sequence, release):
+    # type: (Union[List, Tuple], bool) -> Iterator[Any]
+    if not release or isinstance(sequence, tuple):
+        for item in sequence:
+            yield item
+        return
+
+    for index in range(len(sequence)):
+        item = sequence[index]
+        sequence[index] = None
+        yield item
+    del sequence[:]
+
+
+def iter_execution_result(
+    result,  # type: ExecutionResult
+    format_error=None,  # type: Optional[Callable[[Exception], Dict]]
+    chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+    separators=DEFAULT_SEPARATORS,  # type: Tuple[str, str]
+    release=False,  # type: bool
+    encoding=None,  # type: Optional[str]
+):
+    # type: (...) -> Iterator[Any]
+    """Serializes an ExecutionResult to JSON incrementally.
+
+    Yields chunks of roughly `chunk_size` characters (or bytes, when an
+    `encoding` is given) whose concatenation equals
+    `json.dumps(result.to_dict(format_error), separators=separators)`.
+
+    With `release=True` the data tree of the result is consumed while it is
+    written, so a large response is never held in memory twice."""
+    item_separator, key_separator = separators
+    dumps = json.dumps
+    # Every key of the response, like hasNext or path, comes from to_dict
+    response = result.to_dict(format_error)
+    if release:
+        result.data = None
+
+    def iter_pieces():
+        # type: () -> Iterator[str]
+        yield "{"
+        for index, key in enumerate(list(response)):
+            if index:
+                yield item_separator
+            yield dumps(key)
+            yield key_separator
+            if key == "data" and release:
+                value = response.pop(key)
+            else:
+                value = response[key]
+            for piece in iter_json(value, separators, release and key == "data"):
+                yield piece
+        yield "}"
+
+    buffer = []  # type: List[str]
+    buffered = 0
+    for piece in iter_pieces():
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            chunk = "".join(buffer)
+            yield chunk.encode(encoding) if encoding else chunk
+            buffer = []
+            buffered = 0
+
+    if buffer:
+        chunk = "".join(buffer)
+        yield chunk.encode(encoding) if encoding else chunk
+
+
+def write_execution_result(result, fp, **kwargs):
+    # type: (ExecutionResult, Any, **Any) -> None
+    """Writes an ExecutionResult as JSON into the file-like object `fp`.
+
+    Accepts the same keyword arguments as `iter_execution_result`."""
+    write = fp.write
+    for chunk in iter_execution_result(result, **kwargs):
+        write(chunk)
@@ -0,0 +1,110 @@
+import threading
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, Dict, List, Optional, Tuple
+
+# Resolvers taking less than a microsecond are counted in the first bucket,
+# and each following bucket doubles the upper bound, the last one counting
+# calls over about 18 minutes.
+BUCKET_COUNT = 32
+
+
+class FieldStatsCollector(object):
+    """Aggregates the number of calls, the number of errors and a histogram
+    of the durations of the resolvers of each field, keyed by the name of
+    the parent type and the name of the field, across executions.
+
+    Pass it to `execute()` (or `graphql()`) as `field_stats`. Every thread
+    records in its own table, without locking, and tables are merged when
+    taking a snapshot. Once a field has been recorded by a thread, recording
+    it again doesn't allocate.
+
+    The histogram of a field has `BUCKET_COUNT` buckets on a log scale: the
+    upper bound of bucket `i` is `2 ** i` microseconds (see `bucket_bounds`),
+    the last bucket counting every slower call.
+    """
+
+    __slots__ = ("_local", "_lock", "_tables", "_generation")
+
+    def __init__(self):
+        # type: () -> None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._tables = []  # type: List[Dict[Tuple[str, str], List[Any]]]
+        self._generation = 0
+
+    @staticmethod
+    def bucket_bounds():
+        # type: () -> List[int]
+        """Returns the upper bound of each bucket in nanoseconds, the last
+        bucket having no upper bound."""
+        return [1000 << i for i in range(BUCKET_COUNT - 1)]
+
+    def get_table(self):
+        # type: () -> Dict[Tuple[str, str], List[Any]]
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            with self._lock:
+                local.table = {}
+                local.generation = self._generation
+                self._tables.append(local.table)
+        return local.table
+
+    def record(self, parent_type_name, field_name, duration_ns, failed=False):
+        # type: (str, str, int, bool) -> None
+        table = self.get_table()
+        stats = table.get((parent_type_name, field_name))
+        if stats is None:
+            # Calls, errors, total duration and histogram
+            stats = table[(parent_type_name, field_name)] = [
+                0,
+                0,
+                0,
+                [0] * BUCKET_COUNT,
+            ]
+        stats[0] += 1
+        if failed:
+            stats[1] += 1
+        stats[2] += duration_ns
+        stats[3][min((duration_ns // 1000).bit_length(), BUCKET_COUNT - 1)] += 1
+
+    def snapshot(self, reset=False):
+        # type: (bool) -> Dict[Tuple[str, str], Dict[str, Any]]
+        """Returns the statistics of each field recorded since the last reset,
+        as a dict with `count`, `errors`, `total_ns` and `histogram` keys.
+        With `reset=True`, statistics are reset at the same time."""
+        with self._lock:
+            tables = self._tables
+            if reset:
+                self._tables = []
+                self._generation += 1
+
+        merged = {}  # type: Dict[Tuple[str, str], Dict[str, Any]]
+        for table in tables:
+            # Other threads may be recording in the table
+            for key, (count, errors, total_ns, histogram) in list(table.items()):
+                field_stats = merged.get(key)
+                if field_stats is None:
+                    merged[key] = {
+                        "count": count,
+                        "errors": errors,
+                        "total_ns": total_ns,
+                        "histogram": list(histogram),
+                    }
+                    continue
+                field_stats["count"] += count
+                field_stats["errors"] += errors
+                field_stats["total_ns"] += total_ns
+                field_stats["histogram"] = [
+                    a + b for a, b in zip(field_stats["histogram"], histogram)
+                ]
+        return merged
+
+    def reset(self):
+        # type: () -> None
+        """Drops the statistics recorded so far. Tables of other threads are
+        replaced the next time they record a field."""
+        with self._lock:
+            self._tables = []
+            self._generation += 1
@@ -388,3 +388,87 @@ def test_resolve_type_can_use_type_string():
     assert result.data == {
         "pets": [{"woofs": True, "name": "Odie"}, {"name": "Garfield", "meows": False}]
     }
+
+
+def test_python_type_used_to_resolve_runtime_type_by_class():
+    # type: () -> None
+    class Puppy(Dog):
+        pass
+
+    PetType = GraphQLInterfaceType(
+        name="Pet", fields={"name": GraphQLField(GraphQLString)}
+    )
+
+    DogType = GraphQLObjectType(
+        name="Dog",
+        interfaces=[PetType],
+        python_type=Dog,
+        fields={
+            "name": GraphQLField(GraphQLString),
+            "woofs": GraphQLField(GraphQLBoolean),
+        },
+    )
+
+    CatType = GraphQLObjectType(
+        name="Cat",
+        interfaces=[PetType],
+        python_type=Cat,
+        fields={
+            "name": GraphQLField(GraphQLString),
+            "meows": GraphQLField(GraphQLBoolean),
+        },
+    )
+
+    schema = GraphQLSchema(
+        query=GraphQLObjectType(
+            name="Query",
+            fields={
+                "pets": GraphQLField(
+                    GraphQLList(PetType),
+                    resolver=lambda *_: [
+                        Dog("Odie", True),
+                        Cat("Garfield", False),
+                        Puppy("Rex", True),
+                        Dog("Max", False),
+                        Human("Jon"),
+                    ],
+                )
+            },
+        ),
+        types=[CatType, DogType],
+    )
+
+    query = """
+    {
+        pets {
+            name
+            ... on Dog {
+                woofs
+            }
+            ... on Cat {
+                meows
+            }
+        }
+    }
+    """
+
+    result = graphql(schema, query)
+    assert result.data == {
+        "pets": [
+            {"woofs": True, "name": "Odie"},
+            {"name": "Garfield", "meows": False},
+            {"woofs": True, "name": "Rex"},
+            {"woofs": False, "name": "Max"},
+            None,
+        ]
+    }
+    assert len(result.errors) == 1
+    assert result.errors[0].message.startswith(
+        "Abstract type Pet must resolve to an Object type at runtime"
+    )
+    assert schema.get_python_type_map(PetType) == {
+        Dog: DogType,
+        Cat: CatType,
+        Puppy: DogType,
+        Human: None,
+    }
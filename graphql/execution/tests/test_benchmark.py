@@ -101,3 +101,21 @@ def test_big_list_objecttypes_with_two_int_fields(benchmark):
     @benchmark
     def b():
         return execute(schema, ast)
+
+
+def test_big_list_objecttypes_with_two_int_fields_traced(benchmark):
+    Query = GraphQLObjectType(
+        "Query",
+        fields={
+            "allContainers": GraphQLField(
+                GraphQLList(ContainerType), resolver=resolve_all_containers
+            )
+        },
+    )
+    schema = GraphQLSchema(Query)
+    source = Source("{ allContainers { x y } }")
+    ast = parse(source)
+
+    @benchmark
+    def b():
+        return execute(schema, ast, tracing=True)
@@ -7,6 +7,7 @@ from graphql import (
     GraphQLObjectType,
     GraphQLField,
     GraphQLID,
+    GraphQLList,
     GraphQLArgument,
     GraphQLNonNull,
     GraphQLSchema,
@@ -169,3 +170,110 @@ def test_batches_multiple_together(executor):
     }
     assert business_load_calls == [["1", "2"]]
     assert location_load_calls == [["location-1", "location-2"]]
+
+
+def get_users_schema(load_calls, loaders=None):
+    def batch_load_users(keys):
+        # type: (List[str]) -> Promise
+        load_calls.append(keys)
+        return Promise.resolve([
+            {"id": key, "bestFriendId": str(int(key) + 3)} for key in keys
+        ])
+
+    User = GraphQLObjectType(
+        "User",
+        lambda: {
+            "id": GraphQLField(GraphQLID),
+            "bestFriend": GraphQLField(
+                User,
+                resolver=lambda root, info, **args: info.loaders["user"].load(
+                    root["bestFriendId"]
+                ),
+            ),
+        },
+    )
+
+    Query = GraphQLObjectType(
+        "Query",
+        lambda: {
+            "users": GraphQLField(
+                GraphQLList(User),
+                resolver=lambda root, info, **args: info.loaders["user"].load_many(
+                    ["1", "2", "3"]
+                ),
+            )
+        },
+    )
+
+    if loaders is None:
+        loaders = {"user": lambda context: DataLoader(batch_load_users)}
+    return GraphQLSchema(query=Query, loaders=loaders), batch_load_users
+
+
+def test_loader_registry_batches_list_items():
+    # type: () -> None
+    load_calls = []  # type: List[List[str]]
+    schema, _ = get_users_schema(load_calls)
+
+    result = execute(schema, parse("{ users { id bestFriend { id } } }"))
+    assert not result.errors
+    assert result.data == {
+        "users": [
+            {"id": "1", "bestFriend": {"id": "4"}},
+            {"id": "2", "bestFriend": {"id": "5"}},
+            {"id": "3", "bestFriend": {"id": "6"}},
+        ]
+    }
+    assert load_calls == [["1", "2", "3"], ["4", "5", "6"]]
+
+    # Every execution gets its own loaders
+    execute(schema, parse("{ users { id } }"))
+    assert load_calls == [["1", "2", "3"], ["4", "5", "6"], ["1", "2", "3"]]
+
+
+def test_loader_registry_factories_passed_to_execute():
+    # type: () -> None
+    load_calls = []  # type: List[List[str]]
+    contexts = []
+    schema, batch_load_users = get_users_schema(load_calls, loaders={})
+
+    def user_loader(context):
+        contexts.append(context)
+        return DataLoader(batch_load_users)
+
+    result = execute(
+        schema,
+        parse("{ users { bestFriend { bestFriend { id } } } }"),
+        context_value="ctx",
+        loaders={"user": user_loader},
+    )
+    assert not result.errors
+    assert contexts == ["ctx"]
+    assert load_calls == [["1", "2", "3"], ["4", "5", "6"], ["7", "8", "9"]]
+
+
+def test_loader_registry_unknown_loader():
+    # type: () -> None
+    from graphql.execution.loaders import LoaderRegistry
+
+    registry = LoaderRegistry({"user": lambda context: DataLoader(lambda keys: keys)})
+    assert "user" in registry
+    assert "post" not in registry
+    assert registry.get("post") is None
+    assert registry.get("user") is registry["user"]
+    with pytest.raises(KeyError):
+        registry["post"]
+
+
+def test_loader_registry_respects_max_batch_size():
+    # type: () -> None
+    load_calls = []  # type: List[List[str]]
+    schema, batch_load_users = get_users_schema(load_calls, loaders={})
+
+    def user_loader(context):
+        return DataLoader(batch_load_users, max_batch_size=2)
+
+    result = execute(schema, parse("{ users { id } }"), loaders={"user": user_loader})
+    assert not result.errors
+    assert result.data == {"users": [{"id": "1"}, {"id": "2"}, {"id": "3"}]}
+    assert load_calls == [["1", "2"], ["3"]]
@@ -275,3 +275,74 @@ def test_works_directives_no_include_or_skip():
     result = execute_test_query("{ a, b @include(if: false) @skip(if: false) }")
     assert not result.errors
     assert result.data == {"a": "a"}
+
+
+NestedType = GraphQLObjectType(
+    name="Query",
+    fields=lambda: {
+        "a": GraphQLField(GraphQLString),
+        "b": GraphQLField(GraphQLString),
+        "nested": GraphQLField(NestedType),
+    },
+)
+nested_schema = GraphQLSchema(query=NestedType)
+
+
+class NestedData(Data):
+    @property
+    def nested(self):
+        return NestedData()
+
+
+def test_reuses_collected_fields_across_executions():
+    # type: () -> None
+    from graphql.execution.utils import get_document_plan
+
+    ast = parse("{ nested { a ...F b @skip(if: true) } } fragment F on Query { b }")
+    for _ in range(2):
+        result = execute(nested_schema, ast, NestedData())
+        assert not result.errors
+        assert result.data == {"nested": {"a": "a", "b": "b"}}
+
+    plan = get_document_plan(ast)
+    assert len(plan.sub_fields) == 1
+    subfield_asts, deferred = list(plan.sub_fields.values())[0]
+    assert list(subfield_asts) == ["a", "b"]
+    assert {condition for _, condition in plan.include_conditions.values()} == {
+        False
+    }
+
+
+def test_does_not_reuse_include_conditions_of_other_directives():
+    # type: () -> None
+    from graphql.execution.utils import get_document_plan
+
+    ast = parse("{ a b @skip(if: true) }")
+    directives = ast.definitions[0].selection_set.selections[1].directives
+    # A stale entry left by a collected list which had the same id
+    plan = get_document_plan(ast)
+    plan.include_conditions[id(directives)] = (list(directives), True)
+
+    result = execute(nested_schema, ast, NestedData())
+    assert not result.errors
+    assert result.data == {"a": "a"}
+    assert plan.include_conditions[id(directives)] == (directives, False)
+
+
+def test_evaluates_variable_directives_per_execution():
+    # type: () -> None
+    from graphql.execution.utils import get_document_plan
+
+    ast = parse(
+        """
+        query q($skip: Boolean!) {
+          nested { a ... on Query @skip(if: $skip) { b } }
+        }
+    """
+    )
+    result = execute(nested_schema, ast, NestedData(), variable_values={"skip": True})
+    assert result.data == {"nested": {"a": "a"}}
+    result = execute(nested_schema, ast, NestedData(), variable_values={"skip": False})
+    assert result.data == {"nested": {"a": "a", "b": "b"}}
+
+    assert list(get_document_plan(ast).sub_fields.values()) == [None]
@@ -0,0 +1,144 @@
+# type: ignore
+from graphql.execution import IncrementalExecutionResult, execute
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLStreamDirective,
+    GraphQLString,
+    specified_directives,
+)
+
+
+def resolve_checksum(row, info):
+    raise Exception("Corrupted row {}".format(row["id"]))
+
+
+RowType = GraphQLObjectType(
+    "Row",
+    fields={
+        "id": GraphQLField(GraphQLInt),
+        "checksum": GraphQLField(GraphQLString, resolver=resolve_checksum),
+    },
+)
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        fields={
+            "rows": GraphQLField(
+                GraphQLList(RowType),
+                resolver=lambda *_: [{"id": i} for i in range(10)],
+            )
+        },
+    ),
+    directives=specified_directives + [GraphQLStreamDirective],
+)
+
+document = parse("{ rows { id checksum } }")
+
+
+def test_counts_errors_over_max_errors():
+    result = execute(schema, document, max_errors=3)
+    assert [error.path for error in result.errors] == [
+        ["rows", 0, "checksum"],
+        ["rows", 1, "checksum"],
+        ["rows", 2, "checksum"],
+    ]
+    assert result.data["rows"][9] == {"id": 9, "checksum": None}
+    assert result.extensions == {
+        "errorLimits": {"errorCount": 10, "omittedErrorCount": 7, "aborted": False}
+    }
+
+
+def test_aborts_execution_after_abort_on_error_count():
+    result = execute(schema, document, abort_on_error_count=2)
+    assert len(result.errors) == 2
+    assert result.data["rows"][:3] == [
+        {"id": 0, "checksum": None},
+        {"id": 1, "checksum": None},
+        {"id": None, "checksum": None},
+    ]
+    assert result.extensions == {
+        "errorLimits": {"errorCount": 2, "omittedErrorCount": 0, "aborted": True}
+    }
+
+
+def test_does_not_report_limits_that_are_not_reached():
+    result = execute(schema, document, max_errors=10, abort_on_error_count=11)
+    assert len(result.errors) == 10
+    assert result.extensions == {}
+
+
+def test_aborted_non_null_fields_propagate_null():
+    NonNullRowType = GraphQLObjectType(
+        "NonNullRow",
+        fields={
+            "a": GraphQLField(GraphQLNonNull(GraphQLInt)),
+            "b": GraphQLField(GraphQLNonNull(GraphQLInt)),
+            "checksum": GraphQLField(GraphQLString, resolver=resolve_checksum),
+        },
+    )
+    non_null_schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            fields={
+                "rows": GraphQLField(
+                    GraphQLList(NonNullRowType),
+                    resolver=lambda *_: [{"id": i, "a": i, "b": i} for i in range(3)],
+                )
+            },
+        )
+    )
+
+    result = execute(
+        non_null_schema, parse("{ rows { a b checksum } }"), abort_on_error_count=1
+    )
+    assert result.data == {"rows": [{"a": 0, "b": 0, "checksum": None}, None, None]}
+    assert len(result.errors) == 1
+    assert result.extensions == {
+        "errorLimits": {"errorCount": 3, "omittedErrorCount": 2, "aborted": True}
+    }
+
+
+def test_limits_errors_over_the_whole_incremental_response():
+    result = execute(
+        schema, parse("{ rows @stream(initialCount: 2) { id checksum } }"), max_errors=3
+    )
+    assert isinstance(result, IncrementalExecutionResult)
+    assert len(result.errors) == 2
+    assert result.extensions == {}
+
+    patches = list(result.subsequent_results)
+    assert len(patches) == 8
+    assert [len(patch.errors or []) for patch in patches] == [1, 0, 0, 0, 0, 0, 0, 0]
+    assert patches[0].extensions == {}
+    assert [patch.data for patch in patches[1:3]] == [
+        {"id": 3, "checksum": None},
+        {"id": 4, "checksum": None},
+    ]
+    assert patches[1].extensions == {
+        "errorLimits": {"errorCount": 4, "omittedErrorCount": 1, "aborted": False}
+    }
+    assert patches[-1].extensions == {
+        "errorLimits": {"errorCount": 10, "omittedErrorCount": 7, "aborted": False}
+    }
+
+
+def test_aborts_subsequent_payloads_after_abort_on_error_count():
+    result = execute(
+        schema,
+        parse("{ rows @stream(initialCount: 1) { id checksum } }"),
+        abort_on_error_count=2,
+    )
+    assert len(result.errors) == 1
+    patches = list(result.subsequent_results)
+    assert patches[0].data == {"id": 1, "checksum": None}
+    assert patches[1].data == {"id": None, "checksum": None}
+    assert patches[-1].extensions == {
+        "errorLimits": {"errorCount": 2, "omittedErrorCount": 0, "aborted": True}
+    }
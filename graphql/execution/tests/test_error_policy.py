@@ -0,0 +1,152 @@
+# type: ignore
+from graphql.execution import (
+    CountingErrorPolicy,
+    ErrorPolicy,
+    LazyErrorPolicy,
+    NoStackErrorPolicy,
+    execute,
+)
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+
+def resolve_total(order, info):
+    raise Exception("Failed")
+
+
+OrderType = GraphQLObjectType(
+    "Order",
+    fields={
+        "number": GraphQLField(GraphQLInt),
+        "total": GraphQLField(GraphQLString, resolver=resolve_total),
+    },
+)
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        fields={
+            "orders": GraphQLField(
+                GraphQLList(OrderType),
+                resolver=lambda *_: [{"number": i} for i in range(10)],
+            )
+        },
+    )
+)
+
+document = parse("{ orders { number total } }")
+
+
+def patch_loggers(mocker):
+    return [
+        mocker.patch("graphql.execution.executor.logger"),
+        mocker.patch("graphql.execution.utils.logger"),
+        mocker.patch("graphql.execution.error_policy.logger"),
+    ]
+
+
+def test_error_policy_logs_errors_immediately(mocker):
+    executor_logger, utils_logger, policy_logger = patch_loggers(mocker)
+    result = execute(schema, document, error_policy=ErrorPolicy())
+    assert len(result.errors) == 10
+    assert not executor_logger.exception.called
+    assert not utils_logger.error.called
+    assert policy_logger.exception.call_count == 10
+    policy_logger.exception.assert_called_with(
+        "An error occurred while resolving field Order.total"
+    )
+    assert policy_logger.error.call_count == 10
+    assert "GraphQLLocatedError: Failed" in policy_logger.error.call_args[0][0]
+
+
+def test_lazy_error_policy_formats_tracebacks_on_demand(mocker):
+    loggers = patch_loggers(mocker)
+    result = execute(schema, document, error_policy=LazyErrorPolicy())
+    assert len(result.errors) == 10
+    assert result.data["orders"][0] == {"number": 0, "total": None}
+    for logger in loggers:
+        assert not logger.method_calls
+    assert all(error.stack for error in result.errors)
+
+    LazyErrorPolicy.log_errors(result.errors)
+    policy_logger = loggers[2]
+    assert policy_logger.error.call_count == 10
+    message = policy_logger.error.call_args[0][0]
+    assert "resolve_total" in message
+    assert "GraphQLLocatedError: Failed" in message
+
+
+def test_counting_error_policy_counts_errors_per_field(mocker):
+    loggers = patch_loggers(mocker)
+    error_policy = CountingErrorPolicy()
+    execute(schema, document, error_policy=error_policy)
+    execute(schema, document, error_policy=error_policy)
+    for logger in loggers:
+        assert not logger.method_calls
+    assert error_policy.snapshot(reset=True) == {("Order", "total"): 20}
+    assert error_policy.snapshot() == {}
+
+
+def test_counting_error_policy_counts_completion_and_non_null_errors(mocker):
+    patch_loggers(mocker)
+    ChildType = GraphQLObjectType(
+        "Child",
+        fields={"required": GraphQLField(GraphQLNonNull(GraphQLString))},
+    )
+    counting_schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            fields={
+                "child": GraphQLField(ChildType, resolver=lambda *_: {}),
+                "failingChild": GraphQLField(
+                    ChildType, resolver=lambda *_: {"required": resolve_total}
+                ),
+                "notAList": GraphQLField(
+                    GraphQLList(GraphQLInt), resolver=lambda *_: 1
+                ),
+            },
+        )
+    )
+    error_policy = CountingErrorPolicy()
+    result = execute(
+        counting_schema,
+        parse("{ child { required } failingChild { required } notAList }"),
+        error_policy=error_policy,
+    )
+    assert result.data == {"child": None, "failingChild": None, "notAList": None}
+    assert len(result.errors) == 3
+    assert error_policy.snapshot() == {
+        ("Query", "child"): 1,
+        ("Query", "failingChild"): 1,
+        ("Query", "notAList"): 1,
+    }
+
+
+def test_default_reporting_skips_formatting_when_logging_is_disabled(mocker):
+    executor_logger, utils_logger, _ = patch_loggers(mocker)
+    utils_logger.isEnabledFor.return_value = False
+    format_exception = mocker.patch("graphql.execution.utils.format_exception")
+    result = execute(schema, document)
+    assert len(result.errors) == 10
+    assert not format_exception.called
+    assert not utils_logger.error.called
+
+
+def test_no_stack_error_policy_drops_tracebacks(mocker):
+    loggers = patch_loggers(mocker)
+    result = execute(schema, document, error_policy=NoStackErrorPolicy())
+    assert len(result.errors) == 10
+    for logger in loggers:
+        assert not logger.method_calls
+    for error in result.errors:
+        assert error.stack is None
+        assert getattr(error.original_error, "__traceback__", None) is None
+    assert result.errors[0].message == "Failed"
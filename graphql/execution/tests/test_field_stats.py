@@ -0,0 +1,118 @@
+# type: ignore
+import threading
+
+from graphql import graphql
+from graphql.execution import execute
+from graphql.execution.stats import BUCKET_COUNT, FieldStatsCollector
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+from .utils import resolved
+
+
+def resolve_avatar(user, info):
+    raise Exception("No avatar for {}".format(user["name"]))
+
+
+UserType = GraphQLObjectType(
+    "User",
+    fields={
+        "id": GraphQLField(GraphQLInt),
+        "name": GraphQLField(
+            GraphQLString, resolver=lambda user, info: resolved(user["name"])
+        ),
+        "avatar": GraphQLField(GraphQLString, resolver=resolve_avatar),
+    },
+)
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        fields={
+            "users": GraphQLField(
+                GraphQLList(UserType),
+                resolver=lambda *_: [
+                    {"id": 1, "name": "Ann"},
+                    {"id": 2, "name": "Bob"},
+                ],
+            )
+        },
+    )
+)
+
+document = parse("{ users { id name avatar } }")
+
+
+def test_aggregates_field_stats_across_executions():
+    field_stats = FieldStatsCollector()
+    for _ in range(3):
+        result = execute(schema, document, field_stats=field_stats)
+        assert len(result.errors) == 2
+
+    snapshot = field_stats.snapshot()
+    assert sorted(snapshot) == [
+        ("Query", "users"),
+        ("User", "avatar"),
+        ("User", "id"),
+        ("User", "name"),
+    ]
+    assert snapshot[("Query", "users")]["count"] == 3
+    assert snapshot[("Query", "users")]["errors"] == 0
+    assert snapshot[("User", "name")]["count"] == 6
+    assert snapshot[("User", "avatar")]["errors"] == 6
+    for field_stats_ in snapshot.values():
+        histogram = field_stats_["histogram"]
+        assert len(histogram) == BUCKET_COUNT
+        assert sum(histogram) == field_stats_["count"]
+        assert field_stats_["total_ns"] >= 0
+
+
+def test_merges_stats_of_threads():
+    field_stats = FieldStatsCollector()
+
+    def run():
+        graphql(schema, "{ users { id } }", field_stats=field_stats)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    run()
+
+    snapshot = field_stats.snapshot()
+    assert snapshot[("Query", "users")]["count"] == 5
+    assert snapshot[("User", "id")]["count"] == 10
+
+
+def test_resets_stats():
+    field_stats = FieldStatsCollector()
+    execute(schema, document, field_stats=field_stats)
+    assert field_stats.snapshot(reset=True)[("Query", "users")]["count"] == 1
+    assert field_stats.snapshot() == {}
+
+    execute(schema, document, field_stats=field_stats)
+    field_stats.reset()
+    assert field_stats.snapshot() == {}
+    execute(schema, document, field_stats=field_stats)
+    assert field_stats.snapshot()[("Query", "users")]["count"] == 1
+
+
+def test_buckets_durations_on_a_log_scale():
+    field_stats = FieldStatsCollector()
+    for duration_ns in [0, 999, 1000, 3999, 4000, 10 ** 15]:
+        field_stats.record("Query", "field", duration_ns)
+
+    histogram = field_stats.snapshot()[("Query", "field")]["histogram"]
+    assert histogram[:4] == [2, 1, 1, 1]
+    assert histogram[-1] == 1
+    bounds = FieldStatsCollector.bucket_bounds()
+    assert bounds[:3] == [1000, 2000, 4000]
+    assert len(bounds) == BUCKET_COUNT - 1
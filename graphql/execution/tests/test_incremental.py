@@ -0,0 +1,227 @@
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from graphql.execution import (
+    ExecutionPatchResult,
+    ExecutionResult,
+    IncrementalExecutionResult,
+    execute,
+)
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLDeferDirective,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLStreamDirective,
+    GraphQLString,
+    specified_directives,
+)
+from graphql.validation import validate
+
+
+def resolve_fail(*_):
+    raise Exception("Fail")
+
+
+Friend = GraphQLObjectType(
+    "Friend",
+    {
+        "id": GraphQLField(GraphQLInt),
+        "name": GraphQLField(GraphQLString),
+        "fail": GraphQLField(GraphQLNonNull(GraphQLString), resolver=resolve_fail),
+    },
+)
+
+Hero = GraphQLObjectType(
+    "Hero",
+    lambda: {
+        "id": GraphQLField(GraphQLInt),
+        "name": GraphQLField(GraphQLString),
+        "friends": GraphQLField(GraphQLList(Friend)),
+    },
+)
+
+Query = GraphQLObjectType(
+    "Query",
+    {
+        "hero": GraphQLField(Hero),
+        "numbers": GraphQLField(GraphQLList(GraphQLInt)),
+    },
+)
+
+schema = GraphQLSchema(
+    Query,
+    directives=specified_directives + [GraphQLDeferDirective, GraphQLStreamDirective],
+)
+
+root = {
+    "hero": {
+        "id": 1,
+        "name": "Luke",
+        "friends": [
+            {"id": 2, "name": "Han"},
+            {"id": 3, "name": "Leia"},
+            {"id": 4, "name": "C-3PO"},
+        ],
+    },
+}
+
+
+def run(query, **kwargs):
+    document = parse(query)
+    assert not validate(schema, document)
+    root_value = dict(root, numbers=(n for n in range(4)))
+    result = execute(schema, document, root_value=root_value, **kwargs)
+    patches = []
+    if isinstance(result, IncrementalExecutionResult):
+        patches = [patch.to_dict() for patch in result.subsequent_results]
+    return result, patches
+
+
+def test_defer_inline_fragment():
+    # type: () -> None
+    result, patches = run("{ hero { id ... @defer(label: \"D\") { name } } }")
+    assert isinstance(result, IncrementalExecutionResult)
+    assert result.to_dict() == {"data": {"hero": {"id": 1}}, "hasNext": True}
+    assert patches == [
+        {"data": {"name": "Luke"}, "path": ["hero"], "label": "D", "hasNext": False}
+    ]
+
+
+def test_defer_fragment_spread_on_root():
+    # type: () -> None
+    result, patches = run(
+        """
+        { ...HeroFragment @defer }
+        fragment HeroFragment on Query { hero { name } }
+        """
+    )
+    assert result.data == {}
+    assert patches == [
+        {"data": {"hero": {"name": "Luke"}}, "path": [], "hasNext": False}
+    ]
+
+
+def test_nested_defer():
+    # type: () -> None
+    result, patches = run(
+        "{ hero { ... @defer { id friends { ... on Friend @defer { name } } } } }"
+    )
+    assert result.data == {"hero": {}}
+    assert patches == [
+        {
+            "data": {"id": 1, "friends": [{}, {}, {}]},
+            "path": ["hero"],
+            "hasNext": True,
+        },
+        {"data": {"name": "Han"}, "path": ["hero", "friends", 0], "hasNext": True},
+        {"data": {"name": "Leia"}, "path": ["hero", "friends", 1], "hasNext": True},
+        {"data": {"name": "C-3PO"}, "path": ["hero", "friends", 2], "hasNext": False},
+    ]
+
+
+def test_defer_disabled_with_if():
+    # type: () -> None
+    result, patches = run(
+        "query Q($d: Boolean) { hero { ... @defer(if: $d) { name } } }",
+        variable_values={"d": False},
+    )
+    assert type(result) is ExecutionResult
+    assert result.data == {"hero": {"name": "Luke"}}
+
+
+def test_defer_errors_are_reported_in_patch():
+    # type: () -> None
+    result, patches = run("{ hero { friends { id ... on Friend @defer { fail } } } }")
+    assert not result.errors
+    assert len(patches) == 3
+    assert patches[0]["data"] is None
+    assert patches[0]["path"] == ["hero", "friends", 0]
+    assert patches[0]["errors"][0]["message"] == "Fail"
+
+
+def test_stream_list():
+    # type: () -> None
+    result, patches = run("{ numbers @stream(initialCount: 2) }")
+    assert result.data == {"numbers": [0, 1]}
+    assert patches == [
+        {"data": 2, "path": ["numbers", 2], "hasNext": True},
+        {"data": 3, "path": ["numbers", 3], "hasNext": False},
+    ]
+
+
+def test_stream_negative_initial_count():
+    # type: () -> None
+    result, patches = run("{ numbers @stream(initialCount: -1) }")
+    assert result.data == {"numbers": None}
+    assert result.errors[0].message == "initialCount must be a non-negative integer"
+
+
+def test_loaders_are_cleared_after_the_last_payload():
+    # type: () -> None
+    registries = []
+
+    def capture_loaders(next, root, info, **args):
+        info.loaders["numbers"]
+        registries.append(info.loaders)
+        return next(root, info, **args)
+
+    result = execute(
+        schema,
+        parse("{ numbers @stream(initialCount: 2) }"),
+        root_value={"numbers": iter(range(4))},
+        middleware=[capture_loaders],
+        loaders={"numbers": lambda context: DataLoader(Promise.resolve)},
+    )
+    registry = registries[0]
+    assert "numbers" in registry._loaders
+    patches = iter(result.subsequent_results)
+    next(patches)
+    assert "numbers" in registry._loaders
+    assert not next(patches).has_next
+    assert not registry._loaders
+
+
+def test_stream_objects_with_defer():
+    # type: () -> None
+    result, patches = run(
+        '{ hero { friends @stream(initialCount: 1, label: "S") { id ... on Friend @defer { name } } } }'
+    )
+    assert result.data == {"hero": {"friends": [{"id": 2}]}}
+    assert [(p["path"], p["data"]) for p in patches] == [
+        (["hero", "friends", 0], {"name": "Han"}),
+        (["hero", "friends", 1], {"id": 3}),
+        (["hero", "friends", 2], {"id": 4}),
+        (["hero", "friends", 1], {"name": "Leia"}),
+        (["hero", "friends", 2], {"name": "C-3PO"}),
+    ]
+    assert patches[1]["label"] == "S"
+    assert [p["hasNext"] for p in patches] == [True, True, True, True, False]
+
+
+def test_stream_everything_in_initial_payload():
+    # type: () -> None
+    result, patches = run("{ numbers @stream(initialCount: 10) }")
+    assert type(result) is ExecutionResult
+    assert result.data == {"numbers": [0, 1, 2, 3]}
+
+
+def test_directives_ignored_when_not_in_schema():
+    # type: () -> None
+    plain_schema = GraphQLSchema(Query)
+    result = execute(plain_schema, parse("{ hero { id } }"), root_value=root)
+    assert type(result) is ExecutionResult
+
+
+def test_patch_result_equality():
+    # type: () -> None
+    assert ExecutionPatchResult(data=1, path=["a"]) == ExecutionPatchResult(
+        data=1, path=["a"]
+    )
+    assert ExecutionPatchResult(data=1, path=["a"]) != ExecutionPatchResult(
+        data=1, path=["b"]
+    )
@@ -6,7 +6,12 @@ import json
 from pytest import raises
 from graphql.error import GraphQLError
 from graphql.execution import MiddlewareManager, execute
-from graphql.execution.middleware import get_middleware_resolvers, middleware_chain
+from graphql.execution.middleware import (
+    ScopedMiddleware,
+    get_middleware_resolvers,
+    has_resolver,
+    middleware_chain,
+)
 from graphql.language.parser import parse
 from graphql.type import (
     GraphQLArgument,
@@ -185,6 +190,64 @@ def test_middleware_chain(capsys):
     assert_stdout(capsys, expected_stdout)
 
 
+def test_scoped_middleware_only_wraps_the_fields_it_applies_to():
+    # type: () -> None
+    ItemType = GraphQLObjectType(
+        "Item",
+        {
+            "id": GraphQLField(GraphQLInt),
+            "name": GraphQLField(GraphQLString, resolver=lambda item, info: "name"),
+        },
+    )
+    QueryType = GraphQLObjectType(
+        "Query",
+        {
+            "items": GraphQLField(
+                GraphQLList(ItemType), resolver=lambda *_: [{"id": 1}, {"id": 2}]
+            ),
+            "hidden": GraphQLField(GraphQLString, resolver=lambda *_: "hidden"),
+        },
+    )
+    schema = GraphQLSchema(QueryType)
+    resolved = []
+    scopes = []
+
+    def log_middleware(next, root, info, **args):
+        resolved.append(info.field_name)
+        return next(root, info, **args)
+
+    class UpperMiddleware(object):
+        def applies_to(self, parent_type, field_name, field_def, is_default_resolver):
+            scopes.append((parent_type.name, field_name, is_default_resolver))
+            return field_name == "hidden"
+
+        def resolve(self, next, root, info, **args):
+            return next(root, info, **args).upper()
+
+    result = execute(
+        schema,
+        parse("{ items { id name } hidden }"),
+        middleware=MiddlewareManager(
+            ScopedMiddleware(log_middleware, has_resolver),
+            UpperMiddleware(),
+            wrap_in_promise=False,
+        ),
+    )
+    assert not result.errors
+    assert result.data == {
+        "items": [{"id": 1, "name": "name"}, {"id": 2, "name": "name"}],
+        "hidden": "HIDDEN",
+    }
+    assert resolved == ["items", "name", "name", "hidden"]
+    # Scopes are evaluated once per field
+    assert sorted(scopes) == [
+        ("Item", "id", True),
+        ("Item", "name", False),
+        ("Query", "hidden", False),
+        ("Query", "items", False),
+    ]
+
+
 def assert_stdout(capsys, expected_stdout):
     # type: (Any, str) -> None
     captured = capsys.readouterr()
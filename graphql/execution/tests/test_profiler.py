@@ -0,0 +1,86 @@
+# type: ignore
+from graphql import graphql
+from graphql.execution import execute
+from graphql.execution.profiler import SamplingProfiler
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+from .utils import resolved
+
+BookType = GraphQLObjectType(
+    "Book",
+    fields={
+        "id": GraphQLField(GraphQLInt),
+        "title": GraphQLField(
+            GraphQLString, resolver=lambda book, info: resolved(book["title"])
+        ),
+    },
+)
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        fields={
+            "books": GraphQLField(
+                GraphQLList(BookType),
+                resolver=lambda *_: [{"id": 1, "title": "A"}, {"id": 2, "title": "B"}],
+            )
+        },
+    )
+)
+
+document = parse("{ books { id title } }")
+
+
+def get_stacks(profiler):
+    return dict(line.rsplit(" ", 1) for line in profiler.folded().splitlines())
+
+
+def test_profiles_fields_in_folded_stacks():
+    profiler = SamplingProfiler(sample_rate=1)
+    result = execute(schema, document, profiler=profiler)
+    assert not result.errors
+    assert result.data == {"books": [{"id": 1, "title": "A"}, {"id": 2, "title": "B"}]}
+
+    stacks = get_stacks(profiler)
+    # Titles are resolved with settled promises, which are never waited for
+    assert sorted(stacks) == [
+        "books;complete",
+        "books;id;complete",
+        "books;id;resolve",
+        "books;resolve",
+        "books;title;complete",
+        "books;title;resolve",
+    ]
+    for duration_ns in stacks.values():
+        assert int(duration_ns) >= 0
+
+
+def test_samples_one_execution_out_of_sample_rate():
+    profiler = SamplingProfiler(sample_rate=3)
+    for _ in range(2):
+        execute(schema, parse("{ books { id } }"), profiler=profiler)
+    assert profiler.folded() == ""
+    execute(schema, parse("{ books { id } }"), profiler=profiler, profile=True)
+    assert "books;id;resolve" in get_stacks(profiler)
+    execute(schema, document, profiler=profiler)
+    assert "books;title;resolve" in get_stacks(profiler)
+    execute(schema, parse("{ books { id title other: title } }"), profiler=profiler)
+    assert "books;other;resolve" not in get_stacks(profiler)
+
+    profiler.reset()
+    assert profiler.folded() == ""
+
+
+def test_profiles_through_graphql():
+    profiler = SamplingProfiler(sample_rate=1)
+    result = graphql(schema, "{ books { id } }", profiler=profiler)
+    assert not result.errors
+    assert "books;resolve" in get_stacks(profiler)
@@ -0,0 +1,154 @@
+from graphql.execution import execute
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLInputObjectField,
+    GraphQLInputObjectType,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+
+def get_schema(calls):
+    def resolve_user(root, info, id, filter=None):
+        calls.append((info.field_name, id))
+        return {"id": id, "name": "User {}".format(id)}
+
+    def resolve_counter(root, info):
+        calls.append((info.field_name, None))
+        return len(calls)
+
+    User = GraphQLObjectType(
+        "User", {"id": GraphQLField(GraphQLInt), "name": GraphQLField(GraphQLString)}
+    )
+    Filter = GraphQLInputObjectType(
+        "Filter", {"tags": GraphQLInputObjectField(GraphQLList(GraphQLString))}
+    )
+    user_args = {
+        "id": GraphQLArgument(GraphQLInt),
+        "filter": GraphQLArgument(Filter),
+    }
+    Query = GraphQLObjectType(
+        "Query",
+        {
+            "user": GraphQLField(User, args=user_args, resolver=resolve_user),
+            "counter": GraphQLField(
+                GraphQLInt, resolver=resolve_counter, memoize=False
+            ),
+        },
+    )
+    Mutation = GraphQLObjectType(
+        "Mutation",
+        {"user": GraphQLField(User, args=user_args, resolver=resolve_user)},
+    )
+    return GraphQLSchema(Query, Mutation)
+
+
+def test_duplicate_calls_are_memoized():
+    # type: () -> None
+    calls = []  # type: list
+    schema = get_schema(calls)
+    query = """
+        query Q($id: Int, $tags: [String]) {
+            a: user(id: 1) { id }
+            b: user(id: 1) { name }
+            c: user(id: 2) { id }
+            d: user(id: $id) { id }
+            e: user(id: 2, filter: {tags: $tags}) { id }
+            f: user(id: 2, filter: {tags: ["x"]}) { id }
+        }
+    """
+    result = execute(
+        schema,
+        parse(query),
+        variable_values={"id": 1, "tags": ["x"]},
+        memoize_resolvers=True,
+    )
+    assert not result.errors
+    assert result.data == {
+        "a": {"id": 1},
+        "b": {"name": "User 1"},
+        "c": {"id": 2},
+        "d": {"id": 1},
+        "e": {"id": 2},
+        "f": {"id": 2},
+    }
+    assert calls == [("user", 1), ("user", 2), ("user", 2)]
+
+
+def test_memoization_is_opt_in():
+    # type: () -> None
+    calls = []  # type: list
+    schema = get_schema(calls)
+    execute(schema, parse("{ a: user(id: 1) { id } b: user(id: 1) { id } }"))
+    assert calls == [("user", 1), ("user", 1)]
+
+
+def test_memoization_is_per_execution():
+    # type: () -> None
+    calls = []  # type: list
+    schema = get_schema(calls)
+    document = parse("{ user(id: 1) { id } }")
+    execute(schema, document, memoize_resolvers=True)
+    execute(schema, document, memoize_resolvers=True)
+    assert calls == [("user", 1), ("user", 1)]
+
+
+def test_fields_can_opt_out_of_memoization():
+    # type: () -> None
+    calls = []  # type: list
+    schema = get_schema(calls)
+    result = execute(
+        schema, parse("{ a: counter b: counter }"), memoize_resolvers=True
+    )
+    assert result.data == {"a": 1, "b": 2}
+
+
+def test_root_mutation_fields_are_not_memoized():
+    # type: () -> None
+    calls = []  # type: list
+    schema = get_schema(calls)
+    execute(
+        schema,
+        parse("mutation { a: user(id: 1) { id } b: user(id: 1) { id } }"),
+        memoize_resolvers=True,
+    )
+    assert calls == [("user", 1), ("user", 1)]
+
+
+def test_memoized_iterators_are_completed_each_time():
+    def resolve_numbers(root, info):
+        for i in range(3):
+            yield i
+
+    def resolve_broken(root, info):
+        yield 0
+        raise Exception("Broken")
+
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "numbers": GraphQLField(
+                    GraphQLList(GraphQLInt), resolver=resolve_numbers
+                ),
+                "broken": GraphQLField(
+                    GraphQLList(GraphQLInt), resolver=resolve_broken
+                ),
+            },
+        )
+    )
+
+    result = execute(
+        schema, parse("{ a: numbers b: numbers }"), memoize_resolvers=True
+    )
+    assert not result.errors
+    assert result.data == {"a": [0, 1, 2], "b": [0, 1, 2]}
+
+    result = execute(schema, parse("{ a: broken b: broken }"), memoize_resolvers=True)
+    assert result.data == {"a": None, "b": None}
+    assert [error.message for error in result.errors] == ["Broken", "Broken"]
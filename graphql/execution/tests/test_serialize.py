@@ -0,0 +1,159 @@
+import io
+import json
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python < 3.3
+    from collections import Mapping
+
+from graphql.error import GraphQLError
+from graphql.execution import (
+    ExecutionPatchResult,
+    ExecutionResult,
+    IncrementalExecutionResult,
+    execute,
+)
+from graphql.execution.serialize import (
+    iter_execution_result,
+    iter_json,
+    write_execution_result,
+)
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+
+def test_iter_json_matches_json_dumps():
+    # type: () -> None
+    value = {
+        "a": [1, 2.5, None, True, {"b": "cé\n"}],
+        "d": {},
+        "e": [],
+        "f": [[[]]],
+    }
+    assert "".join(iter_json(value)) == json.dumps(value)
+    assert "".join(iter_json(value, separators=(",", ":"))) == json.dumps(
+        value, separators=(",", ":")
+    )
+
+
+def test_iter_json_converts_keys_like_json_dumps():
+    # type: () -> None
+    value = {True: 1, False: 2, None: 3, 4: 5, 1.5: 6, "s": 7}
+    assert "".join(iter_json(value)) == json.dumps(value)
+
+
+def test_iter_json_handles_deep_nesting():
+    # type: () -> None
+    value = []  # type: list
+    for _ in range(5000):
+        value = [value]
+    assert "".join(iter_json(value)) == "[" * 5001 + "]" * 5001
+
+
+def test_iter_json_release_empties_containers():
+    # type: () -> None
+    items = [1, 2, 3]
+    inner = {"x": items}
+    value = {"a": inner, "b": [[4]]}
+    expected = json.dumps(value)
+    assert "".join(iter_json(value, release=True)) == expected
+    assert value == {}
+    assert inner == {}
+    assert items == []
+
+
+def test_iter_json_release_keeps_read_only_containers():
+    # type: () -> None
+    class ReadOnlyMapping(Mapping):
+        def __init__(self, data):
+            self.data = data
+
+        def __getitem__(self, key):
+            return self.data[key]
+
+        def __iter__(self):
+            return iter(self.data)
+
+        def __len__(self):
+            return len(self.data)
+
+    mapping = ReadOnlyMapping({"a": 1})
+    value = [mapping, (2, 3)]
+    assert "".join(iter_json(value, release=True)) == '[{"a": 1}, [2, 3]]'
+    assert dict(mapping) == {"a": 1}
+
+
+def test_iter_execution_result_matches_to_dict():
+    # type: () -> None
+    result = ExecutionResult(
+        data={"a": 1, "b": [{"c": "d"}]}, errors=[GraphQLError("Oops", path=["a"])]
+    )
+    serialized = "".join(iter_execution_result(result))
+    assert serialized == json.dumps(result.to_dict())
+
+
+def test_iter_execution_result_matches_to_dict_of_incremental_results():
+    # type: () -> None
+    results = [
+        IncrementalExecutionResult(data={"a": 1}, subsequent_results=iter([])),
+        ExecutionPatchResult(data={"b": 2}, path=["a", 0], label="l", has_next=True),
+    ]
+    for result in results:
+        expected = json.dumps(result.to_dict())
+        assert "".join(iter_execution_result(result)) == expected
+        assert "".join(iter_execution_result(result, release=True)) == expected
+        assert result.data is None
+
+
+def test_iter_execution_result_invalid_has_no_data():
+    # type: () -> None
+    result = ExecutionResult(errors=[GraphQLError("Bad")], invalid=True)
+    assert json.loads("".join(iter_execution_result(result))) == {
+        "errors": [{"message": "Bad"}]
+    }
+
+
+def test_iter_execution_result_chunks_and_encoding():
+    # type: () -> None
+    result = ExecutionResult(data={"items": list(range(1000))})
+    chunks = list(iter_execution_result(result, chunk_size=100, encoding="utf-8"))
+    assert len(chunks) > 1
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert json.loads(b"".join(chunks).decode("utf-8")) == {
+        "data": {"items": list(range(1000))}
+    }
+
+
+def test_write_execution_result_from_execute():
+    # type: () -> None
+    Item = GraphQLObjectType(
+        "Item",
+        {"id": GraphQLField(GraphQLInt), "name": GraphQLField(GraphQLString)},
+    )
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "items": GraphQLField(
+                    GraphQLList(Item),
+                    resolver=lambda *_: [
+                        {"id": i, "name": "item{}".format(i)} for i in range(50)
+                    ],
+                )
+            },
+        )
+    )
+    result = execute(schema, parse("{ items { id name } }"))
+    expected = json.dumps(result.to_dict(), separators=(",", ":"))
+
+    fp = io.StringIO()
+    write_execution_result(result, fp, separators=(",", ":"), release=True)
+    assert fp.getvalue() == expected
+    assert result.data is None
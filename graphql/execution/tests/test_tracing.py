@@ -0,0 +1,163 @@
+# type: ignore
+from promise import Promise
+
+from graphql import graphql
+from graphql.execution import execute
+from graphql.execution.tracing import ExecutionTracer
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLBoolean,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+
+def test_adds_tracing_to_extensions():
+    PostType = GraphQLObjectType(
+        "Post",
+        fields={
+            "id": GraphQLField(GraphQLInt),
+            "title": GraphQLField(
+                GraphQLString,
+                resolver=lambda post, info: Promise.resolve(post["title"]),
+            ),
+        },
+    )
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            fields={
+                "posts": GraphQLField(
+                    GraphQLList(PostType),
+                    resolver=lambda *_: [
+                        {"id": 1, "title": "a"},
+                        {"id": 2, "title": "b"},
+                    ],
+                )
+            },
+        )
+    )
+
+    result = graphql(schema, "{ posts { id title } }", tracing=True)
+    assert not result.errors
+    assert result.data == {
+        "posts": [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]
+    }
+
+    tracing = result.extensions["tracing"]
+    assert tracing["version"] == 1
+    assert tracing["startTime"].endswith("Z")
+    assert tracing["endTime"] >= tracing["startTime"]
+    phases = [tracing[name] for name in ["parsing", "validation", "execution"]]
+    for previous_phase, phase in zip(phases, phases[1:]):
+        assert phase["startOffset"] >= (
+            previous_phase["startOffset"] + previous_phase["duration"]
+        )
+    assert tracing["duration"] >= phases[-1]["startOffset"] + phases[-1]["duration"]
+
+    resolvers = tracing["execution"]["resolvers"]
+    paths = [resolver["path"] for resolver in resolvers]
+    assert sorted(paths, key=lambda path: (len(path), str(path))) == [
+        ["posts"],
+        ["posts", 0, "id"],
+        ["posts", 0, "title"],
+        ["posts", 1, "id"],
+        ["posts", 1, "title"],
+    ]
+    assert resolvers[0] == {
+        "path": ["posts"],
+        "parentType": "Query",
+        "fieldName": "posts",
+        "returnType": "[Post]",
+        "startOffset": resolvers[0]["startOffset"],
+        "duration": resolvers[0]["duration"],
+    }
+    for resolver in resolvers:
+        assert resolver["startOffset"] >= phases[-1]["startOffset"]
+        assert resolver["duration"] >= 0
+
+
+def test_records_resolvers_in_the_given_tracer():
+    QueryType = GraphQLObjectType(
+        "Query",
+        fields={
+            "hello": GraphQLField(GraphQLString, resolver=lambda *_: "world"),
+            "count": GraphQLField(GraphQLInt, resolver=lambda *_: 1),
+        },
+    )
+    tracer = ExecutionTracer()
+    result = execute(GraphQLSchema(QueryType), parse("{ hello count }"), tracing=tracer)
+    assert not result.errors
+    assert tracer.resolver_count == 2
+    assert [record[:4] for record in tracer.resolvers] == [
+        (["hello"], QueryType, "hello", GraphQLString),
+        (["count"], QueryType, "count", GraphQLInt),
+    ]
+
+    tracing = result.extensions["tracing"]
+    assert tracing["parsing"] is None
+    assert tracing["validation"] is None
+    assert len(tracing["execution"]["resolvers"]) == 2
+
+
+def test_records_pending_resolvers_once_resolved():
+    pending = Promise()
+
+    def resolve_settle(*_):
+        pending.do_resolve(42)
+        return True
+
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            fields={
+                "pending": GraphQLField(GraphQLInt, resolver=lambda *_: pending),
+                "settle": GraphQLField(GraphQLBoolean, resolver=resolve_settle),
+            },
+        )
+    )
+    result = graphql(schema, "{ pending settle }", tracing=True)
+    assert result.data == {"pending": 42, "settle": True}
+    resolvers = result.extensions["tracing"]["execution"]["resolvers"]
+    assert [resolver["fieldName"] for resolver in resolvers] == [
+        "settle",
+        "pending",
+    ]
+
+
+def test_records_failing_resolvers():
+    failing_schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            fields={
+                "sync": GraphQLField(GraphQLString, resolver=lambda *_: 1 / 0),
+                "async": GraphQLField(
+                    GraphQLString,
+                    resolver=lambda *_: Promise.reject(Exception("Failed")),
+                ),
+            },
+        )
+    )
+    result = graphql(failing_schema, "{ sync async }", tracing=True)
+    assert len(result.errors) == 2
+    resolvers = result.extensions["tracing"]["execution"]["resolvers"]
+    assert sorted(resolver["fieldName"] for resolver in resolvers) == [
+        "async",
+        "sync",
+    ]
+
+
+def test_does_not_trace_by_default():
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            fields={"hello": GraphQLField(GraphQLString, resolver=lambda *_: "world")},
+        )
+    )
+    result = graphql(schema, "{ hello }")
+    assert not result.errors
+    assert result.extensions == {}
@@ -781,3 +781,163 @@ class TestUsesArgumentDefaultValues:
         """,
             {"data": {"fieldWithDefaultArgumentValue": '"Hello World"'}},
         )
+
+
+def test_reuses_compiled_variables_coercer_for_document():
+    # type: () -> None
+    from graphql.execution.values import _variables_coercers
+
+    ast = parse(
+        """
+        query q($input: TestInputObject) {
+          fieldWithObjectInput(input: $input)
+        }
+    """
+    )
+    result = execute(schema, ast, variable_values={"input": {"a": "foo", "c": "baz"}})
+    assert not result.errors
+    assert json.loads(result.data["fieldWithObjectInput"]) == {"a": "foo", "c": "baz"}
+    coercers = dict(_variables_coercers[ast])
+    assert len(coercers) == 1
+
+    result = execute(schema, ast, variable_values={"input": {"b": "bar", "c": "baz"}})
+    assert not result.errors
+    assert json.loads(result.data["fieldWithObjectInput"]) == {
+        "b": ["bar"],
+        "c": "baz",
+    }
+    assert _variables_coercers[ast] == coercers
+
+    with raises(GraphQLError) as excinfo:
+        execute(schema, ast, variable_values={"input": {"a": "foo", "d": "x"}})
+    assert excinfo.value.message == (
+        'Variable "$input" got invalid value {"a": "foo", "d": "x"}.\n'
+        'In field "c": Expected "String!", found null.\n'
+        'In field "d": Expected type "ComplexScalar", found "x".'
+    )
+
+
+def test_compiled_coercer_supports_recursive_input_types():
+    # type: () -> None
+    from graphql.execution.values import compile_variables_coercer
+
+    Node = GraphQLInputObjectType(
+        "Node",
+        lambda: {
+            "value": GraphQLInputObjectField(GraphQLNonNull(GraphQLString)),
+            "children": GraphQLInputObjectField(GraphQLList(Node)),
+        },
+    )
+    node_schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "tree": GraphQLField(
+                    GraphQLString,
+                    args={"node": GraphQLArgument(Node)},
+                    resolver=input_to_json,
+                )
+            },
+        )
+    )
+    operation = parse("query($node: Node) { tree(node: $node) }").definitions[0]
+    coerce = compile_variables_coercer(node_schema, operation.variable_definitions)
+
+    tree = {"value": "a", "children": [{"value": "b", "children": [{"value": "c"}]}]}
+    assert coerce({"node": tree}) == {
+        "node": {
+            "value": "a",
+            "children": [{"value": "b", "children": [{"value": "c"}]}],
+        }
+    }
+    with raises(GraphQLError) as excinfo:
+        coerce({"node": {"value": "a", "children": [{}]}})
+    assert excinfo.value.message == (
+        'Variable "$node" got invalid value {"children": [{}], "value": "a"}.\n'
+        'In field "children": In element #0: In field "value": '
+        'Expected "String!", found null.'
+    )
+
+
+def test_coerces_literal_arguments_once_per_document():
+    # type: () -> None
+    parsed = []
+
+    def parse_literal(value_ast):
+        parsed.append(value_ast.value)
+        return value_ast.value
+
+    CountingScalar = GraphQLScalarType(
+        name="CountingScalar",
+        serialize=lambda v: v,
+        parse_value=lambda v: v,
+        parse_literal=parse_literal,
+    )
+    counting_schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "field": GraphQLField(
+                    GraphQLString,
+                    args={
+                        "literal": GraphQLArgument(CountingScalar),
+                        "variable": GraphQLArgument(GraphQLString),
+                        "nested": GraphQLArgument(GraphQLList(GraphQLString)),
+                    },
+                    resolver=lambda root, info, **args: stringify(args),
+                )
+            },
+        )
+    )
+    ast = parse(
+        """
+        query q($v: String) {
+          field(literal: "a", variable: $v, nested: ["b", $v])
+        }
+    """
+    )
+
+    for value in ["x", "y"]:
+        result = execute(counting_schema, ast, variable_values={"v": value})
+        assert not result.errors
+        assert json.loads(result.data["field"]) == {
+            "literal": "a",
+            "variable": value,
+            "nested": ["b", value],
+        }
+
+    assert parsed == ["a"]
+
+
+def test_does_not_share_literal_container_arguments_between_executions():
+    # type: () -> None
+    def resolve_field(root, info, **args):
+        result = stringify(args)
+        args["list"].append("mutated")
+        args["input"]["a"] = "mutated"
+        return result
+
+    mutating_schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "field": GraphQLField(
+                    GraphQLString,
+                    args={
+                        "list": GraphQLArgument(GraphQLList(GraphQLString)),
+                        "input": GraphQLArgument(TestInputObject),
+                    },
+                    resolver=resolve_field,
+                )
+            },
+        )
+    )
+    ast = parse('{ field(list: ["a"], input: {a: "a", c: "c"}) }')
+
+    for _ in range(2):
+        result = execute(mutating_schema, ast)
+        assert not result.errors
+        assert json.loads(result.data["field"]) == {
+            "list": ["a"],
+            "input": {"a": "a", "c": "c"},
+        }
@@ -0,0 +1,162 @@
+import time
+
+try:
+    from time import perf_counter_ns as get_time_ns
+except ImportError:  # Python < 3.7
+    from timeit import default_timer
+
+    def get_time_ns():
+        # type: () -> int
+        return int(default_timer() * 1e9)
+
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, Dict, List, Optional, Tuple, Union
+    from ..type.definition import GraphQLObjectType, GraphQLType
+    from .base import ResolveInfo
+
+    ResolverRecord = Tuple[
+        Union[List[Union[int, str]], List[str], None],
+        GraphQLObjectType,
+        str,
+        GraphQLType,
+        int,
+        int,
+    ]
+
+TRACING_VERSION = 1
+
+
+def format_timestamp(timestamp):
+    # type: (float) -> str
+    return "{}.{:03d}Z".format(
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(timestamp)),
+        int(timestamp * 1000) % 1000,
+    )
+
+
+class ExecutionTracer(object):
+    """Records the duration of the parsing, validation and execution phases
+    of a request and of every resolver call, with a monotonic clock in
+    nanoseconds.
+
+    Pass `tracing=True` to `graphql()` or `execute()` to get the trace in the
+    `tracing` key of `ExecutionResult.extensions`, in the shape of the Apollo
+    tracing format. The executor records a tuple of the path, parent type,
+    field name, return type, start and end of every resolver call, the
+    Apollo dicts only being built by `to_dict`.
+    """
+
+    __slots__ = (
+        "start_time",
+        "start_ns",
+        "end_time",
+        "end_ns",
+        "phases",
+        "resolvers",
+    )
+
+    def __init__(self):
+        # type: () -> None
+        self.start_time = time.time()
+        self.start_ns = get_time_ns()
+        self.end_time = None  # type: Optional[float]
+        self.end_ns = None  # type: Optional[int]
+        self.phases = {}  # type: Dict[str, Tuple[int, int]]
+        self.resolvers = []  # type: List[ResolverRecord]
+
+    @property
+    def resolver_count(self):
+        # type: () -> int
+        return len(self.resolvers)
+
+    def record_phase(self, name, start_ns, end_ns=None):
+        # type: (str, int, Optional[int]) -> None
+        """Records a "parsing", "validation" or "execution" phase."""
+        if end_ns is None:
+            end_ns = get_time_ns()
+        self.phases[name] = (start_ns, end_ns)
+
+    def record_resolver(self, info, start_ns, end_ns=None):
+        # type: (ResolveInfo, int, Optional[int]) -> None
+        if end_ns is None:
+            end_ns = get_time_ns()
+        self.resolvers.append(
+            (
+                info.path,
+                info.parent_type,
+                info.field_name,
+                info.return_type,
+                start_ns,
+                end_ns,
+            )
+        )
+
+    def finish(self):
+        # type: () -> int
+        self.end_time = time.time()
+        end_ns = self.end_ns = get_time_ns()
+        return end_ns
+
+    def format_phase(self, name):
+        # type: (str) -> Optional[Dict[str, int]]
+        phase = self.phases.get(name)
+        if phase is None:
+            return None
+        return {
+            "startOffset": phase[0] - self.start_ns,
+            "duration": phase[1] - phase[0],
+        }
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        end_ns = self.end_ns
+        if end_ns is None:
+            end_ns = self.finish()
+        start_ns = self.start_ns
+        execution = self.format_phase("execution") or {}  # type: Dict[str, Any]
+        # Printing wrapping types is slow, print them once per type
+        type_names = {}  # type: Dict[GraphQLType, str]
+        for record in self.resolvers:
+            for type_ in record[1], record[3]:
+                if type_ not in type_names:
+                    type_names[type_] = str(type_)
+        execution["resolvers"] = [
+            {
+                # Paths are built for every field and never modified
+                "path": path,
+                "parentType": type_names[parent_type],
+                "fieldName": field_name,
+                "returnType": type_names[return_type],
+                "startOffset": resolver_start_ns - start_ns,
+                "duration": resolver_end_ns - resolver_start_ns,
+            }
+            for (
+                path,
+                parent_type,
+                field_name,
+                return_type,
+                resolver_start_ns,
+                resolver_end_ns,
+            ) in self.resolvers
+        ]
+        return {
+            "version": TRACING_VERSION,
+            "startTime": format_timestamp(self.start_time),
+            "endTime": format_timestamp(self.end_time),  # type: ignore
+            "duration": end_ns - start_ns,
+            "parsing": self.format_phase("parsing"),
+            "validation": self.format_phase("validation"),
+            "execution": execution,
+        }
+
+
+def get_tracer(tracing):
+    # type: (Union[bool, ExecutionTracer, None]) -> Optional[ExecutionTracer]
+    """Returns the tracer to use given the `tracing` execution option."""
+    if not tracing:
+        return None
+    if isinstance(tracing, ExecutionTracer):
+        return tracing
+    return ExecutionTracer()
@@ -1,19 +1,34 @@
 # -*- coding: utf-8 -*-
 import logging
+from collections import deque
 from traceback import format_exception
+from weakref import WeakKeyDictionary
 
 from ..error import GraphQLError
 from ..language import ast
+from ..language.printer import print_ast
 from ..pyutils.default_ordered_dict import DefaultOrderedDict
 from ..type.definition import GraphQLInterfaceType, GraphQLUnionType
-from ..type.directives import GraphQLIncludeDirective, GraphQLSkipDirective
+from ..type.directives import (
+    GraphQLDeferDirective,
+    GraphQLIncludeDirective,
+    GraphQLSkipDirective,
+    GraphQLStreamDirective,
+)
 from ..type.introspection import (
     SchemaMetaFieldDef,
     TypeMetaFieldDef,
     TypeNameMetaFieldDef,
 )
 from ..utils.type_from_ast import type_from_ast
-from .values import get_argument_values, get_variable_values
+from .error_policy import drop_error_traceback
+from .loaders import LoaderRegistry
+from .values import (
+    compile_argument_values,
+    contains_variable,
+    get_argument_values,
+    get_operation_variable_values,
+)
 
 # Necessary for static type checking
 if False:  # flake8: noqa
@@ -29,11 +44,53 @@ if False:  # flake8: noqa
         Field,
     )
     from .base import ResolveInfo
+    from .error_policy import ErrorPolicy
+    from .profiler import ExecutionProfile
+    from .stats import FieldStatsCollector
+    from .tracing import ExecutionTracer
     from types import TracebackType
-    from typing import Any, List, Dict, Optional, Union, Callable, Set, Tuple
+    from typing import Any, List, Dict, Optional, Union, Callable, Set, Tuple, Deque
 
 logger = logging.getLogger(__name__)
 
+_document_plans = WeakKeyDictionary()  # type: WeakKeyDictionary
+
+
+class DocumentPlan(object):
+    """Data computed from a document which doesn't depend on variable values,
+    shared by every execution of the document.
+
+    Directive lists are keyed by id and stored next to their conditions, so
+    an entry is only reused for the very list it was computed for."""
+
+    __slots__ = (
+        "argument_values",
+        "include_conditions",
+        "sub_fields",
+        "introspection_keys",
+    )
+
+    def __init__(self):
+        # type: () -> None
+        self.argument_values = (
+            {}
+        )  # type: Dict[Tuple[GraphQLField, Field], Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]]
+        self.include_conditions = (
+            {}
+        )  # type: Dict[int, Tuple[List[Directive], Union[bool, Callable[[Optional[Dict[str, Any]]], bool]]]]
+        self.sub_fields = (
+            {}
+        )  # type: Dict[Tuple[GraphQLSchema, GraphQLObjectType, Tuple[Field, ...], bool], Optional[Tuple[DefaultOrderedDict, Optional[List[DeferredFragment]]]]]
+        self.introspection_keys = {}  # type: Dict[Field, Optional[Tuple]]
+
+
+def get_document_plan(document_ast):
+    # type: (Document) -> DocumentPlan
+    plan = _document_plans.get(document_ast)
+    if plan is None:
+        plan = _document_plans[document_ast] = DocumentPlan()
+    return plan
+
 
 class ExecutionContext(object):
     """Data that must be available at all points during query execution.
@@ -50,10 +107,30 @@ class ExecutionContext(object):
         "errors",
         "context_value",
         "argument_values_cache",
+        "document_plan",
+        "_include_cache",
+        "resolver_cache",
+        "_argument_keys_cache",
         "executor",
         "middleware",
         "allow_subscriptions",
+        "loaders",
+        "subsequent_jobs",
         "_subfields_cache",
+        "_deferred_cache",
+        "_stream_cache",
+        "tracer",
+        "field_stats",
+        "execution_profile",
+        "time_resolvers",
+        "only_trace_resolvers",
+        "error_policy",
+        "max_errors",
+        "abort_on_error_count",
+        "error_count",
+        "omitted_error_count",
+        "delivered_error_count",
+        "aborted",
     )
 
     def __init__(
@@ -67,6 +144,14 @@ class ExecutionContext(object):
         executor,  # type: Any
         middleware,  # type: Optional[Any]
         allow_subscriptions,  # type: bool
+        loaders=None,  # type: Optional[Dict[Any, Callable]]
+        memoize_resolvers=False,  # type: bool
+        tracer=None,  # type: Optional[ExecutionTracer]
+        field_stats=None,  # type: Optional[FieldStatsCollector]
+        execution_profile=None,  # type: Optional[ExecutionProfile]
+        error_policy=None,  # type: Optional[ErrorPolicy]
+        max_errors=None,  # type: Optional[int]
+        abort_on_error_count=None,  # type: Optional[int]
     ):
         # type: (...) -> None
         """Constructs a ExecutionContext object from the arguments passed
@@ -110,8 +195,8 @@ class ExecutionContext(object):
             else:
                 raise GraphQLError("Must provide an operation.")
 
-        variable_values = get_variable_values(
-            schema, operation.variable_definitions or [], variable_values
+        variable_values = get_operation_variable_values(
+            schema, document_ast, operation, variable_values
         )
 
         self.schema = schema
@@ -124,56 +209,224 @@ class ExecutionContext(object):
         self.argument_values_cache = (
             {}
         )  # type: Dict[Tuple[GraphQLField, Field], Dict[str, Any]]
+        self.document_plan = get_document_plan(document_ast)
+        self._include_cache = {}  # type: Dict[int, bool]
+        self.resolver_cache = (
+            {} if memoize_resolvers else None
+        )  # type: Optional[Dict[Tuple[GraphQLField, int, Any], Tuple[Any, Any]]]
+        self._argument_keys_cache = (
+            {}
+        )  # type: Dict[Tuple[GraphQLField, Field], Optional[Tuple]]
         self.executor = executor
         self.middleware = middleware
         self.allow_subscriptions = allow_subscriptions
+        loader_factories = schema.get_loaders()
+        if loaders:
+            loader_factories = dict(loader_factories, **loaders)
+        self.loaders = (
+            LoaderRegistry(loader_factories, context_value, executor)
+            if loader_factories
+            else None
+        )  # type: Optional[LoaderRegistry]
+        # Incremental delivery is only enabled when the schema declares
+        # the @defer or @stream directives.
+        if schema.get_directive(GraphQLDeferDirective.name) or schema.get_directive(
+            GraphQLStreamDirective.name
+        ):
+            self.subsequent_jobs = deque()  # type: Optional[Deque[Any]]
+        else:
+            self.subsequent_jobs = None
         self._subfields_cache = (
             {}
         )  # type: Dict[Tuple[GraphQLObjectType, Tuple[Field, ...]], DefaultOrderedDict]
-
-    def get_field_resolver(self, field_resolver):
-        # type: (Callable) -> Callable
+        self._deferred_cache = (
+            {}
+        )  # type: Dict[Tuple[GraphQLObjectType, Tuple[Field, ...]], List[DeferredFragment]]
+        self._stream_cache = {}  # type: Dict[Field, Optional[Dict[str, Any]]]
+        self.tracer = tracer
+        self.field_stats = field_stats
+        self.execution_profile = execution_profile
+        self.time_resolvers = (
+            tracer is not None
+            or field_stats is not None
+            or execution_profile is not None
+        )
+        self.only_trace_resolvers = (
+            tracer is not None and field_stats is None and execution_profile is None
+        )
+        self.error_policy = error_policy
+        self.max_errors = max_errors
+        self.abort_on_error_count = abort_on_error_count
+        self.error_count = 0
+        self.omitted_error_count = 0
+        # Errors of the payloads already delivered, which count towards
+        # max_errors like the ones of the current payload
+        self.delivered_error_count = 0
+        self.aborted = False
+
+    def get_field_resolver(
+        self,
+        field_resolver,  # type: Callable
+        parent_type=None,  # type: Optional[GraphQLObjectType]
+        field_name=None,  # type: Optional[str]
+        field_def=None,  # type: Optional[GraphQLField]
+    ):
+        # type: (...) -> Callable
         if not self.middleware:
             return field_resolver
-        return self.middleware.get_field_resolver(field_resolver)
+        if field_def is None:
+            return self.middleware.get_field_resolver(field_resolver)
+        return self.middleware.get_resolver_for_field(
+            field_resolver, parent_type, field_name, field_def
+        )
 
     def get_argument_values(self, field_def, field_ast):
         # type: (GraphQLField, Field) -> Dict[str, Any]
         k = field_def, field_ast
         if k not in self.argument_values_cache:
-            self.argument_values_cache[k] = get_argument_values(
-                field_def.args, field_ast.arguments, self.variable_values
-            )
+            argument_values = self.document_plan.argument_values.get(k)
+            if argument_values is None:
+                try:
+                    argument_values = compile_argument_values(
+                        field_def.args, field_ast.arguments
+                    )
+                except GraphQLError:
+                    # Raise the first error in arguments order, which may
+                    # come from an argument depending on variables.
+                    return get_argument_values(
+                        field_def.args, field_ast.arguments, self.variable_values
+                    )
+                self.document_plan.argument_values[k] = argument_values
+            self.argument_values_cache[k] = argument_values(self.variable_values)
 
         return self.argument_values_cache[k]
 
-    def report_error(self, error, traceback=None):
-        # type: (Exception, Optional[TracebackType]) -> None
-        exception = format_exception(
-            type(error), error, getattr(error, "stack", None) or traceback
+    def get_resolver_cache_key(self, field_def, field_ast, source):
+        # type: (GraphQLField, Field, Any) -> Optional[Tuple[GraphQLField, int, Any]]
+        """Returns the key under which the result of resolving `field_def` on
+        `source` with the arguments of `field_ast` is memoized, or None if
+        the arguments can't be used as a key."""
+        k = field_def, field_ast
+        if k not in self._argument_keys_cache:
+            self._argument_keys_cache[k] = freeze_argument_values(
+                self.get_argument_values(field_def, field_ast)
+            )
+        args_key = self._argument_keys_cache[k]
+        if args_key is None:
+            return None
+        return field_def, id(source), args_key
+
+    def report_error(self, error, traceback=None, info=None):
+        # type: (Exception, Optional[TracebackType], Optional[ResolveInfo]) -> None
+        self.error_count += 1
+        # Errors of the fields skipped after aborting are omitted too
+        omitted = self.aborted or (
+            self.max_errors is not None
+            and self.delivered_error_count + len(self.errors) >= self.max_errors
         )
-        logger.error("".join(exception))
+        if (
+            self.abort_on_error_count is not None
+            and self.error_count >= self.abort_on_error_count
+        ):
+            self.aborted = True
+        if omitted:
+            self.omitted_error_count += 1
+            drop_error_traceback(error)
+            return
+        if self.error_policy is not None:
+            self.error_policy.report_error(self.errors, error, traceback, info)
+            return
+        if logger.isEnabledFor(logging.ERROR):
+            exception = format_exception(
+                type(error), error, getattr(error, "stack", None) or traceback
+            )
+            logger.error("".join(exception))
         self.errors.append(error)
 
     def get_sub_fields(self, return_type, field_asts):
         # type: (GraphQLObjectType, List[Field]) -> DefaultOrderedDict
         k = return_type, tuple(field_asts)
         if k not in self._subfields_cache:
-            subfield_asts = DefaultOrderedDict(list)
-            visited_fragment_names = set()  # type: Set[str]
-            for field_ast in field_asts:
-                selection_set = field_ast.selection_set
-                if selection_set:
-                    subfield_asts = collect_fields(
-                        self,
-                        return_type,
-                        selection_set,
-                        subfield_asts,
-                        visited_fragment_names,
+            # Unless they depend on variables, the fields are collected once
+            # for every execution of the document.
+            plan_key = (
+                self.schema,
+                return_type,
+                k[1],
+                self.subsequent_jobs is not None,
+            )
+            sub_fields = self.document_plan.sub_fields.get(plan_key)
+            if sub_fields is None:
+                subfield_asts = DefaultOrderedDict(list)
+                visited_fragment_names = set()  # type: Set[str]
+                deferred = (
+                    [] if self.subsequent_jobs is not None else None
+                )  # type: Optional[List[DeferredFragment]]
+                for field_ast in field_asts:
+                    selection_set = field_ast.selection_set
+                    if selection_set:
+                        subfield_asts = collect_fields(
+                            self,
+                            return_type,
+                            selection_set,
+                            subfield_asts,
+                            visited_fragment_names,
+                            deferred,
+                        )
+                sub_fields = subfield_asts, deferred
+                if plan_key not in self.document_plan.sub_fields:
+                    self.document_plan.sub_fields[plan_key] = (
+                        None
+                        if fields_depend_on_variables(self.fragments, field_asts)
+                        else sub_fields
                     )
+            subfield_asts, deferred = sub_fields
             self._subfields_cache[k] = subfield_asts
+            if deferred:
+                self._deferred_cache[k] = deferred
         return self._subfields_cache[k]
 
+    def get_deferred_fragments(self, return_type, field_asts):
+        # type: (GraphQLObjectType, List[Field]) -> List[DeferredFragment]
+        """Returns the fragments under the given fields that were marked with
+        @defer, and thus left out of `get_sub_fields`."""
+        if self.subsequent_jobs is None:
+            return []
+        self.get_sub_fields(return_type, field_asts)
+        return self._deferred_cache.get((return_type, tuple(field_asts)), [])
+
+    def get_introspection_key(self, field_ast):
+        # type: (Field) -> Optional[Tuple]
+        """Returns the key of the result of a root introspection field in the
+        schema introspection cache, or None if it can't be cached."""
+        introspection_keys = self.document_plan.introspection_keys
+        if field_ast not in introspection_keys:
+            introspection_keys[field_ast] = get_introspection_key(
+                field_ast, self.fragments
+            )
+        return introspection_keys[field_ast]
+
+    def get_stream_values(self, field_ast):
+        # type: (Field) -> Optional[Dict[str, Any]]
+        """Returns the @stream arguments of a field, or None if the field
+        is not streamed in this execution."""
+        if self.subsequent_jobs is None or not field_ast.directives:
+            return None
+        if field_ast not in self._stream_cache:
+            self._stream_cache[field_ast] = get_incremental_directive_values(
+                self, GraphQLStreamDirective, field_ast.directives
+            )
+        return self._stream_cache[field_ast]
+
+
+class DeferredFragment(object):
+    __slots__ = "label", "selection_set"
+
+    def __init__(self, label, selection_set):
+        # type: (Optional[str], SelectionSet) -> None
+        self.label = label
+        self.selection_set = selection_set
+
 
 class SubscriberExecutionContext(object):
     __slots__ = "exe_context", "errors"
@@ -227,6 +480,7 @@ def collect_fields(
     selection_set,  # type: SelectionSet
     fields,  # type: DefaultOrderedDict
     prev_fragment_names,  # type: Set[str]
+    deferred=None,  # type: Optional[List[DeferredFragment]]
 ):
     # type: (...) -> DefaultOrderedDict
     """
@@ -236,6 +490,9 @@ def collect_fields(
     collect_fields requires the "runtime type" of an object. For a field which
     returns and Interface or Union type, the "runtime type" will be the actual
     Object type returned by that field.
+
+    If a `deferred` list is given, fragments marked with @defer are appended
+    to it instead of having their fields collected.
     """
     for selection in selection_set.selections:
         directives = selection.directives
@@ -253,8 +510,23 @@ def collect_fields(
             ) or not does_fragment_condition_match(ctx, selection, runtime_type):
                 continue
 
+            if deferred is not None and directives:
+                defer = get_incremental_directive_values(
+                    ctx, GraphQLDeferDirective, directives
+                )
+                if defer is not None:
+                    deferred.append(
+                        DeferredFragment(defer.get("label"), selection.selection_set)
+                    )
+                    continue
+
             collect_fields(
-                ctx, runtime_type, selection.selection_set, fields, prev_fragment_names
+                ctx,
+                runtime_type,
+                selection.selection_set,
+                fields,
+                prev_fragment_names,
+                deferred,
             )
 
         elif isinstance(selection, ast.FragmentSpread):
@@ -275,8 +547,23 @@ def collect_fields(
             ):
                 continue
 
+            if deferred is not None and directives:
+                defer = get_incremental_directive_values(
+                    ctx, GraphQLDeferDirective, directives
+                )
+                if defer is not None:
+                    deferred.append(
+                        DeferredFragment(defer.get("label"), fragment.selection_set)
+                    )
+                    continue
+
             collect_fields(
-                ctx, runtime_type, fragment.selection_set, fields, prev_fragment_names
+                ctx,
+                runtime_type,
+                fragment.selection_set,
+                fields,
+                prev_fragment_names,
+                deferred,
             )
 
     return fields
@@ -286,40 +573,225 @@ def should_include_node(ctx, directives):
     # type: (ExecutionContext, Optional[List[Directive]]) -> bool
     """Determines if a field should be included based on the @include and
     @skip directives, where @skip has higher precidence than @include."""
-    # TODO: Refactor based on latest code
-    if directives:
-        skip_ast = None
+    if not directives:
+        return True
 
-        for directive in directives:
-            if directive.name.value == GraphQLSkipDirective.name:
-                skip_ast = directive
-                break
+    key = id(directives)
+    include = ctx._include_cache.get(key)
+    if include is None:
+        include_conditions = ctx.document_plan.include_conditions
+        entry = include_conditions.get(key)
+        if entry is None or entry[0] is not directives:
+            entry = include_conditions[key] = (
+                directives,
+                get_include_condition(directives),
+            )
+        condition = entry[1]
+        if not callable(condition):
+            return condition
+        include = ctx._include_cache[key] = condition(ctx.variable_values)
+    return include
+
+
+def get_include_condition(directives):
+    # type: (List[Directive]) -> Union[bool, Callable[[Optional[Dict[str, Any]]], bool]]
+    """Returns whether a node with the given directives should be included,
+    or a function of the variable values returning it if the @skip or
+    @include conditions reference variables."""
+    skip_ast = None
+    include_ast = None
+    for directive in directives:
+        name = directive.name.value
+        if name == GraphQLSkipDirective.name:
+            skip_ast = skip_ast or directive
+        elif name == GraphQLIncludeDirective.name:
+            include_ast = include_ast or directive
+
+    if not skip_ast and not include_ast:
+        return True
 
+    def should_include(variables):
+        # type: (Optional[Dict[str, Any]]) -> bool
         if skip_ast:
             args = get_argument_values(
-                GraphQLSkipDirective.args, skip_ast.arguments, ctx.variable_values
+                GraphQLSkipDirective.args, skip_ast.arguments, variables
             )
             if args.get("if") is True:
                 return False
 
-        include_ast = None
-
-        for directive in directives:
-            if directive.name.value == GraphQLIncludeDirective.name:
-                include_ast = directive
-                break
-
         if include_ast:
             args = get_argument_values(
-                GraphQLIncludeDirective.args, include_ast.arguments, ctx.variable_values
+                GraphQLIncludeDirective.args, include_ast.arguments, variables
             )
-
             if args.get("if") is False:
                 return False
 
+        return True
+
+    if directives_depend_on_variables(
+        [directive for directive in (skip_ast, include_ast) if directive]
+    ):
+        return should_include
+    return should_include(None)
+
+
+def directives_depend_on_variables(directives):
+    # type: (Optional[List[Directive]]) -> bool
+    for directive in directives or []:
+        for argument in directive.arguments or []:
+            if contains_variable(argument.value):
+                return True
+    return False
+
+
+def fields_depend_on_variables(fragments, field_asts):
+    # type: (Dict[str, FragmentDefinition], List[Field]) -> bool
+    """Returns whether collecting the sub-fields of the given fields depends on
+    variables, i.e. if a directive of their selections or of the fragments
+    they spread has arguments referencing variables."""
+    visited_fragment_names = set()  # type: Set[str]
+    for field_ast in field_asts:
+        if field_ast.selection_set and _selections_depend_on_variables(
+            fragments, field_ast.selection_set, visited_fragment_names
+        ):
+            return True
+    return False
+
+
+def _selections_depend_on_variables(
+    fragments,  # type: Dict[str, FragmentDefinition]
+    selection_set,  # type: SelectionSet
+    visited_fragment_names,  # type: Set[str]
+):
+    # type: (...) -> bool
+    for selection in selection_set.selections:
+        if directives_depend_on_variables(selection.directives):
+            return True
+
+        if isinstance(selection, ast.InlineFragment):
+            if _selections_depend_on_variables(
+                fragments, selection.selection_set, visited_fragment_names
+            ):
+                return True
+
+        elif isinstance(selection, ast.FragmentSpread):
+            frag_name = selection.name.value
+            if frag_name in visited_fragment_names:
+                continue
+            visited_fragment_names.add(frag_name)
+            fragment = fragments.get(frag_name)
+            if fragment and (
+                directives_depend_on_variables(fragment.directives)
+                or _selections_depend_on_variables(
+                    fragments, fragment.selection_set, visited_fragment_names
+                )
+            ):
+                return True
+
+    return False
+
+
+def get_introspection_key(field_ast, fragments):
+    # type: (Field, Dict[str, FragmentDefinition]) -> Optional[Tuple]
+    """Returns a key identifying the selection of a root introspection field
+    and the fragments it spreads, or None if the selection uses directives or
+    variables, in which case its result can't be shared between requests."""
+    fragment_names = set()  # type: Set[str]
+    if not _is_static_selection(field_ast, fragments, fragment_names):
+        return None
+    # The alias of the root field isn't part of its result
+    return (
+        field_ast.name.value,
+        tuple(print_ast(argument) for argument in field_ast.arguments or []),
+        print_ast(field_ast.selection_set) if field_ast.selection_set else None,
+        tuple(print_ast(fragments[name]) for name in sorted(fragment_names)),
+    )
+
+
+def _is_static_selection(
+    node,  # type: Union[Field, FragmentDefinition, InlineFragment]
+    fragments,  # type: Dict[str, FragmentDefinition]
+    fragment_names,  # type: Set[str]
+):
+    # type: (...) -> bool
+    if node.directives:
+        return False
+    if isinstance(node, ast.Field) and any(
+        contains_variable(argument.value) for argument in node.arguments or []
+    ):
+        return False
+    if not node.selection_set:
+        return True
+
+    for selection in node.selection_set.selections:
+        if isinstance(selection, ast.FragmentSpread):
+            if selection.directives:
+                return False
+            name = selection.name.value
+            if name in fragment_names:
+                continue
+            fragment = fragments.get(name)
+            if not fragment:
+                return False
+            fragment_names.add(name)
+            selection = fragment
+        if not _is_static_selection(selection, fragments, fragment_names):
+            return False
     return True
 
 
+def copy_result(value):
+    # type: (Any) -> Any
+    """Copies the dicts and lists of a completed value."""
+    if isinstance(value, dict):
+        return value.__class__((key, copy_result(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [copy_result(item) for item in value]
+    return value
+
+
+def get_incremental_directive_values(ctx, directive_def, directives):
+    # type: (ExecutionContext, Any, List[Directive]) -> Optional[Dict[str, Any]]
+    """Returns the argument values of the @defer or @stream directive in the
+    given directives, or None if it is absent or disabled through `if`."""
+    for directive in directives:
+        if directive.name.value == directive_def.name:
+            args = get_argument_values(
+                directive_def.args, directive.arguments, ctx.variable_values
+            )
+            if args.get("if") is False:
+                return None
+            return args
+    return None
+
+
+def freeze_argument_values(value):
+    # type: (Any) -> Optional[Any]
+    """Converts argument values into a hashable equivalent, or returns None if
+    they contain values that can't be hashed."""
+    if isinstance(value, dict):
+        items = []
+        for key, item in value.items():
+            frozen = freeze_argument_values(item)
+            if frozen is None and item is not None:
+                return None
+            items.append((key, frozen))
+        return frozenset(items)
+    if isinstance(value, (list, tuple)):
+        frozen_items = []
+        for item in value:
+            frozen = freeze_argument_values(item)
+            if frozen is None and item is not None:
+                return None
+            frozen_items.append(frozen)
+        return tuple(frozen_items)
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return value
+
+
 def does_fragment_condition_match(
     ctx,  # type: ExecutionContext
     fragment,  # type: Union[FragmentDefinition, InlineFragment]
@@ -375,6 +847,8 @@ def get_field_def(
     are allowed, like on a Union. __schema could get automatically
     added to the query type, but that would require mutating type
     definitions, which would cause issues."""
+    if schema.is_frozen():
+        return schema.get_field_def(parent_type, field_name)
     if field_name == "__schema" and schema.get_query_type() == parent_type:
         return SchemaMetaFieldDef
     elif field_name == "__type" and schema.get_query_type() == parent_type:
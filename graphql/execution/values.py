@@ -1,8 +1,9 @@
 try:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
 except ImportError:  # Python <3.3
-    from collections import Iterable
+    from collections import Iterable, Mapping
 import json
+from weakref import WeakKeyDictionary
 
 from six import string_types
 
@@ -23,12 +24,34 @@ from ..utils.value_from_ast import value_from_ast
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from ..language.ast import VariableDefinition, Argument
+    from ..language.ast import (
+        Argument,
+        Document,
+        OperationDefinition,
+        VariableDefinition,
+    )
     from ..type.schema import GraphQLSchema
     from ..type.definition import GraphQLArgument
-    from typing import Any, List, Union, Dict, Optional
+    from typing import Any, Callable, List, Union, Dict, Optional, Tuple
 
-__all__ = ["get_variable_values", "get_argument_values"]
+__all__ = [
+    "get_variable_values",
+    "get_operation_variable_values",
+    "compile_variables_coercer",
+    "get_argument_values",
+    "compile_argument_values",
+]
+
+# Document -> {(schema, operation): coercer}
+_variables_coercers = WeakKeyDictionary()  # type: WeakKeyDictionary
+
+
+class _InvalidValue(Exception):
+    """Raised by compiled coercers when a value doesn't match its type, the
+    error messages being built by is_valid_value afterwards."""
+
+
+_invalid_value = _InvalidValue()
 
 
 def get_variable_values(
@@ -39,37 +62,99 @@ def get_variable_values(
     # type: (...) -> Dict[str, Any]
     """Prepares an object map of variables of the correct type based on the provided variable definitions and arbitrary input.
     If the input cannot be parsed to match the variable definitions, a GraphQLError will be thrown."""
-    if inputs is None:
-        inputs = {}
+    return compile_variables_coercer(schema, definition_asts)(inputs)
 
-    values = {}
+
+def get_operation_variable_values(
+    schema,  # type: GraphQLSchema
+    document_ast,  # type: Document
+    operation,  # type: OperationDefinition
+    inputs,  # type: Any
+):
+    # type: (...) -> Dict[str, Any]
+    """Same as get_variable_values for the variables of the given operation,
+    reusing the coercer compiled for it the first time the document was
+    executed against the schema."""
+    coercers = _variables_coercers.get(document_ast)
+    if coercers is None:
+        coercers = _variables_coercers[document_ast] = {}
+
+    key = (schema, operation)
+    coercer = coercers.get(key)
+    if coercer is None:
+        coercer = coercers[key] = compile_variables_coercer(
+            schema, operation.variable_definitions or []
+        )
+    return coercer(inputs)
+
+
+def compile_variables_coercer(
+    schema,  # type: GraphQLSchema
+    definition_asts,  # type: List[VariableDefinition]
+):
+    # type: (...) -> Callable[[Any], Dict[str, Any]]
+    """Compiles the given variable definitions into a function that validates
+    and coerces the variables provided for a request in a single pass.
+
+    Variable types and default values are resolved once, at compile time. If
+    a definition uses a type that can't be used as an input, the error is
+    raised every time the returned function is called."""
+    type_coercers = {}  # type: Dict[Any, Callable[[Any], Any]]
+    variables = []  # type: List[Tuple[VariableDefinition, str, Any, Any, Any]]
     for def_ast in definition_asts:
         var_name = def_ast.variable.name.value
         var_type = type_from_ast(schema, def_ast.type)
-        value = inputs.get(var_name)
-
         if not is_input_type(var_type):
-            raise GraphQLError(
-                'Variable "${var_name}" expected value of type "{var_type}" which cannot be used as an input type.'.format(
-                    var_name=var_name, var_type=print_ast(def_ast.type)
-                ),
-                [def_ast],
+            variables.append((def_ast, var_name, var_type, None, None))
+            continue
+
+        default_value = None
+        if def_ast.default_value is not None:
+            default_value = value_from_ast(def_ast.default_value, var_type)
+        variables.append(
+            (
+                def_ast,
+                var_name,
+                var_type,
+                default_value,
+                compile_input_coercer(var_type, type_coercers),
             )
-        elif value is None:
-            if def_ast.default_value is not None:
-                values[var_name] = value_from_ast(
-                    def_ast.default_value, var_type
-                )  # type: ignore
-            if isinstance(var_type, GraphQLNonNull):
+        )
+
+    def coerce_variables(inputs):
+        # type: (Any) -> Dict[str, Any]
+        if inputs is None:
+            inputs = {}
+
+        values = {}
+        for def_ast, var_name, var_type, default_value, coerce in variables:
+            if coerce is None:
                 raise GraphQLError(
-                    'Variable "${var_name}" of required type "{var_type}" was not provided.'.format(
-                        var_name=var_name, var_type=var_type
+                    'Variable "${var_name}" expected value of type "{var_type}" which cannot be used as an input type.'.format(
+                        var_name=var_name, var_type=print_ast(def_ast.type)
                     ),
                     [def_ast],
                 )
-        else:
-            errors = is_valid_value(value, var_type)
-            if errors:
+
+            value = inputs.get(var_name)
+            if value is None:
+                if default_value is not None:
+                    values[var_name] = default_value
+                if isinstance(var_type, GraphQLNonNull):
+                    raise GraphQLError(
+                        'Variable "${var_name}" of required type "{var_type}" was not provided.'.format(
+                            var_name=var_name, var_type=var_type
+                        ),
+                        [def_ast],
+                    )
+                continue
+
+            try:
+                coerced_value = coerce(value)
+            except _InvalidValue:
+                errors = is_valid_value(value, var_type)
+                if not errors:
+                    raise Exception("Should have reported error.")
                 message = u"\n" + u"\n".join(errors)
                 raise GraphQLError(
                     'Variable "${}" got invalid value {}.{}'.format(
@@ -77,13 +162,108 @@ def get_variable_values(
                     ),
                     [def_ast],
                 )
-            coerced_value = coerce_value(var_type, value)
             if coerced_value is None:
                 raise Exception("Should have reported error.")
 
             values[var_name] = coerced_value
 
-    return values
+        return values
+
+    return coerce_variables
+
+
+def compile_input_coercer(type, coercers):
+    # type: (Any, Dict[Any, Callable[[Any], Any]]) -> Callable[[Any], Any]
+    """Returns a function coercing values to the given input type, with the
+    same semantics as is_valid_value followed by coerce_value. Invalid
+    values raise _InvalidValue.
+
+    Coercers are memoized in `coercers` by type, which also allows recursive
+    input object types."""
+    cached_coercer = coercers.get(type)
+    if cached_coercer is not None:
+        return cached_coercer
+
+    if isinstance(type, GraphQLNonNull):
+        coerce_of_type = compile_input_coercer(type.of_type, coercers)
+
+        def coercer(value):
+            # type: (Any) -> Any
+            if value is None:
+                raise _invalid_value
+            return coerce_of_type(value)
+
+    elif isinstance(type, GraphQLList):
+        coerce_item = compile_input_coercer(type.of_type, coercers)
+
+        def coercer(value):
+            # type: (Any) -> Any
+            if value is None:
+                return None
+            if not isinstance(value, string_types) and isinstance(value, Iterable):
+                return [coerce_item(item) for item in value]
+            return [coerce_item(value)]
+
+    elif isinstance(type, GraphQLInputObjectType):
+        fields = type.fields
+        create_container = type.create_container
+        compiled_fields = (
+            []
+        )  # type: List[Tuple[str, str, Any, bool, Callable[[Any], Any]]]
+
+        def coercer(value):
+            # type: (Any) -> Any
+            if value is None:
+                return None
+            if not isinstance(value, Mapping):
+                raise _invalid_value
+            for provided_field in value:
+                if provided_field not in fields:
+                    raise _invalid_value
+
+            obj = {}
+            for field_name, out_name, default_value, required, coerce_field in (
+                compiled_fields
+            ):
+                if field_name not in value:
+                    if required:
+                        raise _invalid_value
+                    if default_value is not None:
+                        obj[out_name] = default_value
+                else:
+                    obj[out_name] = coerce_field(value[field_name])
+            return create_container(obj)
+
+        # Registered before compiling the fields, which may refer to this type
+        coercers[type] = coercer
+        for field_name, field in fields.items():
+            compiled_fields.append(
+                (
+                    field_name,
+                    field.out_name or field_name,
+                    field.default_value,
+                    isinstance(field.type, GraphQLNonNull),
+                    compile_input_coercer(field.type, coercers),
+                )
+            )
+
+    else:
+        assert isinstance(
+            type, (GraphQLScalarType, GraphQLEnumType)
+        ), "Must be input type"
+        parse_value = type.parse_value
+
+        def coercer(value):
+            # type: (Any) -> Any
+            if value is None:
+                return None
+            parse_result = parse_value(value)
+            if parse_result is None:
+                raise _invalid_value
+            return parse_result
+
+    coercers[type] = coercer
+    return coercer
 
 
 def get_argument_values(
@@ -148,6 +328,82 @@ def get_argument_values(
     return result
 
 
+def compile_argument_values(
+    arg_defs,  # type: Union[Dict[str, GraphQLArgument], Dict]
+    arg_asts,  # type: Optional[List[Argument]]
+):
+    # type: (...) -> Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]
+    """Precomputes the argument values of a field or directive node.
+
+    Arguments that don't reference any variable are coerced once, here,
+    unless they are lists or input objects, which resolvers may mutate. The
+    returned function copies them and only computes the other arguments,
+    with the same semantics as get_argument_values.
+
+    Raises a GraphQLError if a required argument is missing regardless of
+    the variables."""
+    if not arg_defs:
+        return _no_argument_values
+
+    dynamic_arg_names = set(
+        arg.name.value for arg in arg_asts or [] if contains_variable(arg.value)
+    )
+    for name, arg_def in arg_defs.items():
+        if is_container_type(arg_def.type):
+            dynamic_arg_names.add(name)
+    if not dynamic_arg_names:
+        static_values = get_argument_values(arg_defs, arg_asts)
+
+        def static_argument_values(variables=None):
+            # type: (Optional[Dict[str, Any]]) -> Dict[str, Any]
+            return dict(static_values)
+
+        return static_argument_values
+
+    static_arg_defs = {}
+    dynamic_arg_defs = {}
+    for name, arg_def in arg_defs.items():
+        if name in dynamic_arg_names:
+            dynamic_arg_defs[name] = arg_def
+        else:
+            static_arg_defs[name] = arg_def
+    static_values = get_argument_values(static_arg_defs, arg_asts)
+
+    def argument_values(variables=None):
+        # type: (Optional[Dict[str, Any]]) -> Dict[str, Any]
+        result = dict(static_values)
+        result.update(get_argument_values(dynamic_arg_defs, arg_asts, variables))
+        return result
+
+    return argument_values
+
+
+def _no_argument_values(variables=None):
+    # type: (Optional[Dict[str, Any]]) -> Dict[str, Any]
+    return {}
+
+
+def is_container_type(type_):
+    # type: (Any) -> bool
+    """Returns whether values of the given input type are lists or input
+    objects."""
+    if isinstance(type_, GraphQLNonNull):
+        type_ = type_.of_type
+    return isinstance(type_, (GraphQLList, GraphQLInputObjectType))
+
+
+def contains_variable(value_ast):
+    # type: (Any) -> bool
+    """Returns whether the given value AST references a variable."""
+    if isinstance(value_ast, ast.Variable):
+        return True
+    if isinstance(value_ast, ast.ListValue):
+        return any(contains_variable(value) for value in value_ast.values)
+    if isinstance(value_ast, ast.ObjectValue):
+        return any(contains_variable(field.value) for field in value_ast.fields)
+    return False
+
+
 def coerce_value(type, value):
     # type: (Any, Any) -> Union[List, Dict, int, float, bool, str, None]
     """Given a type and any value, return a runtime value coerced to match the type."""
@@ -1,4 +1,5 @@
 from .execution import ExecutionResult
+from .execution.tracing import get_time_ns, get_tracer
 from .backend import get_default_backend
 
 from promise import promisify
@@ -33,6 +34,9 @@ if False:  # flake8: noqa
 #    The name of the operation to use if requestString contains multiple
 #    possible operations. Can be omitted if requestString contains only
 #    one operation.
+# tracing:
+#    Whether to add the duration of each phase and of each resolver call to
+#    the extensions of the result, in the Apollo tracing format.
 
 
 def graphql(*args, **kwargs):
@@ -53,6 +57,7 @@ def execute_graphql(
     operation_name=None,  # type: Optional[Any]
     middleware=None,  # type: Optional[Any]
     backend=None,  # type: Optional[Any]
+    tracing=False,  # type: Any
     **execute_options  # type: Any
 ):
     # type: (...) -> Union[ExecutionResult, Observable, Promise[ExecutionResult]]
@@ -60,7 +65,13 @@ def execute_graphql(
         if backend is None:
             backend = get_default_backend()
 
+        tracer = get_tracer(tracing)
+        if tracer is not None:
+            parsing_start_ns = get_time_ns()
+            execute_options["tracing"] = tracer
         document = backend.document_from_string(schema, request_string)
+        if tracer is not None:
+            tracer.record_phase("parsing", parsing_start_ns)
         return document.execute(
             root_value,
             context_value,
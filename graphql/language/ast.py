@@ -18,7 +18,7 @@ class Definition(Node):
 
 
 class Document(Node):
-    __slots__ = ("loc", "definitions")
+    __slots__ = ("loc", "definitions", "__weakref__")
     _fields = ("definitions",)
 
     def __init__(self, definitions, loc=None):
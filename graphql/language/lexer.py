@@ -40,12 +40,14 @@ class Token(object):
 
 
 class Lexer(object):
-    __slots__ = "source", "prev_position"
+    __slots__ = "source", "prev_position", "max_tokens", "token_count"
 
-    def __init__(self, source):
-        # type: (Source) -> None
+    def __init__(self, source, max_tokens=None):
+        # type: (Source, Optional[int]) -> None
         self.source = source
         self.prev_position = 0
+        self.max_tokens = max_tokens
+        self.token_count = 0
 
     def next_token(self, reset_position=None):
         # type: (Optional[int]) -> Token
@@ -53,6 +55,16 @@ class Lexer(object):
             reset_position = self.prev_position
         token = read_token(self.source, reset_position)
         self.prev_position = token.end
+        if self.max_tokens is not None and token.kind != TokenKind.EOF:
+            self.token_count += 1
+            if self.token_count > self.max_tokens:
+                raise GraphQLSyntaxError(
+                    self.source,
+                    token.start,
+                    "Document contains more than {} tokens. Parsing aborted.".format(
+                        self.max_tokens
+                    ),
+                )
         return token
 
 
@@ -51,7 +51,13 @@ __all__ = ["parse"]
 
 def parse(source, **kwargs):
     # type: (Union[Source, str], **Any) -> Document
-    """Given a GraphQL source, parses it into a Document."""
+    """Given a GraphQL source, parses it into a Document.
+
+    Besides `no_location` and `no_source`, the options `max_length`,
+    `max_tokens` and `max_depth` make parsing fail with a GraphQLSyntaxError
+    when the source has more characters or tokens, or selection sets, lists,
+    input objects and list types nested deeper than allowed, so that abusive
+    documents are rejected before spending time on them."""
     options = {"no_location": False, "no_source": False}
     options.update(kwargs)
 
@@ -77,14 +83,25 @@ def parse_value(source, **kwargs):
 
 
 class Parser(object):
-    __slots__ = "lexer", "source", "options", "prev_end", "token"
+    __slots__ = "lexer", "source", "options", "prev_end", "token", "depth", "max_depth"
 
     def __init__(self, source, options):
-        # type: (Source, Dict[str, bool]) -> None
-        self.lexer = Lexer(source)
+        # type: (Source, Dict[str, Any]) -> None
+        max_length = options.get("max_length")
+        if max_length is not None and len(source.body) > max_length:
+            raise GraphQLSyntaxError(
+                source,
+                max_length,
+                "Document is longer than {} characters. Parsing aborted.".format(
+                    max_length
+                ),
+            )
+        self.lexer = Lexer(source, options.get("max_tokens"))
         self.source = source
         self.options = options
         self.prev_end = 0
+        self.depth = 0
+        self.max_depth = options.get("max_depth")  # type: Optional[int]
         self.token = self.lexer.next_token()
 
 
@@ -132,6 +149,22 @@ def advance(parser):
     parser.token = parser.lexer.next_token(prev_end)
 
 
+def enter_nesting(parser):
+    # type: (Parser) -> None
+    """Enters a selection set, list, input object or list type, failing when
+    they are nested deeper than the max_depth option. Nesting is left by
+    decrementing the depth of the parser."""
+    parser.depth += 1
+    if parser.max_depth is not None and parser.depth > parser.max_depth:
+        raise GraphQLSyntaxError(
+            parser.source,
+            parser.token.start,
+            "Document is nested deeper than {} levels. Parsing aborted.".format(
+                parser.max_depth
+            ),
+        )
+
+
 def peek(parser, kind):
     # type: (Parser, int) -> bool
     """Determines if the next token is of a given kind"""
@@ -354,10 +387,10 @@ def parse_variable(parser):
 def parse_selection_set(parser):
     # type: (Parser) -> SelectionSet
     start = parser.token.start
-    return ast.SelectionSet(
-        selections=many(parser, TokenKind.BRACE_L, parse_selection, TokenKind.BRACE_R),
-        loc=loc(parser, start),
-    )
+    enter_nesting(parser)
+    selections = many(parser, TokenKind.BRACE_L, parse_selection, TokenKind.BRACE_R)
+    parser.depth -= 1
+    return ast.SelectionSet(selections=selections, loc=loc(parser, start))
 
 
 def parse_selection(parser):
@@ -528,21 +561,24 @@ def parse_list(parser, is_const):
     start = parser.token.start
     item = parse_const_value if is_const else parse_variable_value
 
-    return ast.ListValue(
-        values=any(parser, TokenKind.BRACKET_L, item, TokenKind.BRACKET_R),
-        loc=loc(parser, start),
-    )
+    enter_nesting(parser)
+    values = any(parser, TokenKind.BRACKET_L, item, TokenKind.BRACKET_R)
+    parser.depth -= 1
+    return ast.ListValue(values=values, loc=loc(parser, start))
 
 
 def parse_object(parser, is_const):
     # type: (Parser, bool) -> ObjectValue
     start = parser.token.start
+    enter_nesting(parser)
     expect(parser, TokenKind.BRACE_L)
     fields = []
 
     while not skip(parser, TokenKind.BRACE_R):
         fields.append(parse_object_field(parser, is_const))
 
+    parser.depth -= 1
+
     return ast.ObjectValue(fields=fields, loc=loc(parser, start))
 
 
@@ -586,8 +622,10 @@ def parse_type(parser):
     parsing rules."""
     start = parser.token.start
     if skip(parser, TokenKind.BRACKET_L):
+        enter_nesting(parser)
         ast_type = parse_type(parser)
         expect(parser, TokenKind.BRACKET_R)
+        parser.depth -= 1
         ast_type = ast.ListType(type=ast_type, loc=loc(parser, start))  # type: ignore
 
     else:
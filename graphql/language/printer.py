@@ -1,18 +1,403 @@
 import json
+import string
 
-from .visitor import Visitor, visit
+from .visitor import Visitor
+from .visitor_meta import AST_KIND_TO_TYPE
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from typing import Any, List, Optional
+    from typing import Any, Callable, Dict, Iterable, List, Optional
+    from graphql.language import ast
     from graphql.language.ast import Node
 
 __all__ = ["print_ast"]
 
 
-def print_ast(ast):
-    # type: (Node) -> str
-    return visit(ast, PrintingVisitor())
+def print_ast(ast, minify=False):
+    # type: (Node, bool) -> str
+    """Converts an AST into a string.
+
+    With `minify=True`, the string is printed without any insignificant
+    whitespace or commas, which makes it compact and stable enough to be
+    used in logs or as a cache key."""
+    if minify:
+        return minified_printer.print_node(ast)
+    return printer.print_node(ast)
+
+
+_word_characters = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+def join_tokens(tokens):
+    # type: (Iterable[str]) -> str
+    """Joins the given printed nodes, separating them by a space only where
+    the lexer would read them as a single token otherwise."""
+    parts = []  # type: List[str]
+    last_character = ""
+    for token in tokens:
+        if not token:
+            continue
+        if last_character in _word_characters and token[0] in _word_characters:
+            parts.append(" ")
+        parts.append(token)
+        last_character = token[-1]
+    return "".join(parts)
+
+
+class ASTPrinter(object):
+    """Prints AST nodes by calling itself recursively for their children.
+
+    Every `print_<Kind>` method receives the node and the indentation level of
+    the line it starts on, so that blocks are indented while being printed.
+    The output is the same as the one of `PrintingVisitor`."""
+
+    __slots__ = ("minify", "colon", "equals", "pipe", "handlers")
+
+    def __init__(self, minify=False):
+        # type: (bool) -> None
+        self.minify = minify
+        self.handlers = {
+            node_type: getattr(self, "print_" + kind)
+            for kind, node_type in AST_KIND_TO_TYPE.items()
+        }  # type: Dict[type, Callable[[Any, int], str]]
+        if minify:
+            self.colon, self.equals, self.pipe = ":", "=", "|"
+        else:
+            self.colon, self.equals, self.pipe = ": ", " = ", " | "
+
+    def print_node(self, node, level=0):
+        # type: (Any, int) -> str
+        handler = self.handlers.get(type(node))
+        assert handler, "Invalid AST Node: " + repr(node)
+        return handler(node, level)
+
+    def print_nodes(self, nodes, level=0):
+        # type: (Optional[List[Any]], int) -> List[str]
+        if not nodes:
+            return []
+        print_node = self.print_node
+        return [print_node(node, level) for node in nodes]
+
+    def join(self, parts, separator=""):
+        # type: (List[str], str) -> str
+        if self.minify:
+            return join_tokens(parts)
+        return separator.join(part for part in parts if part)
+
+    def block(self, nodes, level):
+        # type: (Optional[List[Any]], int) -> str
+        items = [item for item in self.print_nodes(nodes, level + 1) if item]
+        if not items:
+            return "{}"
+        if self.minify:
+            return "{" + join_tokens(items) + "}"
+        indentation = "\n" + "  " * (level + 1)
+        return "{" + indentation + indentation.join(items) + "\n" + "  " * level + "}"
+
+    def arguments(self, nodes):
+        # type: (Optional[List[Any]]) -> str
+        if not nodes:
+            return ""
+        return "(" + self.join(self.print_nodes(nodes), ", ") + ")"
+
+    def directives(self, nodes, separator=" "):
+        # type: (Optional[List[Any]], str) -> str
+        if not nodes:
+            return ""
+        return self.join(self.print_nodes(nodes), separator)
+
+    def print_Name(self, node, level):
+        # type: (ast.Name, int) -> str
+        return node.value
+
+    def print_Variable(self, node, level):
+        # type: (ast.Variable, int) -> str
+        return "$" + node.name.value
+
+    def print_Document(self, node, level):
+        # type: (ast.Document, int) -> str
+        definitions = self.print_nodes(node.definitions, level)
+        if self.minify:
+            return join_tokens(definitions)
+        return self.join(definitions, "\n\n") + "\n"
+
+    def print_OperationDefinition(self, node, level):
+        # type: (ast.OperationDefinition, int) -> str
+        selection_set = self.print_node(node.selection_set, level)
+        var_defs = self.arguments(node.variable_definitions)
+        directives = self.directives(node.directives)
+        if (
+            not node.name
+            and not directives
+            and not var_defs
+            and node.operation == "query"
+        ):
+            return selection_set
+
+        name = node.name.value if node.name else ""
+        return self.join(
+            [node.operation, name + var_defs, directives, selection_set], " "
+        )
+
+    def print_VariableDefinition(self, node, level):
+        # type: (ast.VariableDefinition, int) -> str
+        printed = (
+            self.print_node(node.variable) + self.colon + self.print_node(node.type)
+        )
+        if node.default_value is not None:
+            printed += self.equals + self.print_node(node.default_value)
+        return printed
+
+    def print_SelectionSet(self, node, level):
+        # type: (ast.SelectionSet, int) -> str
+        return self.block(node.selections, level)
+
+    def print_Field(self, node, level):
+        # type: (ast.Field, int) -> str
+        printed = node.name.value + self.arguments(node.arguments)
+        if node.alias:
+            printed = node.alias.value + self.colon + printed
+        if not node.directives and not node.selection_set:
+            return printed
+        return self.join(
+            [
+                printed,
+                self.directives(node.directives),
+                self.print_node(node.selection_set, level)
+                if node.selection_set
+                else "",
+            ],
+            " ",
+        )
+
+    def print_Argument(self, node, level):
+        # type: (ast.Argument, int) -> str
+        return node.name.value + self.colon + self.print_node(node.value)
+
+    # Fragments
+
+    def print_FragmentSpread(self, node, level):
+        # type: (ast.FragmentSpread, int) -> str
+        return self.join(
+            ["..." + node.name.value, self.directives(node.directives)], " "
+        )
+
+    def print_InlineFragment(self, node, level):
+        # type: (ast.InlineFragment, int) -> str
+        type_condition = ""
+        if node.type_condition:
+            type_condition = self.join(
+                ["on", self.print_node(node.type_condition)], " "
+            )
+        return self.join(
+            [
+                "...",
+                type_condition,
+                self.directives(node.directives, ""),
+                self.print_node(node.selection_set, level),
+            ],
+            " ",
+        )
+
+    def print_FragmentDefinition(self, node, level):
+        # type: (ast.FragmentDefinition, int) -> str
+        return self.join(
+            [
+                "fragment",
+                node.name.value,
+                "on",
+                self.print_node(node.type_condition),
+                self.directives(node.directives),
+                self.print_node(node.selection_set, level),
+            ],
+            " ",
+        )
+
+    # Value
+
+    def print_IntValue(self, node, level):
+        # type: (ast.IntValue, int) -> str
+        return node.value
+
+    def print_FloatValue(self, node, level):
+        # type: (ast.FloatValue, int) -> str
+        return node.value
+
+    def print_StringValue(self, node, level):
+        # type: (ast.StringValue, int) -> str
+        return json.dumps(node.value)
+
+    def print_BooleanValue(self, node, level):
+        # type: (ast.BooleanValue, int) -> str
+        return json.dumps(node.value)
+
+    def print_EnumValue(self, node, level):
+        # type: (ast.EnumValue, int) -> str
+        return node.value
+
+    def print_ListValue(self, node, level):
+        # type: (ast.ListValue, int) -> str
+        return "[" + self.join(self.print_nodes(node.values), ", ") + "]"
+
+    def print_ObjectValue(self, node, level):
+        # type: (ast.ObjectValue, int) -> str
+        return "{" + self.join(self.print_nodes(node.fields), ", ") + "}"
+
+    def print_ObjectField(self, node, level):
+        # type: (ast.ObjectField, int) -> str
+        return node.name.value + self.colon + self.print_node(node.value)
+
+    # Directive
+
+    def print_Directive(self, node, level):
+        # type: (ast.Directive, int) -> str
+        return "@" + node.name.value + self.arguments(node.arguments)
+
+    # Type
+
+    def print_NamedType(self, node, level):
+        # type: (ast.NamedType, int) -> str
+        return node.name.value
+
+    def print_ListType(self, node, level):
+        # type: (ast.ListType, int) -> str
+        return "[" + self.print_node(node.type) + "]"
+
+    def print_NonNullType(self, node, level):
+        # type: (ast.NonNullType, int) -> str
+        return self.print_node(node.type) + "!"
+
+    # Type Definitions:
+
+    def print_SchemaDefinition(self, node, level):
+        # type: (ast.SchemaDefinition, int) -> str
+        return self.join(
+            [
+                "schema",
+                self.directives(node.directives),
+                self.block(node.operation_types, level),
+            ],
+            " ",
+        )
+
+    def print_OperationTypeDefinition(self, node, level):
+        # type: (ast.OperationTypeDefinition, int) -> str
+        return node.operation + self.colon + self.print_node(node.type)
+
+    def print_ScalarTypeDefinition(self, node, level):
+        # type: (ast.ScalarTypeDefinition, int) -> str
+        return self.join(
+            ["scalar", node.name.value, self.directives(node.directives)], " "
+        )
+
+    def print_ObjectTypeDefinition(self, node, level):
+        # type: (ast.ObjectTypeDefinition, int) -> str
+        interfaces = ""
+        if node.interfaces:
+            interfaces = self.join(
+                ["implements", self.join(self.print_nodes(node.interfaces), ", ")],
+                " ",
+            )
+        return self.join(
+            [
+                "type",
+                node.name.value,
+                interfaces,
+                self.directives(node.directives),
+                self.block(node.fields, level),
+            ],
+            " ",
+        )
+
+    def print_FieldDefinition(self, node, level):
+        # type: (ast.FieldDefinition, int) -> str
+        return self.join(
+            [
+                node.name.value
+                + self.arguments(node.arguments)
+                + self.colon
+                + self.print_node(node.type),
+                self.directives(node.directives),
+            ],
+            " ",
+        )
+
+    def print_InputValueDefinition(self, node, level):
+        # type: (ast.InputValueDefinition, int) -> str
+        printed = node.name.value + self.colon + self.print_node(node.type)
+        if node.default_value is not None:
+            printed += self.equals + self.print_node(node.default_value)
+        return self.join([printed, self.directives(node.directives)], " ")
+
+    def print_InterfaceTypeDefinition(self, node, level):
+        # type: (ast.InterfaceTypeDefinition, int) -> str
+        return self.join(
+            [
+                "interface",
+                node.name.value,
+                self.directives(node.directives),
+                self.block(node.fields, level),
+            ],
+            " ",
+        )
+
+    def print_UnionTypeDefinition(self, node, level):
+        # type: (ast.UnionTypeDefinition, int) -> str
+        return (
+            self.join(
+                ["union", node.name.value, self.directives(node.directives)], " "
+            )
+            + self.equals
+            + self.pipe.join(self.print_nodes(node.types))
+        )
+
+    def print_EnumTypeDefinition(self, node, level):
+        # type: (ast.EnumTypeDefinition, int) -> str
+        return self.join(
+            [
+                "enum",
+                node.name.value,
+                self.directives(node.directives),
+                self.block(node.values, level),
+            ],
+            " ",
+        )
+
+    def print_EnumValueDefinition(self, node, level):
+        # type: (ast.EnumValueDefinition, int) -> str
+        return self.join([node.name.value, self.directives(node.directives)], " ")
+
+    def print_InputObjectTypeDefinition(self, node, level):
+        # type: (ast.InputObjectTypeDefinition, int) -> str
+        return self.join(
+            [
+                "input",
+                node.name.value,
+                self.directives(node.directives),
+                self.block(node.fields, level),
+            ],
+            " ",
+        )
+
+    def print_TypeExtensionDefinition(self, node, level):
+        # type: (ast.TypeExtensionDefinition, int) -> str
+        return self.join(["extend", self.print_node(node.definition, level)], " ")
+
+    def print_DirectiveDefinition(self, node, level):
+        # type: (ast.DirectiveDefinition, int) -> str
+        return self.join(
+            [
+                "directive",
+                "@" + node.name.value + self.arguments(node.arguments),
+                "on",
+                self.pipe.join(self.print_nodes(node.locations)),
+            ],
+            " ",
+        )
+
+
+printer = ASTPrinter()
+minified_printer = ASTPrinter(minify=True)
 
 
 class PrintingVisitor(Visitor):
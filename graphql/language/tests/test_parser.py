@@ -305,3 +305,47 @@ def test_parse_creates_ast():
             )
         ],
     )
+
+
+def test_parse_limits_the_document_length():
+    # type: () -> None
+    assert parse("{ a }", max_length=5)
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("{ ab }", max_length=5)
+    assert "Document is longer than 5 characters." in excinfo.value.message
+
+
+def test_parse_limits_the_number_of_tokens():
+    # type: () -> None
+    assert parse("{ a b }", max_tokens=4)
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("{ a b c }", max_tokens=4)
+    assert excinfo.value.message.startswith(
+        u"Syntax Error GraphQL (1:9) Document contains more than 4 tokens."
+    )
+
+
+def test_parse_limits_the_nesting_depth():
+    # type: () -> None
+    assert parse("{ a { b } }", max_depth=2)
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("{ a { b { c } } }", max_depth=2)
+    assert excinfo.value.message.startswith(
+        u"Syntax Error GraphQL (1:9) Document is nested deeper than 2 levels."
+    )
+
+    assert parse("{ a(b: [[1]]) }", max_depth=3)
+    with raises(GraphQLSyntaxError):
+        parse("{ a(b: [[1]]) }", max_depth=2)
+    with raises(GraphQLSyntaxError):
+        parse('{ a(b: {c: {d: "e"}}) }', max_depth=2)
+    with raises(GraphQLSyntaxError):
+        parse("query ($a: [[Int]]) { b }", max_depth=1)
+
+
+def test_parse_rejects_deep_documents_before_recursion_errors():
+    # type: () -> None
+    with raises(GraphQLSyntaxError):
+        parse("{ a " * 10000 + "}" * 10000, max_depth=100)
+    with raises(GraphQLSyntaxError):
+        parse("{ a(b: " + "[" * 10000 + "]" * 10000 + ") }", max_depth=100)
@@ -4,9 +4,10 @@ from pytest import raises
 
 from graphql.language.ast import Field, Name
 from graphql.language.parser import parse
-from graphql.language.printer import print_ast
+from graphql.language.printer import PrintingVisitor, print_ast
+from graphql.language.visitor import visit
 
-from .fixtures import KITCHEN_SINK
+from .fixtures import KITCHEN_SINK, SCHEMA_KITCHEN_SINK
 
 
 def test_does_not_alter_ast():
@@ -143,3 +144,50 @@ fragment frag on Friend {
 }
 """
     )
+
+
+def test_prints_same_output_as_printing_visitor():
+    # type: () -> None
+    for source in [KITCHEN_SINK, SCHEMA_KITCHEN_SINK]:
+        ast = parse(source)
+        assert print_ast(ast) == visit(ast, PrintingVisitor())
+
+
+def test_prints_minified_kitchen_sink():
+    # type: () -> None
+    ast = parse(KITCHEN_SINK)
+    minified = print_ast(ast, minify=True)
+    assert "\n" not in minified
+    assert ", " not in minified
+    assert print_ast(parse(minified)) == print_ast(ast)
+    assert print_ast(parse(minified), minify=True) == minified
+
+
+def test_prints_minified_schema_kitchen_sink():
+    # type: () -> None
+    ast = parse(SCHEMA_KITCHEN_SINK)
+    minified = print_ast(ast, minify=True)
+    assert "\n" not in minified
+    assert print_ast(parse(minified)) == print_ast(ast)
+
+
+def test_prints_minified_query():
+    # type: () -> None
+    ast = parse(
+        """
+        query Q($a: Int = 1, $b: [String!]) @dir(x: -1) {
+          alias: field(arg: $a, list: [1, -2, "s", ENUM], obj: {a: true}) {
+            ...Frag
+            ... on Type @skip(if: $b) { id }
+          }
+          other
+        }
+        fragment Frag on Type { id name }
+        """
+    )
+    assert print_ast(ast, minify=True) == (
+        "query Q($a:Int=1$b:[String!])@dir(x:-1){"
+        'alias:field(arg:$a list:[1 -2"s"ENUM]obj:{a:true}){'
+        "...Frag...on Type@skip(if:$b){id}}other}"
+        "fragment Frag on Type{id name}"
+    )
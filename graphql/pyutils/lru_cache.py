@@ -0,0 +1,65 @@
+import threading
+from collections import OrderedDict
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, Hashable
+
+_missing = object()
+
+
+class LRUCache(object):
+    """A mapping keeping at most `max_size` items, the least recently used
+    item being dropped when a new one doesn't fit. It's safe to use from
+    several threads."""
+
+    __slots__ = ("max_size", "_items", "_lock")
+
+    def __init__(self, max_size=128):
+        # type: (int) -> None
+        assert max_size >= 1, "max_size must be at least 1."
+        self.max_size = max_size
+        self._items = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        # type: (Hashable, Any) -> Any
+        with self._lock:
+            value = self._items.pop(key, _missing)
+            if value is _missing:
+                return default
+            self._items[key] = value
+            return value
+
+    def __getitem__(self, key):
+        # type: (Hashable) -> Any
+        value = self.get(key, _missing)
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        # type: (Hashable, Any) -> None
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def __delitem__(self, key):
+        # type: (Hashable) -> None
+        with self._lock:
+            del self._items[key]
+
+    def __contains__(self, key):
+        # type: (Hashable) -> bool
+        return key in self._items
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._items)
+
+    def clear(self):
+        # type: () -> None
+        with self._lock:
+            self._items.clear()
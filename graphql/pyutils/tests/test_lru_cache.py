@@ -0,0 +1,31 @@
+from pytest import raises
+
+from graphql.pyutils.lru_cache import LRUCache
+
+
+def test_drops_the_least_recently_used_items():
+    cache = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    with raises(KeyError):
+        cache["b"]
+
+
+def test_replaces_and_deletes_items():
+    cache = LRUCache(2)
+    cache["a"] = 1
+    cache["a"] = 2
+    assert len(cache) == 1
+    assert cache["a"] == 2
+    del cache["a"]
+    assert "a" not in cache
+    cache["b"] = 3
+    cache.clear()
+    assert not len(cache)
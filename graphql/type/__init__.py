@@ -31,6 +31,9 @@ from .directives import (
     GraphQLSkipDirective,
     GraphQLIncludeDirective,
     GraphQLDeprecatedDirective,
+    # Experimental incremental delivery directives
+    GraphQLDeferDirective,
+    GraphQLStreamDirective,
     # Constant Deprecation Reason
     DEFAULT_DEPRECATION_REASON,
 )
@@ -5,6 +5,7 @@ try:
 except ImportError:  # Python < 3.3
     from collections import Hashable, Mapping
 import copy
+from inspect import isclass
 
 from typing import Union
 
@@ -17,7 +18,7 @@ from ..utils.undefined import Undefined
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from typing import List, Dict, Any, Callable, Optional, Type
+    from typing import List, Dict, Any, Callable, Optional, Tuple, Type
 
 
 def is_type(type_):
@@ -165,15 +166,25 @@ class GraphQLObjectType(GraphQLNamedType):
             'name': GraphQLField(GraphQLString),
             'bestFriend': GraphQLField(PersonType)
         })
+
+    Instead of an `is_type_of` function, the Python class (or tuple of
+    classes) of the values of the type can be given as `python_type`. The
+    runtime type of values returned for interfaces and unions whose possible
+    types all declare it is then resolved with a lookup by class.
+
+    Example:
+
+        PersonType = GraphQLObjectType('Person', fields, python_type=Person)
     """
 
     def __init__(
         self,
         name,  # type: str
         fields,  # type: Union[Callable[[], Dict[str, GraphQLField]], Dict[str, GraphQLField]]
-        interfaces=None,  # type: Optional[List[GraphQLInterfaceType]]
+        interfaces=None,  # type: Optional[Union[Callable[[], List[GraphQLInterfaceType]], List[GraphQLInterfaceType]]]
         is_type_of=None,  # type: Optional[Callable]
         description=None,  # type: Optional[Any]
+        python_type=None,  # type: Optional[Union[type, Tuple[type, ...]]]
     ):
         # type: (...) -> None
         assert name, "Type must be named."
@@ -187,7 +198,24 @@ class GraphQLObjectType(GraphQLNamedType):
                 is_type_of
             ), '{} must provide "is_type_of" as a function.'.format(self)
 
+        if python_type is not None:
+            assert is_type_of is None, '{} must provide either "is_type_of" or "python_type".'.format(
+                self
+            )
+            assert isinstance(python_type, tuple) or isclass(
+                python_type
+            ), '{} must provide "python_type" as a class or a tuple of classes.'.format(
+                self
+            )
+
+            python_classes = python_type  # type: Union[type, Tuple[type, ...]]
+
+            def is_type_of(value, info):
+                # type: (Any, Any) -> bool
+                return isinstance(value, python_classes)
+
         self.is_type_of = is_type_of
+        self.python_type = python_type
         self._fields = fields
         self._provided_interfaces = interfaces
         self._interfaces = None
@@ -238,7 +266,7 @@ def define_field_map(
 
 def define_interfaces(
     type_,  # type: GraphQLObjectType
-    interfaces,  # type: Optional[List[GraphQLInterfaceType]]
+    interfaces,  # type: Optional[Union[Callable[[], List[GraphQLInterfaceType]], List[GraphQLInterfaceType]]]
 ):
     # type: (...) -> List[GraphQLInterfaceType]
     if callable(interfaces):
@@ -272,7 +300,29 @@ def define_interfaces(
 
 
 class GraphQLField(object):
-    __slots__ = "type", "args", "resolver", "deprecation_reason", "description"
+    """Field Definition
+
+    When executing with `memoize_resolvers=True`, the resolver is called only
+    once per source object and arguments. Pass `memoize=False` for resolvers
+    with side effects, or that depend on the selection set of the field.
+
+    `cost` and `multiplier` are used by the QueryComplexity validation rule.
+    `cost` is the cost of resolving the field once, and `multiplier` the
+    number of times its sub-selection is resolved: either a number, the name
+    of an argument holding it (e.g. 'first'), or a function receiving the
+    argument values and returning it.
+    """
+
+    __slots__ = (
+        "type",
+        "args",
+        "resolver",
+        "deprecation_reason",
+        "description",
+        "memoize",
+        "cost",
+        "multiplier",
+    )
 
     def __init__(
         self,
@@ -281,6 +331,9 @@ class GraphQLField(object):
         resolver=None,  # type: Optional[Callable]
         deprecation_reason=None,  # type: Optional[Any]
         description=None,  # type: Optional[Any]
+        memoize=True,  # type: bool
+        cost=None,  # type: Optional[int]
+        multiplier=None,  # type: Union[int, str, Callable[[Dict[str, Any]], int], None]
     ):
         # type: (...) -> None
         self.type = type_
@@ -288,6 +341,9 @@ class GraphQLField(object):
         self.resolver = resolver
         self.deprecation_reason = deprecation_reason
         self.description = description
+        self.memoize = memoize
+        self.cost = cost
+        self.multiplier = multiplier
 
     def __eq__(self, other):
         return self is other or (
@@ -297,6 +353,9 @@ class GraphQLField(object):
             and self.resolver == other.resolver
             and self.deprecation_reason == other.deprecation_reason
             and self.description == other.description
+            and self.memoize == other.memoize
+            and self.cost == other.cost
+            and self.multiplier == other.multiplier
         )
 
     def __hash__(self):
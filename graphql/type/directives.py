@@ -6,7 +6,7 @@ except ImportError:  # Python < 3.3
 from ..pyutils.ordereddict import OrderedDict
 from ..utils.assert_valid_name import assert_valid_name
 from .definition import GraphQLArgument, GraphQLNonNull, is_input_type
-from .scalars import GraphQLBoolean, GraphQLString
+from .scalars import GraphQLBoolean, GraphQLInt, GraphQLString
 
 
 class DirectiveLocation(object):
@@ -97,6 +97,54 @@ GraphQLSkipDirective = GraphQLDirective(
     ],
 )
 
+"""Used to defer the delivery of a fragment to a subsequent payload."""
+GraphQLDeferDirective = GraphQLDirective(
+    name="defer",
+    description=(
+        "Directs the executor to deliver this fragment in a subsequent payload "
+        "instead of the initial response."
+    ),
+    args={
+        "if": GraphQLArgument(
+            type_=GraphQLBoolean,
+            description="Deferred when true.",
+            default_value=True,
+        ),
+        "label": GraphQLArgument(
+            type_=GraphQLString,
+            description="Unique name identifying the subsequent payloads.",
+        ),
+    },
+    locations=[DirectiveLocation.FRAGMENT_SPREAD, DirectiveLocation.INLINE_FRAGMENT],
+)
+
+"""Used to stream the items of a list field in subsequent payloads."""
+GraphQLStreamDirective = GraphQLDirective(
+    name="stream",
+    description=(
+        "Directs the executor to deliver the items of this list field after the "
+        "first `initialCount` ones in subsequent payloads."
+    ),
+    args={
+        "if": GraphQLArgument(
+            type_=GraphQLBoolean,
+            description="Streamed when true.",
+            default_value=True,
+        ),
+        "label": GraphQLArgument(
+            type_=GraphQLString,
+            description="Unique name identifying the subsequent payloads.",
+        ),
+        "initialCount": GraphQLArgument(
+            type_=GraphQLInt,
+            description="Number of items to include in the initial response.",
+            default_value=0,
+            out_name="initial_count",
+        ),
+    },
+    locations=[DirectiveLocation.FIELD],
+)
+
 """Constant string used for default reason for a deprecation."""
 DEFAULT_DEPRECATION_REASON = "No longer supported"
 
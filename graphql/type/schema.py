@@ -1,25 +1,39 @@
 try:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
 except ImportError:  # Python < 3.3
-    from collections import Iterable
+    from collections import Iterable, Mapping
 
 from collections import namedtuple
-from typing import Dict, Union, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Union, List, Optional, Set
+from typing import cast
 
 from .definition import (
+    GraphQLEnumType,
+    GraphQLField,
+    GraphQLInputObjectType,
     GraphQLNamedType,
     GraphQLInterfaceType,
     GraphQLObjectType,
     GraphQLUnionType,
     GraphQLType,
+    get_named_type,
 )
+from ..pyutils.lru_cache import LRUCache
 from .directives import GraphQLDirective, specified_directives
-from .introspection import IntrospectionSchema
-from .typemap import GraphQLTypeMap
+from .introspection import (
+    IntrospectionSchema,
+    SchemaMetaFieldDef,
+    TypeMetaFieldDef,
+    TypeNameMetaFieldDef,
+)
+from .typemap import GraphQLTypeMap, LazyGraphQLTypeMap
 
 
 InterfaceImplementations = namedtuple("InterfaceImplementations", "objects, interfaces")
 
+# Number of distinct root introspection selections whose result is kept
+INTROSPECTION_CACHE_SIZE = 16
+
 
 class GraphQLSchema(object):
     """Schema Definition
@@ -44,6 +58,30 @@ class GraphQLSchema(object):
           ...
           directives=specified_directives.extend([MyCustomerDirective]),
       )
+
+    `loaders` is an optional mapping of DataLoader factories. Every execution
+    against the schema creates its loaders lazily from them, and exposes them
+    to resolvers as `info.loaders`.
+
+    Interfaces and unions without `resolve_type` whose possible types all
+    declare a `python_type` resolve the runtime type of values by class, the
+    result being cached per Python class.
+
+    `assume_valid=True` skips the validation of the types and the walk over
+    them collecting referenced types, in which case `types` must list every
+    named type of the schema, introspection types included. It's meant for
+    schemas known to be valid, like the ones loaded from snapshots.
+
+    With `lazy_types=True`, the types referenced by the root types are only
+    discovered when looked up, defining their fields on the way, which makes
+    creating very large schemas cheap. The schema is not validated on
+    creation then: call `schema.validate()`, e.g. in tests, to run the
+    checks.
+
+    Once fully defined, a schema can be frozen with `schema.freeze()`, which
+    defines every lazy part of its types and indexes directives, possible
+    types and field definitions so they are looked up in constant time
+    during validation and execution. A frozen schema can't be modified.
     """
 
     __slots__ = (
@@ -54,6 +92,14 @@ class GraphQLSchema(object):
         "_directives",
         "_implementations",
         "_possible_type_map",
+        "_loaders",
+        "_python_type_maps",
+        "_directive_map",
+        "_possible_type_sets",
+        "_field_def_maps",
+        "_referencing_type_names",
+        "_introspection_cache",
+        "_frozen",
     )
 
     def __init__(
@@ -63,6 +109,9 @@ class GraphQLSchema(object):
         subscription=None,  # type: Optional[GraphQLObjectType]
         directives=None,  # type: Optional[List[GraphQLDirective]]
         types=None,  # type: Optional[List[GraphQLNamedType]]
+        loaders=None,  # type: Optional[Dict[Hashable, Callable]]
+        assume_valid=False,  # type: bool
+        lazy_types=False,  # type: bool
     ):
         # type: (...) -> None
         assert isinstance(
@@ -101,9 +150,101 @@ class GraphQLSchema(object):
         initial_types = list(
             filter(None, [query, mutation, subscription, IntrospectionSchema])
         )  # type: List[GraphQLNamedType]
-        if types:
+        if assume_valid:
+            initial_types = list(types or []) + initial_types
+        elif types:
             initial_types += types
-        self._type_map = GraphQLTypeMap(initial_types)
+        if lazy_types and not assume_valid:
+            self._type_map = LazyGraphQLTypeMap(
+                initial_types
+            )  # type: GraphQLTypeMap
+        else:
+            self._type_map = GraphQLTypeMap(initial_types, assume_valid)
+
+        if loaders is not None:
+            assert isinstance(
+                loaders, Mapping
+            ), "Schema loaders must be a mapping of loader factories but got: {}.".format(
+                loaders
+            )
+        self._loaders = loaders or {}
+        self._python_type_maps = (
+            {}
+        )  # type: Dict[str, Optional[Dict[type, Optional[GraphQLObjectType]]]]
+        self._directive_map = None  # type: Optional[Dict[str, GraphQLDirective]]
+        self._possible_type_sets = (
+            None
+        )  # type: Optional[Dict[GraphQLNamedType, FrozenSet[GraphQLObjectType]]]
+        self._field_def_maps = (
+            None
+        )  # type: Optional[Dict[GraphQLNamedType, Dict[str, GraphQLField]]]
+        self._referencing_type_names = (
+            {}
+        )  # type: Dict[str, FrozenSet[str]]
+        self._introspection_cache = LRUCache(INTROSPECTION_CACHE_SIZE)
+        self._frozen = False
+
+    def __setattr__(self, name, value):
+        # type: (str, Any) -> None
+        if getattr(self, "_frozen", False):
+            raise AttributeError("Frozen schema cannot be modified.")
+        super(GraphQLSchema, self).__setattr__(name, value)
+
+    def freeze(self):
+        # type: () -> GraphQLSchema
+        """Defines the fields, interfaces, union types and enum values of
+        every type and builds the lookup indexes of the schema, then makes it
+        immutable. Returns the schema."""
+        if self._frozen:
+            return self
+
+        query_type = self.get_query_type()
+        possible_type_sets = (
+            {}
+        )  # type: Dict[GraphQLNamedType, FrozenSet[GraphQLObjectType]]
+        field_def_maps = {}  # type: Dict[GraphQLNamedType, Dict[str, GraphQLField]]
+        for type_ in self._type_map.values():
+            if isinstance(type_, (GraphQLObjectType, GraphQLInterfaceType)):
+                field_defs = dict(type_.fields)
+                field_defs["__typename"] = TypeNameMetaFieldDef
+                if type_ is query_type:
+                    field_defs["__schema"] = SchemaMetaFieldDef
+                    field_defs["__type"] = TypeMetaFieldDef
+                field_def_maps[type_] = field_defs
+                if isinstance(type_, GraphQLObjectType):
+                    type_.interfaces
+            elif isinstance(type_, GraphQLUnionType):
+                field_def_maps[type_] = {"__typename": TypeNameMetaFieldDef}
+            elif isinstance(type_, GraphQLEnumType):
+                type_._value_lookup
+                type_._name_lookup
+            elif isinstance(type_, GraphQLInputObjectType):
+                type_.fields
+
+            if isinstance(type_, (GraphQLInterfaceType, GraphQLUnionType)):
+                possible_types = self.get_possible_types(type_)
+                # Interfaces without implementations keep failing loudly
+                if possible_types:
+                    possible_type_sets[type_] = frozenset(possible_types)
+
+        self._directive_map = {
+            directive.name: directive for directive in reversed(self._directives)
+        }
+        self._possible_type_sets = possible_type_sets
+        self._field_def_maps = field_def_maps
+        self._frozen = True
+        return self
+
+    def validate(self):
+        # type: () -> None
+        """Runs the consistency checks of the types of the schema, raising an
+        AssertionError if they fail. Useful for schemas created with
+        `lazy_types=True` or `assume_valid=True`, which skip them."""
+        GraphQLTypeMap(list(self._type_map.values()))
+
+    def is_frozen(self):
+        # type: () -> bool
+        return self._frozen
 
     def get_query_type(self):
         # type: () -> GraphQLObjectType
@@ -126,26 +267,120 @@ class GraphQLSchema(object):
         return self._type_map.get(name)
         # raise Exception("Type {name} not found in schema.".format(name=name))
 
+    def get_loaders(self):
+        # type: () -> Dict[Hashable, Callable]
+        return self._loaders
+
+    def get_introspection_cache(self):
+        # type: () -> LRUCache
+        """Returns the results of the root introspection fields used most
+        recently with the schema, by selection."""
+        return self._introspection_cache
+
     def get_directives(self):
         # type: () -> List[GraphQLDirective]
         return self._directives
 
     def get_directive(self, name):
         # type: (str) -> Optional[GraphQLDirective]
+        if self._directive_map is not None:
+            return self._directive_map.get(name)
+
         for directive in self.get_directives():
             if directive.name == name:
                 return directive
 
         return None
 
+    def get_referencing_type_names(self, type_name):
+        # type: (str) -> FrozenSet[str]
+        """Returns the names of the types referencing the given type through
+        their fields, interfaces or union members. The reverse index is built
+        once per schema, the first time it's needed."""
+        referencing_type_names = self._referencing_type_names
+        if not referencing_type_names:
+            referencing_type_names.update(
+                get_referencing_type_names(self._type_map.values())
+            )
+        return referencing_type_names.get(type_name, frozenset())
+
     def get_possible_types(self, abstract_type):
         # type: (Union[GraphQLInterfaceType, GraphQLUnionType]) -> List[GraphQLObjectType]
         return self._type_map.get_possible_types(abstract_type)
 
+    def get_python_type_map(self, abstract_type):
+        # type: (Union[GraphQLInterfaceType, GraphQLUnionType]) -> Optional[Dict[type, Optional[GraphQLObjectType]]]
+        """Returns the cache mapping Python classes to the possible type of
+        `abstract_type` their instances resolve to, or None if a possible type
+        doesn't declare its `python_type`."""
+        try:
+            return self._python_type_maps[abstract_type.name]
+        except KeyError:
+            possible_types = self.get_possible_types(abstract_type)
+            python_type_map = (
+                {}
+                if all(
+                    possible_type.python_type is not None
+                    for possible_type in possible_types
+                )
+                else None
+            )  # type: Optional[Dict[type, Optional[GraphQLObjectType]]]
+            self._python_type_maps[abstract_type.name] = python_type_map
+            return python_type_map
+
     def is_possible_type(
         self,
         abstract_type,  # type: Union[GraphQLInterfaceType, GraphQLUnionType]
         possible_type,  # type: GraphQLObjectType
     ):
         # type: (...) -> bool
+        if self._possible_type_sets is not None:
+            possible_types = self._possible_type_sets.get(abstract_type)
+            if possible_types is not None:
+                return possible_type in possible_types
         return self._type_map.is_possible_type(abstract_type, possible_type)
+
+    def get_field_def(self, parent_type, field_name):
+        # type: (GraphQLNamedType, str) -> Optional[GraphQLField]
+        """Returns the definition of the field of the given name on an object,
+        interface or union type, including introspection meta fields."""
+        if self._field_def_maps is not None:
+            field_defs = self._field_def_maps.get(parent_type)
+            if field_defs is not None:
+                return field_defs.get(field_name)
+
+        if field_name == "__schema" and self.get_query_type() == parent_type:
+            return SchemaMetaFieldDef
+        elif field_name == "__type" and self.get_query_type() == parent_type:
+            return TypeMetaFieldDef
+        elif field_name == "__typename" and isinstance(
+            parent_type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType)
+        ):
+            return TypeNameMetaFieldDef
+        elif isinstance(parent_type, (GraphQLObjectType, GraphQLInterfaceType)):
+            return parent_type.fields.get(field_name)
+        return None
+
+
+def get_referencing_type_names(types):
+    # type: (Iterable[GraphQLNamedType]) -> Dict[str, FrozenSet[str]]
+    referencing_type_names = {}  # type: Dict[str, Set[str]]
+    for type_ in types:
+        referenced_types = []  # type: List[GraphQLNamedType]
+        if isinstance(type_, (GraphQLObjectType, GraphQLInterfaceType)):
+            referenced_types.extend(
+                cast(GraphQLNamedType, get_named_type(field.type))
+                for field in type_.fields.values()
+            )
+        if isinstance(type_, GraphQLObjectType):
+            referenced_types.extend(type_.interfaces)
+        elif isinstance(type_, GraphQLUnionType):
+            referenced_types.extend(type_.types)
+        for referenced_type in referenced_types:
+            referencing_type_names.setdefault(referenced_type.name, set()).add(
+                type_.name
+            )
+    return {
+        name: frozenset(type_names)
+        for name, type_names in referencing_type_names.items()
+    }
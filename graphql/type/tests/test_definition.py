@@ -373,6 +373,17 @@ def test_does_not_mutate_passed_field_definitions():
     }
 
 
+def test_compares_fields_by_memoization_and_cost():
+    assert GraphQLField(GraphQLString, cost=2, multiplier="first") == GraphQLField(
+        GraphQLString, cost=2, multiplier="first"
+    )
+    assert GraphQLField(GraphQLString, memoize=False) != GraphQLField(GraphQLString)
+    assert GraphQLField(GraphQLString, cost=2) != GraphQLField(GraphQLString, cost=3)
+    assert GraphQLField(GraphQLString, multiplier=10) != GraphQLField(
+        GraphQLString, multiplier="first"
+    )
+
+
 # def test_sorts_fields_and_argument_keys_if_not_using_ordered_dict():
 #     fields = {
 #         'b': GraphQLField(GraphQLString),
@@ -17,6 +17,7 @@ from graphql.type import (
     GraphQLSchema,
     GraphQLString,
 )
+from graphql.type.schema import INTROSPECTION_CACHE_SIZE
 from graphql.utils.introspection_query import introspection_query
 from graphql.validation.rules import ProvidedNonNullArguments
 
@@ -1162,3 +1163,64 @@ def test_exposes_descriptions_on_enums():
             ],
         }
     }
+
+
+def test_caches_introspection_results_per_schema():
+    schema = GraphQLSchema(
+        GraphQLObjectType("QueryRoot", {"f": GraphQLField(GraphQLString)})
+    )
+
+    result = graphql(schema, introspection_query)
+    assert not result.errors
+    assert len(schema.get_introspection_cache()) == 1
+
+    # The cached result is shared by other documents with the same selection
+    result.data["__schema"]["types"].clear()
+    other_result = graphql(schema, introspection_query)
+    assert not other_result.errors
+    assert other_result.data["__schema"]["types"]
+    assert other_result.data == graphql(schema, introspection_query).data
+    assert len(schema.get_introspection_cache()) == 1
+
+    other_schema = GraphQLSchema(
+        GraphQLObjectType("QueryRoot", {"f": GraphQLField(GraphQLString)})
+    )
+    assert graphql(other_schema, introspection_query).data == other_result.data
+
+
+def test_bounds_the_introspection_cache():
+    schema = GraphQLSchema(
+        GraphQLObjectType("QueryRoot", {"f": GraphQLField(GraphQLString)})
+    )
+
+    # Aliases of the root field share the same result
+    for alias in ("a", "b", "c"):
+        result = graphql(schema, '{ %s: __type(name: "QueryRoot") { name } }' % alias)
+        assert result.data == {alias: {"name": "QueryRoot"}}
+    assert len(schema.get_introspection_cache()) == 1
+
+    for i in range(INTROSPECTION_CACHE_SIZE * 2):
+        result = graphql(schema, '{ __type(name: "T%d") { name } }' % i)
+        assert result.data == {"__type": None}
+    assert len(schema.get_introspection_cache()) == INTROSPECTION_CACHE_SIZE
+
+
+def test_does_not_cache_introspection_selections_with_variables():
+    schema = GraphQLSchema(
+        GraphQLObjectType("QueryRoot", {"f": GraphQLField(GraphQLString)})
+    )
+    query = """
+        query q($name: String!, $withKind: Boolean!) {
+            __type(name: $name) { name kind @include(if: $withKind) }
+        }
+    """
+
+    result = graphql(
+        schema, query, variable_values={"name": "String", "withKind": True}
+    )
+    assert result.data == {"__type": {"name": "String", "kind": "SCALAR"}}
+    result = graphql(
+        schema, query, variable_values={"name": "QueryRoot", "withKind": False}
+    )
+    assert result.data == {"__type": {"name": "QueryRoot"}}
+    assert not schema.get_introspection_cache()
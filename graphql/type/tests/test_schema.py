@@ -3,10 +3,14 @@ from pytest import raises
 from ...type import (
     GraphQLField,
     GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
     GraphQLObjectType,
     GraphQLSchema,
     GraphQLString,
+    GraphQLUnionType,
 )
+from ...type.introspection import SchemaMetaFieldDef, TypeNameMetaFieldDef
 
 interface_type = GraphQLInterfaceType(
     name="Interface",
@@ -42,3 +46,143 @@ def test_throws_human_readable_error_if_schematypes_not_defined():
         "Could not find possible implementing types for Interface in schema. Check that "
         "schema.types is defined and is an array ofall possible types in the schema."
     )
+
+
+def test_frozen_schema_indexes_lookups():
+    node_type = GraphQLInterfaceType(
+        name="Node", fields={"id": GraphQLField(GraphQLString)}
+    )
+    user_type = GraphQLObjectType(
+        name="User",
+        interfaces=[node_type],
+        fields={"id": GraphQLField(GraphQLString)},
+        python_type=dict,
+    )
+    query_type = GraphQLObjectType(
+        name="Query",
+        fields=lambda: {
+            "node": GraphQLField(node_type, resolver=lambda *_: {"id": "1"})
+        },
+    )
+    frozen_schema = GraphQLSchema(query=query_type, types=[user_type])
+    assert frozen_schema.freeze() is frozen_schema
+    assert frozen_schema.is_frozen()
+
+    assert frozen_schema.get_directive("skip").name == "skip"
+    assert frozen_schema.get_directive("unknown") is None
+    assert frozen_schema.is_possible_type(node_type, user_type)
+    assert not frozen_schema.is_possible_type(node_type, query_type)
+
+    assert frozen_schema.get_field_def(query_type, "node") is query_type.fields["node"]
+    assert frozen_schema.get_field_def(query_type, "__schema") is SchemaMetaFieldDef
+    assert frozen_schema.get_field_def(user_type, "__schema") is None
+    assert frozen_schema.get_field_def(node_type, "__typename") is TypeNameMetaFieldDef
+    assert frozen_schema.get_field_def(GraphQLString, "__typename") is None
+
+    with raises(AttributeError) as exci:
+        frozen_schema._query = None
+    assert str(exci.value) == "Frozen schema cannot be modified."
+
+    from ...graphql import graphql
+
+    result = graphql(
+        frozen_schema,
+        '{ __typename node @include(if: true) { id ... on User { __typename } } '
+        '__type(name: "User") { name } }',
+    )
+    assert not result.errors
+    assert result.data == {
+        "__typename": "Query",
+        "node": {"id": "1", "__typename": "User"},
+        "__type": {"name": "User"},
+    }
+
+
+def test_lazy_types_are_discovered_on_lookup():
+    defined = []
+
+    def make_type(name, fields):
+        def define_fields():
+            defined.append(name)
+            return fields()
+
+        return GraphQLObjectType(name=name, fields=define_fields)
+
+    deep_type = make_type("Deep", lambda: {"a": GraphQLField(GraphQLString)})
+    middle_type = make_type("Middle", lambda: {"deep": GraphQLField(deep_type)})
+    query_type = make_type("Query", lambda: {"middle": GraphQLField(middle_type)})
+
+    lazy_schema = GraphQLSchema(query=query_type, lazy_types=True)
+    assert defined == []
+
+    assert lazy_schema.get_type("Middle") is middle_type
+    assert defined == ["Query", "Middle"]
+    assert lazy_schema.get_type("Unknown") is None
+    assert defined == ["Query", "Middle", "Deep"]
+    assert list(lazy_schema.get_type_map())[:3] == ["Query", "__Schema", "Middle"]
+
+    from ...graphql import graphql
+
+    result = graphql(
+        lazy_schema,
+        "{ middle { deep { a } } }",
+        root_value={"middle": {"deep": {"a": "a"}}},
+    )
+    assert not result.errors
+    assert result.data == {"middle": {"deep": {"a": "a"}}}
+    lazy_schema.validate()
+
+
+def test_lazy_types_are_checked_by_validate():
+    broken_type = GraphQLObjectType(
+        name="Broken",
+        interfaces=[interface_type],
+        is_type_of=lambda *_: True,
+        fields={"other": GraphQLField(GraphQLString)},
+    )
+    lazy_schema = GraphQLSchema(
+        query=GraphQLObjectType(
+            name="Query", fields={"broken": GraphQLField(broken_type)}
+        ),
+        lazy_types=True,
+    )
+    assert lazy_schema.get_type("Broken") is broken_type
+
+    with raises(AssertionError) as exci:
+        lazy_schema.validate()
+    assert str(exci.value) == (
+        '"Interface" expects field "field_name" but "Broken" does not provide it.'
+    )
+
+
+def test_indexes_referencing_types():
+    node_type = GraphQLInterfaceType(
+        name="Node",
+        fields={"id": GraphQLField(GraphQLString)},
+        resolve_type=lambda *_: None,
+    )
+    user_type = GraphQLObjectType(
+        name="User", interfaces=[node_type], fields={"id": GraphQLField(GraphQLString)}
+    )
+    group_type = GraphQLObjectType(
+        name="Group",
+        interfaces=[node_type],
+        fields={
+            "id": GraphQLField(GraphQLString),
+            "users": GraphQLField(GraphQLList(GraphQLNonNull(user_type))),
+        },
+    )
+    result_type = GraphQLUnionType(
+        name="Result", types=[user_type, group_type], resolve_type=lambda *_: None
+    )
+    indexed_schema = GraphQLSchema(
+        query=GraphQLObjectType(
+            name="Query", fields={"search": GraphQLField(result_type)}
+        )
+    )
+
+    assert indexed_schema.get_referencing_type_names("User") == {"Group", "Result"}
+    assert indexed_schema.get_referencing_type_names("Node") == {"User", "Group"}
+    assert indexed_schema.get_referencing_type_names("Result") == {"Query"}
+    assert indexed_schema.get_referencing_type_names("Query") == frozenset()
+    assert indexed_schema.freeze().get_referencing_type_names("Group") == {"Result"}
@@ -1,4 +1,4 @@
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, deque
 from functools import reduce
 
 from typing import cast
@@ -21,14 +21,20 @@ from .definition import (
 if False:  # flake8: noqa
     from ..type.definition import GraphQLNamedType
     from ..type.schema import GraphQLSchema
-    from typing import List, Union, Dict, Set, DefaultDict
+    from typing import Any, Deque, Iterator, List, Optional, Union, Dict, Set, DefaultDict
 
 
 class GraphQLTypeMap(OrderedDict):
-    def __init__(self, types):
-        # type: (List[GraphQLNamedType]) -> None
+    def __init__(self, types, assume_valid=False):
+        # type: (List[GraphQLNamedType], bool) -> None
         super(GraphQLTypeMap, self).__init__()
-        self.update(reduce(self.reducer, types, OrderedDict()))  # type: ignore
+        if assume_valid:
+            # The given types are all the named types of the schema
+            for type_ in types:
+                if type_.name not in self:
+                    self[type_.name] = type_
+        else:
+            self.update(reduce(self.reducer, types, OrderedDict()))  # type: ignore
         self._possible_type_map = defaultdict(set)  # type: DefaultDict[str, Set[str]]
 
         # Keep track of all implementations by interface name.
@@ -40,6 +46,9 @@ class GraphQLTypeMap(OrderedDict):
                 for interface in gql_type.interfaces:
                     self._implementations[interface.name].append(gql_type)
 
+        if assume_valid:
+            return
+
         # Enforce correct interface implementations.
         for type_ in self.values():
             if isinstance(type_, GraphQLObjectType):
@@ -209,3 +218,105 @@ class GraphQLTypeMap(OrderedDict):
                         interface,
                         field_name,
                     )
+
+
+class LazyGraphQLTypeMap(GraphQLTypeMap):
+    """A type map discovering the types referenced by the given ones on
+    demand: looking up a type by name only walks the types until it is
+    found, which defines their fields on the way. Iterating over the map or
+    looking up the implementations of an interface walks every type.
+
+    The consistency checks done by GraphQLTypeMap are skipped, and run by
+    GraphQLSchema.validate()."""
+
+    def __init__(self, types):
+        # type: (List[GraphQLNamedType]) -> None
+        OrderedDict.__init__(self)
+        self._possible_type_map = defaultdict(set)  # type: DefaultDict[str, Set[str]]
+        self._implementations = defaultdict(
+            list
+        )  # type: DefaultDict[str, List[GraphQLObjectType]]
+        self._pending = deque(types)  # type: Deque[Any]
+        self._complete = False
+
+    def _discover(self, name=None):
+        # type: (Optional[str]) -> None
+        """Walks the pending types until the one named `name` is found, or
+        until every type was found if no name is given."""
+        pending = self._pending
+        while pending:
+            type_ = pending.popleft()
+            while isinstance(type_, (GraphQLList, GraphQLNonNull)):
+                type_ = type_.of_type
+            if not type_ or OrderedDict.__contains__(self, type_.name):
+                continue
+
+            OrderedDict.__setitem__(self, type_.name, type_)
+            if isinstance(type_, GraphQLUnionType):
+                pending.extend(type_.types)
+            if isinstance(type_, GraphQLObjectType):
+                pending.extend(type_.interfaces)
+                for interface in type_.interfaces:
+                    self._implementations[interface.name].append(type_)
+            if isinstance(
+                type_, (GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType)
+            ):
+                for field in type_.fields.values():
+                    for arg in getattr(field, "args", {}).values():
+                        pending.append(arg.type)
+                    pending.append(field.type)
+
+            if type_.name == name:
+                return
+
+        self._complete = True
+
+    def __getitem__(self, name):
+        # type: (Any) -> Any
+        if not self._complete and not OrderedDict.__contains__(self, name):
+            self._discover(name)
+        return OrderedDict.__getitem__(self, name)
+
+    def __contains__(self, name):
+        # type: (Any) -> bool
+        if not self._complete and not OrderedDict.__contains__(self, name):
+            self._discover(name)
+        return OrderedDict.__contains__(self, name)
+
+    def get(self, name, default=None):
+        # type: (Any, Any) -> Any
+        if not self._complete and not OrderedDict.__contains__(self, name):
+            self._discover(name)
+        return OrderedDict.get(self, name, default)
+
+    def __iter__(self):
+        # type: () -> Iterator[str]
+        self._discover()
+        return OrderedDict.__iter__(self)
+
+    def __len__(self):
+        # type: () -> int
+        self._discover()
+        return OrderedDict.__len__(self)
+
+    def keys(self):
+        # type: () -> Any
+        self._discover()
+        return OrderedDict.keys(self)
+
+    def values(self):
+        # type: () -> Any
+        self._discover()
+        return OrderedDict.values(self)
+
+    def items(self):
+        # type: () -> Any
+        self._discover()
+        return OrderedDict.items(self)
+
+    def get_possible_types(self, abstract_type):
+        # type: (Union[GraphQLInterfaceType, GraphQLUnionType]) -> List[GraphQLObjectType]
+        if isinstance(abstract_type, GraphQLInterfaceType):
+            # Implementations can only be known once every type was found
+            self._discover()
+        return super(LazyGraphQLTypeMap, self).get_possible_types(abstract_type)
@@ -35,10 +35,11 @@ from ..type.scalars import (
     GraphQLString,
 )
 from ..type.schema import GraphQLSchema
+from ..type.typemap import GraphQLTypeMap
 from .value_from_ast import value_from_ast
 
 
-def extend_schema(schema, documentAST=None):
+def extend_schema(schema, documentAST=None, incremental=False):
     """Produces a new schema given an existing schema and a document which may
     contain GraphQL type extensions and definitions. The original schema will
     remain unaltered.
@@ -48,7 +49,14 @@ def extend_schema(schema, documentAST=None):
     too late if subgraphs remain unchanged.
 
     This algorithm copies the provided schema, applying extensions while
-    producing the copy. The original schema remains unaltered."""
+    producing the copy. The original schema remains unaltered.
+
+    With `incremental=True`, only the extended types and the types referencing
+    them, directly or not, are copied: other types are shared with the
+    original schema, resolvers are kept, and the new schema is built without
+    walking and checking all of its types again. Fields added by the document
+    use the default resolver. This is meant for executable schemas extended
+    at runtime."""
 
     assert isinstance(schema, GraphQLSchema), "Must provide valid GraphQLSchema"
     assert documentAST and isinstance(
@@ -156,6 +164,17 @@ def extend_schema(schema, documentAST=None):
         return type
 
     def extend_object_type(type):
+        if incremental:
+            if type.name not in affected_type_names:
+                return type
+            return GraphQLObjectType(
+                name=type.name,
+                description=type.description,
+                interfaces=lambda: extend_implemented_interfaces(type),
+                fields=lambda: extend_field_map(type),
+                is_type_of=None if type.python_type else type.is_type_of,
+                python_type=type.python_type,
+            )
         return GraphQLObjectType(
             name=type.name,
             description=type.description,
@@ -164,19 +183,27 @@ def extend_schema(schema, documentAST=None):
         )
 
     def extend_interface_type(type):
+        if incremental and type.name not in affected_type_names:
+            return type
         return GraphQLInterfaceType(
             name=type.name,
             description=type.description,
             fields=lambda: extend_field_map(type),
-            resolve_type=cannot_execute_client_schema,
+            resolve_type=type.resolve_type
+            if incremental
+            else cannot_execute_client_schema,
         )
 
     def extend_union_type(type):
+        if incremental and type.name not in affected_type_names:
+            return type
         return GraphQLUnionType(
             name=type.name,
             description=type.description,
             types=list(map(get_type_from_def, type.types)),
-            resolve_type=cannot_execute_client_schema,
+            resolve_type=type.resolve_type
+            if incremental
+            else cannot_execute_client_schema,
         )
 
     def extend_implemented_interfaces(type):
@@ -203,6 +230,18 @@ def extend_schema(schema, documentAST=None):
         new_field_map = OrderedDict()
         old_field_map = type.fields
         for field_name, field in old_field_map.items():
+            if incremental:
+                new_field_map[field_name] = GraphQLField(
+                    extend_field_type(field.type),
+                    description=field.description,
+                    deprecation_reason=field.deprecation_reason,
+                    args=field.args,
+                    resolver=field.resolver,
+                    memoize=field.memoize,
+                    cost=field.cost,
+                    multiplier=field.multiplier,
+                )
+                continue
             new_field_map[field_name] = GraphQLField(
                 extend_field_type(field.type),
                 description=field.description,
@@ -227,7 +266,7 @@ def extend_schema(schema, documentAST=None):
                 new_field_map[field_name] = GraphQLField(
                     build_field_type(field.type),
                     args=build_input_values(field.arguments),
-                    resolver=cannot_execute_client_schema,
+                    resolver=field_resolver,
                 )
 
         return new_field_map
@@ -305,7 +344,7 @@ def extend_schema(schema, documentAST=None):
             field.name.value: GraphQLField(
                 build_field_type(field.type),
                 args=build_input_values(field.arguments),
-                resolver=cannot_execute_client_schema,
+                resolver=field_resolver,
             )
             for field in type_ast.fields
         }
@@ -331,6 +370,11 @@ def extend_schema(schema, documentAST=None):
     if not type_extensions_map and not type_definition_map:
         return schema
 
+    field_resolver = None if incremental else cannot_execute_client_schema
+    affected_type_names = None
+    if incremental:
+        affected_type_names = get_dependent_type_names(schema, type_extensions_map)
+
     # A cache to use to store the actual GraphQLType definition objects by name.
     # Initialize to the GraphQL built in scalars and introspection types. All
     # functions below are inline so that this type def cache is within the scope
@@ -374,6 +418,27 @@ def extend_schema(schema, documentAST=None):
     # Do the same with new types, appending to the list of defined types.
     types += [get_type_from_AST(_def) for _def in type_definition_map.values()]
 
+    if incremental:
+        # The type map of the original schema was valid, only the copied types
+        # and the new ones need to be checked.
+        extended_schema = GraphQLSchema(
+            query=query_type,
+            mutation=mutationType,
+            subscription=subscription_type,
+            directives=schema.get_directives(),
+            types=types,
+            loaders=schema.get_loaders(),
+            assume_valid=True,
+        )
+        for type_name in list(affected_type_names) + list(type_definition_map):
+            type_ = extended_schema.get_type(type_name)
+            if isinstance(type_, GraphQLObjectType):
+                for interface in type_.interfaces:
+                    GraphQLTypeMap.assert_object_implements_interface(
+                        extended_schema, type_, interface
+                    )
+        return extended_schema
+
     # Then produce and return a Schema with these types.
     return GraphQLSchema(
         query=query_type,
@@ -385,5 +450,19 @@ def extend_schema(schema, documentAST=None):
     )
 
 
+def get_dependent_type_names(schema, type_names):
+    """Returns the names of the given types and of the types of the schema
+    referencing them, directly or not, through fields, interfaces or union
+    members."""
+    dependent_type_names = set(type_names)
+    pending = list(dependent_type_names)
+    while pending:
+        for type_name in schema.get_referencing_type_names(pending.pop()):
+            if type_name not in dependent_type_names:
+                dependent_type_names.add(type_name)
+                pending.append(type_name)
+    return dependent_type_names
+
+
 def cannot_execute_client_schema(*args, **kwargs):
     raise Exception("Client Schema cannot be used for execution.")
@@ -0,0 +1,78 @@
+from hashlib import sha1
+
+from six import string_types
+
+from ..language import ast
+from ..language.parser import parse
+from ..language.printer import ASTPrinter
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, List, Optional, Tuple, Union
+
+
+class CanonicalPrinter(ASTPrinter):
+    """Prints documents minified, with the definitions sorted by name and the
+    arguments, variable definitions and input object fields sorted too, as
+    their order doesn't change how the document executes.
+
+    The order of the selections is kept since it is the order of the keys of
+    the response, and so are operation names, used to select the operation
+    to execute."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        # type: () -> None
+        super(CanonicalPrinter, self).__init__(minify=True)
+
+    def print_Document(self, node, level):
+        # type: (ast.Document, int) -> str
+        definitions = sorted(node.definitions, key=get_definition_sort_key)
+        return super(CanonicalPrinter, self).print_Document(
+            ast.Document(definitions=definitions), level
+        )
+
+    def arguments(self, nodes):
+        # type: (Optional[List[Any]]) -> str
+        if nodes and isinstance(nodes[0], ast.Argument):
+            nodes = sorted(nodes, key=lambda node: node.name.value)
+        elif nodes and isinstance(nodes[0], ast.VariableDefinition):
+            nodes = sorted(nodes, key=lambda node: node.variable.name.value)
+        return super(CanonicalPrinter, self).arguments(nodes)
+
+    def print_ObjectValue(self, node, level):
+        # type: (ast.ObjectValue, int) -> str
+        fields = sorted(node.fields, key=lambda field: field.name.value)
+        return "{" + self.join(self.print_nodes(fields)) + "}"
+
+
+def get_definition_sort_key(definition):
+    # type: (Any) -> Tuple[bool, str]
+    name = getattr(definition, "name", None)
+    return (
+        isinstance(definition, ast.FragmentDefinition),
+        name.value if name else "",
+    )
+
+
+canonical_printer = CanonicalPrinter()
+
+
+def normalize_document(document):
+    # type: (Union[str, ast.Document]) -> str
+    """Returns the canonical form of the given document: documents which only
+    differ by their whitespace, comments, commas or the order of their
+    definitions, arguments, variable definitions and input object fields have
+    the same canonical form.
+
+    Raises a GraphQLSyntaxError if the document can't be parsed."""
+    if isinstance(document, string_types):
+        document = parse(document, no_location=True)
+    return canonical_printer.print_node(document)
+
+
+def get_normalized_document_hash(document):
+    # type: (Union[str, ast.Document]) -> str
+    """Returns a hash of the canonical form of the given document."""
+    return sha1(normalize_document(document).encode("utf-8")).hexdigest()
@@ -0,0 +1,473 @@
+import json
+from importlib import import_module
+
+from typing import cast
+
+from ..language.parser import parse_value
+from ..language.printer import print_ast
+from ..pyutils.ordereddict import OrderedDict
+from ..type import (
+    GraphQLArgument,
+    GraphQLBoolean,
+    GraphQLDeferDirective,
+    GraphQLDeprecatedDirective,
+    GraphQLDirective,
+    GraphQLEnumType,
+    GraphQLEnumValue,
+    GraphQLField,
+    GraphQLFloat,
+    GraphQLID,
+    GraphQLIncludeDirective,
+    GraphQLInputObjectField,
+    GraphQLInputObjectType,
+    GraphQLInt,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLSkipDirective,
+    GraphQLStreamDirective,
+    GraphQLString,
+    GraphQLUnionType,
+    specified_directives,
+)
+from ..type.definition import GraphQLNamedType
+from ..type.introspection import IntrospectionSchema
+from ..type.typemap import GraphQLTypeMap
+from .ast_from_value import ast_from_value
+from .value_from_ast import value_from_ast
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, Callable, Dict, List, Optional, Union
+
+__all__ = [
+    "schema_to_snapshot",
+    "schema_from_snapshot",
+    "save_schema_snapshot",
+    "load_schema_snapshot",
+]
+
+SNAPSHOT_VERSION = 1
+
+# Types and directives which are referenced by name in snapshots
+_builtin_types = dict(
+    GraphQLTypeMap([IntrospectionSchema]),
+    **{
+        scalar.name: scalar
+        for scalar in [GraphQLInt, GraphQLFloat, GraphQLString, GraphQLBoolean, GraphQLID]
+    }
+)  # type: Dict[str, GraphQLNamedType]
+_builtin_directives = {
+    directive.name: directive
+    for directive in [
+        GraphQLIncludeDirective,
+        GraphQLSkipDirective,
+        GraphQLDeferDirective,
+        GraphQLStreamDirective,
+        GraphQLDeprecatedDirective,
+    ]
+}  # type: Dict[str, GraphQLDirective]
+
+
+def save_schema_snapshot(schema, path):
+    # type: (GraphQLSchema, str) -> None
+    """Writes a snapshot of the schema to the file at `path`."""
+    snapshot = schema_to_snapshot(schema)
+    with open(path, "w") as fp:
+        json.dump(snapshot, fp, separators=(",", ":"))
+
+
+def load_schema_snapshot(path):
+    # type: (str) -> GraphQLSchema
+    """Builds a schema from the snapshot in the file at `path`."""
+    with open(path) as fp:
+        snapshot = json.load(fp)
+    return schema_from_snapshot(snapshot)
+
+
+def schema_to_snapshot(schema):
+    # type: (GraphQLSchema) -> Dict[str, Any]
+    """Returns a JSON serializable snapshot of the schema.
+
+    Functions (resolvers, `is_type_of`, `resolve_type`, scalar parsers and
+    serializers...) and classes are stored by import path, so they must be
+    defined at the top level of a module or of a class. Enum values must be
+    JSON serializable."""
+    snapshot = OrderedDict(
+        [
+            ("version", SNAPSHOT_VERSION),
+            ("query", schema.get_query_type().name),
+        ]
+    )  # type: Dict[str, Any]
+    mutation_type = schema.get_mutation_type()
+    if mutation_type:
+        snapshot["mutation"] = mutation_type.name
+    subscription_type = schema.get_subscription_type()
+    if subscription_type:
+        snapshot["subscription"] = subscription_type.name
+
+    snapshot["types"] = [
+        _type_to_snapshot(cast(GraphQLNamedType, type_))
+        for type_ in schema.get_type_map().values()
+    ]
+    directives = schema.get_directives()
+    if directives is not specified_directives:
+        snapshot["directives"] = [
+            _directive_to_snapshot(directive) for directive in directives
+        ]
+    return snapshot
+
+
+def _type_to_snapshot(type_):
+    # type: (GraphQLNamedType) -> Dict[str, Any]
+    if _builtin_types.get(type_.name) is type_:
+        return {"name": type_.name}
+
+    data = OrderedDict([("name", type_.name)])  # type: Dict[str, Any]
+    description = getattr(type_, "description", None)
+    if description:
+        data["description"] = description
+
+    if isinstance(type_, GraphQLObjectType):
+        data["kind"] = "OBJECT"
+        if type_.interfaces:
+            data["interfaces"] = [interface.name for interface in type_.interfaces]
+        data["fields"] = _fields_to_snapshot(type_)
+        if type_.python_type is not None:
+            data["python_type"] = (
+                [_get_path(t, type_) for t in type_.python_type]
+                if isinstance(type_.python_type, tuple)
+                else _get_path(type_.python_type, type_)
+            )
+        elif type_.is_type_of:
+            data["is_type_of"] = _get_path(type_.is_type_of, type_)
+
+    elif isinstance(type_, GraphQLInterfaceType):
+        data["kind"] = "INTERFACE"
+        data["fields"] = _fields_to_snapshot(type_)
+        if type_.resolve_type:
+            data["resolve_type"] = _get_path(type_.resolve_type, type_)
+
+    elif isinstance(type_, GraphQLUnionType):
+        data["kind"] = "UNION"
+        data["types"] = [possible_type.name for possible_type in type_.types]
+        if type_.resolve_type:
+            data["resolve_type"] = _get_path(type_.resolve_type, type_)
+
+    elif isinstance(type_, GraphQLEnumType):
+        data["kind"] = "ENUM"
+        values = []
+        for value in type_.values:
+            value_data = OrderedDict([("name", value.name)])  # type: Dict[str, Any]
+            if value.value != value.name:
+                value_data["value"] = value.value
+            if value.description:
+                value_data["description"] = value.description
+            if value.deprecation_reason:
+                value_data["deprecation_reason"] = value.deprecation_reason
+            values.append(value_data)
+        data["values"] = values
+
+    elif isinstance(type_, GraphQLInputObjectType):
+        data["kind"] = "INPUT_OBJECT"
+        data["fields"] = [
+            _input_value_to_snapshot(name, field)
+            for name, field in type_.fields.items()
+        ]
+        if type_.container_type is not OrderedDict:
+            data["container_type"] = _get_path(type_.container_type, type_)
+
+    else:
+        assert isinstance(type_, GraphQLScalarType), "Unknown type {}.".format(type_)
+        data["kind"] = "SCALAR"
+        data["serialize"] = _get_path(type_.serialize, type_)
+        if type_.parse_value is not None:
+            data["parse_value"] = _get_path(type_.parse_value, type_)
+        if type_.parse_literal is not None:
+            data["parse_literal"] = _get_path(type_.parse_literal, type_)
+
+    return data
+
+
+def _fields_to_snapshot(type_):
+    # type: (Union[GraphQLObjectType, GraphQLInterfaceType]) -> List[Dict[str, Any]]
+    fields = []
+    for name, field in type_.fields.items():
+        data = OrderedDict(
+            [("name", name), ("type", str(field.type))]
+        )  # type: Dict[str, Any]
+        if field.args:
+            data["args"] = [
+                _input_value_to_snapshot(arg_name, arg)
+                for arg_name, arg in field.args.items()
+            ]
+        if field.resolver:
+            data["resolver"] = _get_path(
+                field.resolver, "{}.{}".format(type_, name)
+            )
+        if field.description:
+            data["description"] = field.description
+        if field.deprecation_reason:
+            data["deprecation_reason"] = field.deprecation_reason
+        if not field.memoize:
+            data["memoize"] = False
+        if field.cost is not None:
+            data["cost"] = field.cost
+        if callable(field.multiplier):
+            data["multiplier"] = {
+                "path": _get_path(field.multiplier, "{}.{}".format(type_, name))
+            }
+        elif field.multiplier is not None:
+            data["multiplier"] = field.multiplier
+        fields.append(data)
+    return fields
+
+
+def _input_value_to_snapshot(name, input_value):
+    # type: (str, Union[GraphQLArgument, GraphQLInputObjectField]) -> Dict[str, Any]
+    data = OrderedDict(
+        [("name", name), ("type", str(input_value.type))]
+    )  # type: Dict[str, Any]
+    if input_value.default_value is not None:
+        data["default_value"] = print_ast(
+            ast_from_value(input_value.default_value, input_value.type)
+        )
+    if input_value.description:
+        data["description"] = input_value.description
+    if input_value.out_name:
+        data["out_name"] = input_value.out_name
+    return data
+
+
+def _directive_to_snapshot(directive):
+    # type: (GraphQLDirective) -> Dict[str, Any]
+    if _builtin_directives.get(directive.name) is directive:
+        return {"name": directive.name}
+
+    data = OrderedDict([("name", directive.name)])  # type: Dict[str, Any]
+    if directive.description:
+        data["description"] = directive.description
+    data["locations"] = list(directive.locations)
+    if directive.args:
+        data["args"] = [
+            _input_value_to_snapshot(name, arg) for name, arg in directive.args.items()
+        ]
+    return data
+
+
+def _get_path(obj, owner):
+    # type: (Any, Any) -> str
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", None)
+    path = "{}:{}".format(module, qualname)
+    try:
+        importable = (
+            module is not None
+            and qualname is not None
+            and "<" not in qualname
+            and _import_path(path) == obj
+        )
+    except (ImportError, AttributeError):
+        importable = False
+    assert importable, "Cannot snapshot {}: {!r} can't be imported by path.".format(
+        owner, obj
+    )
+    return path
+
+
+def _import_path(path):
+    # type: (str) -> Any
+    module_name, qualname = path.split(":")
+    obj = import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def schema_from_snapshot(snapshot):
+    # type: (Dict[str, Any]) -> GraphQLSchema
+    """Builds a schema from a snapshot returned by schema_to_snapshot.
+
+    The snapshot is trusted: the schema is built with `assume_valid=True`,
+    and the fields of every type are only defined when first accessed."""
+    assert (
+        snapshot.get("version") == SNAPSHOT_VERSION
+    ), "Unsupported schema snapshot version: {}.".format(snapshot.get("version"))
+
+    types = OrderedDict()  # type: Dict[str, GraphQLNamedType]
+    wrapped_types = {}  # type: Dict[str, Any]
+    imported = {}  # type: Dict[str, Any]
+
+    def get_type(type_ref):
+        # type: (str) -> Any
+        type_ = types.get(type_ref) or wrapped_types.get(type_ref)
+        if type_ is None:
+            if type_ref.endswith("!"):
+                type_ = GraphQLNonNull(get_type(type_ref[:-1]))
+            else:
+                assert type_ref.startswith("["), "Unknown type {}.".format(type_ref)
+                type_ = GraphQLList(get_type(type_ref[1:-1]))
+            wrapped_types[type_ref] = type_
+        return type_
+
+    def get_object(path):
+        # type: (Optional[str]) -> Any
+        if path is None:
+            return None
+        obj = imported.get(path)
+        if obj is None:
+            obj = imported[path] = _import_path(path)
+        return obj
+
+    def build_input_values(values_data, cls):
+        # type: (List[Dict[str, Any]], type) -> OrderedDict
+        input_values = OrderedDict()
+        for data in values_data:
+            type_ = get_type(data["type"])
+            default_value = data.get("default_value")
+            if default_value is not None:
+                default_value = value_from_ast(
+                    parse_value(default_value, no_location=True), type_
+                )
+            input_values[data["name"]] = cls(
+                type_,
+                default_value=default_value,
+                description=data.get("description"),
+                out_name=data.get("out_name"),
+            )
+        return input_values
+
+    def build_fields(fields_data):
+        # type: (List[Dict[str, Any]]) -> OrderedDict
+        fields = OrderedDict()
+        for data in fields_data:
+            multiplier = data.get("multiplier")
+            if isinstance(multiplier, dict):
+                multiplier = get_object(multiplier["path"])
+            fields[data["name"]] = GraphQLField(
+                get_type(data["type"]),
+                args=build_input_values(data.get("args", []), GraphQLArgument),
+                resolver=get_object(data.get("resolver")),
+                deprecation_reason=data.get("deprecation_reason"),
+                description=data.get("description"),
+                memoize=data.get("memoize", True),
+                cost=data.get("cost"),
+                multiplier=multiplier,
+            )
+        return fields
+
+    def get_types(names):
+        # type: (List[str]) -> List[Any]
+        # Objects, interfaces and unions reference types of the expected kinds
+        return [types[name] for name in names]
+
+    def get_root_type(name):
+        # type: (Optional[str]) -> Optional[GraphQLObjectType]
+        if name is None:
+            return None
+        root_type = types[name]
+        assert isinstance(
+            root_type, GraphQLObjectType
+        ), "Root type {} must be an object type.".format(name)
+        return root_type
+
+    def build_type(data):
+        # type: (Dict[str, Any]) -> GraphQLNamedType
+        kind = data.get("kind")
+        name = data["name"]
+        description = data.get("description")
+        if kind is None:
+            return _builtin_types[name]
+
+        if kind == "OBJECT":
+            python_type = data.get("python_type")
+            if isinstance(python_type, list):
+                python_type = tuple(get_object(path) for path in python_type)
+            else:
+                python_type = get_object(python_type)
+            return GraphQLObjectType(
+                name,
+                fields=lambda: build_fields(data["fields"]),
+                interfaces=lambda: get_types(data.get("interfaces", [])),
+                is_type_of=get_object(data.get("is_type_of")),
+                description=description,
+                python_type=python_type,
+            )
+
+        if kind == "INTERFACE":
+            return GraphQLInterfaceType(
+                name,
+                fields=lambda: build_fields(data["fields"]),
+                resolve_type=get_object(data.get("resolve_type")),
+                description=description,
+            )
+
+        if kind == "UNION":
+            return GraphQLUnionType(
+                name,
+                types=lambda: get_types(data["types"]),
+                resolve_type=get_object(data.get("resolve_type")),
+                description=description,
+            )
+
+        if kind == "ENUM":
+            values = OrderedDict()
+            for value_data in data["values"]:
+                values[value_data["name"]] = GraphQLEnumValue(
+                    value=value_data.get("value", value_data["name"]),
+                    deprecation_reason=value_data.get("deprecation_reason"),
+                    description=value_data.get("description"),
+                )
+            return GraphQLEnumType(name, values, description=description)
+
+        if kind == "INPUT_OBJECT":
+            return GraphQLInputObjectType(
+                name,
+                fields=lambda: build_input_values(
+                    data["fields"], GraphQLInputObjectField
+                ),
+                description=description,
+                container_type=get_object(data.get("container_type")),
+            )
+
+        assert kind == "SCALAR", "Unknown type kind {}.".format(kind)
+        return GraphQLScalarType(
+            name,
+            description=description,
+            serialize=get_object(data["serialize"]),
+            parse_value=get_object(data.get("parse_value")),
+            parse_literal=get_object(data.get("parse_literal")),
+        )
+
+    for type_data in snapshot["types"]:
+        types[type_data["name"]] = build_type(type_data)
+
+    directives = None
+    if "directives" in snapshot:
+        directives = []
+        for data in snapshot["directives"]:
+            if "locations" not in data:
+                directives.append(_builtin_directives[data["name"]])
+                continue
+            directives.append(
+                GraphQLDirective(
+                    data["name"],
+                    description=data.get("description"),
+                    args=build_input_values(data.get("args", []), GraphQLArgument),
+                    locations=data["locations"],
+                )
+            )
+
+    query = get_root_type(snapshot["query"])
+    assert query is not None, "Schema snapshots must have a query type."
+    return GraphQLSchema(
+        query=query,
+        mutation=get_root_type(snapshot.get("mutation")),
+        subscription=get_root_type(snapshot.get("subscription")),
+        directives=directives,
+        types=list(types.values()),
+        assume_valid=True,
+    )
@@ -1,17 +1,53 @@
 from collections import OrderedDict
+from itertools import islice
 
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Iterable, List, Optional
 
-def suggestion_list(inp, options):
+# Only the first options given to `suggestion_list` are compared to the
+# input, so that typos against huge schemas stay cheap to report.
+MAX_SUGGESTION_CANDIDATES = 1000
+
+_suggestions_enabled = True
+
+
+def set_suggestions_enabled(enabled):
+    # type: (bool) -> None
+    """Enables or disables the "Did you mean" hints of validation errors,
+    which also reveal the names of the schema."""
+    global _suggestions_enabled
+    _suggestions_enabled = bool(enabled)
+
+
+def suggestions_enabled():
+    # type: () -> bool
+    return _suggestions_enabled
+
+
+def suggestion_list(inp, options, max_candidates=None):
+    # type: (str, Iterable[str], Optional[int]) -> List[str]
     """
      Given an invalid input string and a list of valid options, returns a filtered
      list of valid options sorted based on their similarity with the input.
+     Only the first `max_candidates` options are considered (by default
+     `MAX_SUGGESTION_CANDIDATES`), and no option is returned when suggestions
+     are disabled.
     """
-    options_by_distance = OrderedDict()
+    if not _suggestions_enabled:
+        return []
+    if max_candidates is None:
+        max_candidates = MAX_SUGGESTION_CANDIDATES
+
+    options_by_distance = OrderedDict()  # type: OrderedDict
     input_threshold = len(inp) / 2
+    row = []  # type: List[int]
 
-    for option in options:
-        distance = lexical_distance(inp, option)
+    for option in islice(options, max_candidates):
+        if option in options_by_distance:
+            continue
         threshold = max(input_threshold, len(option) / 2, 1)
+        distance = lexical_distance(inp, option, threshold, row)
         if distance <= threshold:
             options_by_distance[option] = distance
 
@@ -20,33 +56,55 @@ def suggestion_list(inp, options):
     )
 
 
-def lexical_distance(a, b):
+def lexical_distance(a, b, threshold=None, row=None):
+    # type: (str, str, Optional[float], Optional[List[int]]) -> int
     """
      Computes the lexical distance between strings A and B.
      The "distance" between two strings is given by counting the minimum number
      of edits needed to transform string A into string B. An edit can be an
-     insertion, deletion, or substitution of a single character, or a swap of two
-     adjacent characters.
+     insertion, deletion, or substitution of a single character.
      This distance can be useful for detecting typos in input or sorting
      @returns distance in number of edits
-    """
 
-    d = [[i] for i in range(len(a) + 1)] or []
-    d_len = len(d) or 1
-    for i in range(d_len):
-        for j in range(1, len(b) + 1):
-            if i == 0:
-                d[i].append(j)
-            else:
-                d[i].append(0)
+     When the distance is over the given `threshold`, the computation stops
+     as soon as this is known, and a lower bound of the distance, over the
+     threshold too, is returned. `row` is a list reused as the buffer of the
+     computation, to avoid allocating one for every compared string.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    len_a = len(a)
+    len_b = len(b)
 
-    for i in range(1, len(a) + 1):
-        for j in range(1, len(b) + 1):
-            cost = 0 if a[i - 1] == b[j - 1] else 1
+    if threshold is not None and len_a - len_b > threshold:
+        return len_a - len_b
 
-            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+    # The buffer holds a single row of the distance matrix, overwritten in
+    # place: `diagonal` keeps the value of the previous row it replaces.
+    if row is None:
+        row = []
+    row[: len_b + 1] = range(len_b + 1)
 
-            if i > 1 and j < 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
-                d[i][j] = min(d[i][j], d[i - 2][j - 2] + cost)
+    for i in range(1, len_a + 1):
+        char = a[i - 1]
+        diagonal = row[0]
+        row[0] = row_min = i
+        for j in range(1, len_b + 1):
+            above = row[j]
+            if char == b[j - 1]:
+                distance = diagonal
+            else:
+                distance = diagonal + 1
+            if above + 1 < distance:
+                distance = above + 1
+            if row[j - 1] + 1 < distance:
+                distance = row[j - 1] + 1
+            diagonal = above
+            row[j] = distance
+            if distance < row_min:
+                row_min = distance
+        # The minimum of a row never decreases in the following rows
+        if threshold is not None and row_min > threshold:
+            return row_min
 
-    return d[len(a)][len(b)]
+    return row[len_b]
@@ -845,3 +845,72 @@ def test_does_not_allow_extending_a_scalar():
         extend_schema(test_schema, ast)
 
     assert str(exc_info.value) == 'Cannot extend non-object type "String".'
+
+
+def test_incremental_extension_shares_unchanged_types():
+    ast = parse(
+        """
+      extend type Biz {
+        newField: String
+      }
+
+      type Unused {
+        foo: Foo
+      }
+    """
+    )
+    extended_schema = extend_schema(test_schema, ast, incremental=True)
+
+    assert print_schema(extended_schema) == print_schema(
+        extend_schema(test_schema, ast)
+    )
+    for name in ["Foo", "Bar", "SomeInterface", "SomeEnum"]:
+        assert extended_schema.get_type(name) is test_schema.get_type(name)
+    for name in ["Biz", "SomeUnion", "Query"]:
+        assert extended_schema.get_type(name) is not test_schema.get_type(name)
+    assert "newField" not in test_schema.get_type("Biz").fields
+    assert extended_schema.get_type("SomeUnion").types[1] is extended_schema.get_type(
+        "Biz"
+    )
+    assert extended_schema.get_possible_types(
+        extended_schema.get_type("SomeInterface")
+    ) == [FooType, BarType]
+
+
+def test_incremental_extension_keeps_resolvers():
+    schema = GraphQLSchema(
+        query=GraphQLObjectType(
+            name="Query",
+            fields={
+                "hello": GraphQLField(GraphQLString, resolver=lambda *_: "world")
+            },
+        )
+    )
+    ast = parse(
+        """
+      extend type Query {
+        newField: String
+      }
+    """
+    )
+    extended_schema = extend_schema(schema, ast, incremental=True)
+
+    result = execute(extended_schema, parse("{ hello newField }"), {"newField": "new"})
+    assert not result.errors
+    assert result.data == {"hello": "world", "newField": "new"}
+
+
+def test_incremental_extension_checks_extended_types():
+    ast = parse(
+        """
+      extend type Biz implements SomeInterface {
+        name: String
+      }
+    """
+    )
+    with raises(AssertionError) as exc_info:
+        extend_schema(test_schema, ast, incremental=True)
+
+    assert str(exc_info.value) == (
+        '"SomeInterface" expects field "some" but "Biz" does not provide it.'
+    )
@@ -0,0 +1,45 @@
+from pytest import raises
+
+from graphql.error import GraphQLSyntaxError
+from graphql.language.parser import parse
+from graphql.utils.normalize_document import (
+    get_normalized_document_hash,
+    normalize_document,
+)
+
+
+def test_normalizes_whitespace_comments_and_definitions_order():
+    document = """
+    # A comment
+    fragment Name on User { name }
+
+    query Q($b: Int, $a: String = "x") {
+      user(id: 1, filter: {b: 2, a: [1, 2]}) @include(if: true) {
+        ...Name
+        id
+      }
+    }
+    """
+    same_document = (
+        'query Q($a:String="x",$b:Int){user(filter:{a:[1 2],b:2},id:1)'
+        "@include(if:true){...Name id}} fragment Name on User{name}"
+    )
+    assert normalize_document(document) == (
+        'query Q($a:String="x"$b:Int){user(filter:{a:[1 2]b:2}id:1)'
+        "@include(if:true){...Name id}}fragment Name on User{name}"
+    )
+    assert normalize_document(same_document) == normalize_document(document)
+    assert normalize_document(parse(document)) == normalize_document(document)
+    assert get_normalized_document_hash(same_document) == (
+        get_normalized_document_hash(document)
+    )
+
+
+def test_keeps_selections_order_and_operation_names():
+    assert normalize_document("{ a b }") != normalize_document("{ b a }")
+    assert normalize_document("query A { a }") != normalize_document("query B { a }")
+
+
+def test_raises_syntax_errors():
+    with raises(GraphQLSyntaxError):
+        normalize_document("{ a")
@@ -0,0 +1,195 @@
+import json
+
+from pytest import raises
+
+from graphql import graphql, parse
+from graphql.utils.build_ast_schema import build_ast_schema
+from graphql.utils.introspection_query import introspection_query
+from graphql.utils.schema_printer import print_schema
+from graphql.utils.schema_snapshot import (
+    load_schema_snapshot,
+    save_schema_snapshot,
+    schema_from_snapshot,
+    schema_to_snapshot,
+)
+
+from ...type import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+SDL = """
+schema {
+  query: Query
+}
+
+directive @custom(a: Int = 3) on FIELD
+
+interface Node {
+  id: ID!
+}
+
+type User implements Node {
+  id: ID!
+  name(upper: Boolean = false, sort: [Order] = [ASC]): String
+  friends: [User!]!
+}
+
+enum Order {
+  ASC
+  DESC @deprecated(reason: "Use ASC")
+}
+
+input Filter {
+  a: Int = 1
+  b: [String]
+  o: Order = DESC
+}
+
+union Result = User
+
+scalar Date
+
+type Query {
+  node(id: ID!, filter: Filter = {a: 2}): Node
+  result: Result
+  date: Date
+}
+"""
+
+
+class Pet(object):
+    def __init__(self, name):
+        self.name = name
+
+
+def serialize_upper(value):
+    return value.upper()
+
+
+def parse_upper(value):
+    return value.lower()
+
+
+def parse_upper_literal(value_ast):
+    return value_ast.value.lower()
+
+
+def resolve_pets(root, info, name):
+    return [Pet(name)]
+
+
+UpperString = GraphQLScalarType(
+    "UpperString",
+    serialize=serialize_upper,
+    parse_value=parse_upper,
+    parse_literal=parse_upper_literal,
+)
+NamedType = GraphQLInterfaceType("Named", {"name": GraphQLField(UpperString)})
+PetType = GraphQLObjectType(
+    "Pet",
+    {"name": GraphQLField(UpperString)},
+    interfaces=[NamedType],
+    python_type=Pet,
+)
+
+
+def make_pet_schema():
+    return GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "pets": GraphQLField(
+                    GraphQLList(NamedType),
+                    args={"name": GraphQLArgument(UpperString, "REX")},
+                    resolver=resolve_pets,
+                )
+            },
+        ),
+        types=[PetType],
+    )
+
+
+def test_snapshot_round_trip_of_sdl_schema():
+    schema = build_ast_schema(parse(SDL))
+    snapshot = json.loads(json.dumps(schema_to_snapshot(schema)))
+    loaded = schema_from_snapshot(snapshot)
+
+    assert print_schema(loaded) == print_schema(schema)
+    result = graphql(loaded, introspection_query)
+    assert not result.errors
+    assert result.data == graphql(schema, introspection_query).data
+
+
+def test_snapshot_binds_functions_by_import_path(tmpdir):
+    path = str(tmpdir.join("schema.json"))
+    save_schema_snapshot(make_pet_schema(), path)
+    loaded = load_schema_snapshot(path)
+
+    loaded_pet_type = loaded.get_type("Pet")
+    assert loaded_pet_type is not PetType
+    assert loaded_pet_type.python_type is Pet
+    assert loaded.get_query_type().fields["pets"].resolver is resolve_pets
+
+    result = graphql(loaded, '{ pets { name } other: pets(name: "FIDO") { name } }')
+    assert not result.errors
+    assert result.data == {"pets": [{"name": "REX"}], "other": [{"name": "FIDO"}]}
+
+
+def test_snapshot_rejects_functions_without_import_path():
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query", {"a": GraphQLField(GraphQLString, resolver=lambda *_: "a")}
+        )
+    )
+    with raises(AssertionError) as excinfo:
+        schema_to_snapshot(schema)
+    message = str(excinfo.value)
+    assert message.startswith("Cannot snapshot Query.a: <function ")
+    assert message.endswith("can't be imported by path.")
+
+
+def make_big_sdl(size=300):
+    types = []
+    for i in range(size):
+        types.append(
+            """
+interface Node{i} {{ id: ID! }}
+type Type{i} implements Node{i} {{
+  id: ID!
+  name(upper: Boolean = false): String
+  next: Type{next}
+  items(first: Int = 10): [Type{next}!]!
+}}
+""".format(
+                i=i, next=(i + 1) % size
+            )
+        )
+    fields = "\n".join("  type{i}: Type{i}".format(i=i) for i in range(size))
+    return "".join(types) + "type Query {{\n{}\n}}\nschema {{ query: Query }}\n".format(
+        fields
+    )
+
+
+def test_build_ast_schema_cold_start(benchmark):
+    sdl = make_big_sdl()
+
+    @benchmark
+    def build():
+        return build_ast_schema(parse(sdl)).freeze()
+
+
+def test_schema_snapshot_cold_start(benchmark, tmpdir):
+    path = str(tmpdir.join("schema.json"))
+    save_schema_snapshot(build_ast_schema(parse(make_big_sdl())), path)
+
+    @benchmark
+    def load():
+        # Freezing defines the field maps the snapshot loads lazily
+        return load_schema_snapshot(path).freeze()
@@ -1,4 +1,9 @@
-from graphql.utils.suggestion_list import suggestion_list
+from graphql.utils.suggestion_list import (
+    lexical_distance,
+    set_suggestions_enabled,
+    suggestion_list,
+    suggestions_enabled,
+)
 
 
 def test_returns_results_when_input_is_empty():
@@ -17,3 +22,43 @@ def test_returns_options_sorted_based_on_similarity():
         "stomer",
         "store",
     ]
+
+
+def test_computes_the_lexical_distance():
+    assert lexical_distance("", "") == 0
+    assert lexical_distance("abc", "") == 3
+    assert lexical_distance("", "abc") == 3
+    assert lexical_distance("kitten", "sitting") == 3
+    assert lexical_distance("sitting", "kitten") == 3
+    assert lexical_distance("customer", "csutomer") == 2
+
+
+def test_stops_the_lexical_distance_over_the_threshold():
+    assert lexical_distance("kitten", "sitting", threshold=3) == 3
+    assert lexical_distance("kitten", "sitting", threshold=1) > 1
+    assert lexical_distance("a", "abcdefgh", threshold=2) > 2
+    assert lexical_distance("abcdefgh", "zyxwvuts", threshold=2) > 2
+
+
+def test_reuses_the_lexical_distance_buffer():
+    row = []
+    assert lexical_distance("kitten", "sitting", row=row) == 3
+    assert lexical_distance("ab", "a", row=row) == 1
+    assert lexical_distance("kitten", "sitting", row=row) == 3
+
+
+def test_only_compares_the_first_candidates():
+    options = ["x{}".format(i) for i in range(10)] + ["abc"]
+    assert suggestion_list("abd", options) == ["abc"]
+    assert suggestion_list("abd", options, max_candidates=10) == []
+    assert suggestion_list("abd", iter(options), max_candidates=11) == ["abc"]
+
+
+def test_returns_no_suggestion_when_disabled():
+    set_suggestions_enabled(False)
+    try:
+        assert not suggestions_enabled()
+        assert suggestion_list("abc", ["a", "ab", "abc"]) == []
+    finally:
+        set_suggestions_enabled(True)
+    assert suggestion_list("abc", ["a", "ab", "abc"]) == ["abc", "ab"]
@@ -14,6 +14,7 @@ from .no_unused_variables import NoUnusedVariables
 from .overlapping_fields_can_be_merged import OverlappingFieldsCanBeMerged
 from .possible_fragment_spreads import PossibleFragmentSpreads
 from .provided_non_null_arguments import ProvidedNonNullArguments
+from .query_complexity import QueryComplexity, get_query_complexity
 from .scalar_leafs import ScalarLeafs
 from .unique_argument_names import UniqueArgumentNames
 from .unique_fragment_names import UniqueFragmentNames
@@ -74,6 +75,7 @@ __all__ = [
     "OverlappingFieldsCanBeMerged",
     "PossibleFragmentSpreads",
     "ProvidedNonNullArguments",
+    "QueryComplexity",
     "ScalarLeafs",
     "UniqueArgumentNames",
     "UniqueFragmentNames",
@@ -82,4 +84,5 @@ __all__ = [
     "VariablesAreInputTypes",
     "VariablesInAllowedPosition",
     "specified_rules",
+    "get_query_complexity",
 ]
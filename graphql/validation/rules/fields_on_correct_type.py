@@ -4,7 +4,7 @@ from ...error import GraphQLError
 from ...pyutils.ordereddict import OrderedDict
 from ...type.definition import GraphQLInterfaceType, GraphQLObjectType, GraphQLUnionType
 from ...utils.quoted_or_list import quoted_or_list
-from ...utils.suggestion_list import suggestion_list
+from ...utils.suggestion_list import suggestion_list, suggestions_enabled
 from .base import ValidationRule
 
 # Necessary for static type checking
@@ -94,6 +94,9 @@ def get_suggested_type_names(schema, output_type, field_name):
       suggest them, sorted by how often the type is referenced,  starting
       with Interfaces."""
 
+    if not suggestions_enabled():
+        return []
+
     if isinstance(output_type, (GraphQLInterfaceType, GraphQLUnionType)):
         suggested_object_types = []
         interface_usage_count = OrderedDict()
@@ -0,0 +1,303 @@
+from weakref import WeakKeyDictionary
+
+from ...error import GraphQLError
+from ...execution.values import get_argument_values
+from ...language import ast
+from ...type.definition import (
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLObjectType,
+    get_named_type,
+    get_nullable_type,
+)
+from ...type.directives import GraphQLIncludeDirective, GraphQLSkipDirective
+from ...type.introspection import (
+    SchemaMetaFieldDef,
+    TypeMetaFieldDef,
+    TypeNameMetaFieldDef,
+)
+from ...utils.type_from_ast import type_from_ast
+from ...utils.value_from_ast import value_from_ast
+from .base import ValidationRule
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from ..validation import ValidationContext
+    from ...language.ast import Document, OperationDefinition, SelectionSet
+    from ...type.definition import GraphQLField
+    from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+_document_complexity = WeakKeyDictionary()  # type: WeakKeyDictionary
+
+
+def get_query_complexity(document_ast):
+    # type: (Document) -> Optional[Dict[Optional[str], int]]
+    """Returns the complexity computed by the QueryComplexity rule for each
+    operation of the given document, keyed by operation name, or None if the
+    document was not validated with the rule."""
+    return _document_complexity.get(document_ast)
+
+
+class QueryComplexity(ValidationRule):
+    """Computes the static cost of every operation and rejects those over
+    `max_complexity`.
+
+    The cost of a field is its `cost` (`default_cost` if not set) plus the
+    cost of its sub-selection times its `multiplier`. List fields without a
+    multiplier use `default_list_multiplier`, and so do fields whose
+    multiplier argument isn't a non-negative integer. The walk of an operation
+    stops as soon as its cost goes over `max_complexity`, the complexity of
+    such operations being only a lower bound. Since the rule is configured
+    through keyword arguments, pass it to validate as a partial:
+
+        rules = specified_rules + [
+            partial(QueryComplexity, max_complexity=1000, variables=variables)
+        ]
+        errors = validate(schema, document_ast, rules)
+        complexity = get_query_complexity(document_ast)
+    """
+
+    __slots__ = (
+        "max_complexity",
+        "variables",
+        "default_cost",
+        "default_list_multiplier",
+        "operations",
+        "fragment_costs",
+    )
+
+    def __init__(
+        self,
+        context,  # type: ValidationContext
+        max_complexity=None,  # type: Optional[int]
+        variables=None,  # type: Optional[Dict[str, Any]]
+        default_cost=1,  # type: int
+        default_list_multiplier=1,  # type: int
+    ):
+        # type: (...) -> None
+        super(QueryComplexity, self).__init__(context)
+        self.max_complexity = max_complexity
+        self.variables = variables or {}
+        self.default_cost = default_cost
+        self.default_list_multiplier = default_list_multiplier
+        self.operations = []  # type: List[OperationDefinition]
+        # Cost of each fragment per parent type, for the current operation
+        self.fragment_costs = {}  # type: Dict[Tuple[str, Optional[str]], int]
+
+    def enter_OperationDefinition(self, node, key, parent, path, ancestors):
+        # type: (OperationDefinition, Any, Any, List, List) -> bool
+        self.operations.append(node)
+        return False
+
+    def enter_FragmentDefinition(self, node, key, parent, path, ancestors):
+        return False
+
+    def leave_Document(self, node, key, parent, path, ancestors):
+        # type: (Document, Any, Any, List, List) -> None
+        schema = self.context.get_schema()
+        complexity = {}  # type: Dict[Optional[str], int]
+        for operation in self.operations:
+            if operation.operation == "mutation":
+                root_type = schema.get_mutation_type()
+            elif operation.operation == "subscription":
+                root_type = schema.get_subscription_type()
+            else:
+                root_type = schema.get_query_type()
+            if not root_type:
+                continue
+
+            variables = self.get_variable_values(operation)
+            self.fragment_costs = {}
+            cost = self.selection_set_cost(
+                root_type,
+                operation.selection_set,
+                variables,
+                set(),
+                self.max_complexity,
+            )
+            name = operation.name.value if operation.name else None
+            complexity[name] = cost
+
+            if self.max_complexity is not None and cost > self.max_complexity:
+                self.context.report_error(
+                    GraphQLError(
+                        self.too_complex_message(name, self.max_complexity),
+                        [operation],
+                    )
+                )
+
+        self.fragment_costs = {}
+        _document_complexity[node] = complexity
+
+    def get_variable_values(self, operation):
+        # type: (OperationDefinition) -> Dict[str, Any]
+        variables = {}
+        schema = self.context.get_schema()
+        for definition in operation.variable_definitions or []:
+            name = definition.variable.name.value
+            if name in self.variables:
+                variables[name] = self.variables[name]
+            elif definition.default_value is not None:
+                var_type = type_from_ast(schema, definition.type)
+                if var_type:
+                    variables[name] = value_from_ast(definition.default_value, var_type)
+        return variables
+
+    def selection_set_cost(
+        self,
+        parent_type,  # type: Any
+        selection_set,  # type: SelectionSet
+        variables,  # type: Dict[str, Any]
+        visited_fragments,  # type: Set[str]
+        budget=None,  # type: Optional[int]
+    ):
+        # type: (...) -> int
+        """Returns the cost of the selection set, or a lower bound of it over
+        `budget` when it goes over it."""
+        cost = 0
+        for selection in selection_set.selections:
+            if budget is not None and cost > budget:
+                return cost
+
+            if not self.should_include(selection, variables):
+                continue
+
+            remaining = None if budget is None else budget - cost
+            if isinstance(selection, ast.Field):
+                field_def = self.get_field_def(parent_type, selection.name.value)
+                if field_def:
+                    cost += self.field_cost(
+                        field_def, selection, variables, visited_fragments, remaining
+                    )
+
+            elif isinstance(selection, ast.InlineFragment):
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = type_from_ast(
+                        self.context.get_schema(), selection.type_condition
+                    )
+                cost += self.selection_set_cost(
+                    fragment_type,
+                    selection.selection_set,
+                    variables,
+                    visited_fragments,
+                    remaining,
+                )
+
+            elif isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = self.context.get_fragment(name)
+                if not fragment or name in visited_fragments:
+                    continue
+                key = (name, getattr(parent_type, "name", None))
+                fragment_cost = self.fragment_costs.get(key)
+                if fragment_cost is None:
+                    fragment_type = type_from_ast(
+                        self.context.get_schema(), fragment.type_condition
+                    )
+                    visited_fragments.add(name)
+                    fragment_cost = self.selection_set_cost(
+                        fragment_type,
+                        fragment.selection_set,
+                        variables,
+                        visited_fragments,
+                        remaining,
+                    )
+                    visited_fragments.remove(name)
+                    if remaining is None or fragment_cost <= remaining:
+                        self.fragment_costs[key] = fragment_cost
+                cost += fragment_cost
+
+        return cost
+
+    def field_cost(
+        self,
+        field_def,  # type: GraphQLField
+        field_ast,  # type: ast.Field
+        variables,  # type: Dict[str, Any]
+        visited_fragments,  # type: Set[str]
+        budget=None,  # type: Optional[int]
+    ):
+        # type: (...) -> int
+        cost = field_def.cost if field_def.cost is not None else self.default_cost
+        if not field_ast.selection_set or (budget is not None and cost > budget):
+            return cost
+
+        multiplier = field_def.multiplier
+        if multiplier is None:
+            if isinstance(get_nullable_type(field_def.type), GraphQLList):
+                multiplier = self.default_list_multiplier
+            else:
+                multiplier = 1
+        elif not isinstance(multiplier, int):
+            try:
+                args = get_argument_values(
+                    field_def.args, field_ast.arguments, variables
+                )
+            except GraphQLError:
+                # Reported by ProvidedNonNullArguments
+                args = {}
+            if callable(multiplier):
+                multiplier = multiplier(args)
+            else:
+                multiplier = args.get(multiplier)
+            if (
+                not isinstance(multiplier, int)
+                or isinstance(multiplier, bool)
+                or multiplier < 0
+            ):
+                multiplier = self.default_list_multiplier
+        if not multiplier:
+            return cost
+
+        return cost + multiplier * self.selection_set_cost(
+            get_named_type(field_def.type),
+            field_ast.selection_set,
+            variables,
+            visited_fragments,
+            None if budget is None else (budget - cost) // multiplier,
+        )
+
+    def get_field_def(self, parent_type, field_name):
+        # type: (Any, str) -> Optional[GraphQLField]
+        if field_name == "__typename":
+            return TypeNameMetaFieldDef
+        if parent_type is self.context.get_schema().get_query_type():
+            if field_name == "__schema":
+                return SchemaMetaFieldDef
+            if field_name == "__type":
+                return TypeMetaFieldDef
+        if isinstance(parent_type, (GraphQLObjectType, GraphQLInterfaceType)):
+            return parent_type.fields.get(field_name)
+        return None
+
+    @staticmethod
+    def should_include(selection, variables):
+        # type: (Union[ast.Field, ast.FragmentSpread, ast.InlineFragment], Dict[str, Any]) -> bool
+        for directive in selection.directives or []:
+            name = directive.name.value
+            if name == GraphQLSkipDirective.name:
+                directive_def, excluded_if = GraphQLSkipDirective, True
+            elif name == GraphQLIncludeDirective.name:
+                directive_def, excluded_if = GraphQLIncludeDirective, False
+            else:
+                continue
+            try:
+                args = get_argument_values(
+                    directive_def.args, directive.arguments, variables
+                )
+            except GraphQLError:
+                # Unknown condition, count the selection
+                continue
+            if args.get("if") is excluded_if:
+                return False
+        return True
+
+    @staticmethod
+    def too_complex_message(operation_name, max_complexity):
+        # type: (Optional[str], int) -> str
+        if operation_name:
+            return 'Operation "{}" exceeds the maximum complexity of {}.'.format(
+                operation_name, max_complexity
+            )
+        return "Operation exceeds the maximum complexity of {}.".format(max_complexity)
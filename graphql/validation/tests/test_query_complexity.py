@@ -0,0 +1,151 @@
+from functools import partial
+
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+from graphql.validation import specified_rules, validate
+from graphql.validation.rules import QueryComplexity, get_query_complexity
+
+User = GraphQLObjectType(
+    "User",
+    lambda: {
+        "name": GraphQLField(GraphQLString),
+        "expensive": GraphQLField(GraphQLString, cost=10),
+        "friends": GraphQLField(
+            GraphQLList(User),
+            args={"first": GraphQLArgument(GraphQLInt)},
+            multiplier="first",
+        ),
+        "followers": GraphQLField(
+            GraphQLList(User),
+            args={"limit": GraphQLArgument(GraphQLInt, default_value=5)},
+            multiplier=lambda args: args["limit"] * 2,
+        ),
+        "tags": GraphQLField(GraphQLList(User)),
+    },
+)
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        {"me": GraphQLField(User), "users": GraphQLField(GraphQLList(User), cost=5)},
+    )
+)
+
+
+def complexity(query, **options):
+    document = parse(query)
+    errors = validate(schema, document, [partial(QueryComplexity, **options)])
+    return errors, get_query_complexity(document)
+
+
+def test_counts_each_field_once():
+    # type: () -> None
+    errors, costs = complexity("{ me { name expensive } }")
+    assert not errors
+    assert costs == {None: 1 + 1 + 10}
+
+
+def test_multiplier_from_argument_and_variables():
+    # type: () -> None
+    query = """
+        query Friends($first: Int = 3) {
+            me { friends(first: $first) { name friends(first: 2) { name } } }
+        }
+    """
+    assert complexity(query)[1] == {"Friends": 1 + (1 + 3 * (1 + (1 + 2 * 1)))}
+    assert complexity(query, variables={"first": 10})[1] == {
+        "Friends": 1 + (1 + 10 * (1 + (1 + 2 * 1)))
+    }
+
+
+def test_multiplier_function_and_default_list_multiplier():
+    # type: () -> None
+    query = "{ me { followers { name } tags { name } } }"
+    assert complexity(query)[1] == {None: 1 + (1 + 10 * 1) + (1 + 1)}
+    assert complexity(query, default_list_multiplier=4)[1] == {
+        None: 1 + (1 + 10 * 1) + (1 + 4 * 1)
+    }
+
+
+def test_fragments_and_skipped_selections():
+    # type: () -> None
+    query = """
+        query Q($skip: Boolean) {
+            users { ...UserFields ... on User { expensive } }
+            me @skip(if: $skip) { name }
+        }
+        fragment UserFields on User { name }
+    """
+    assert complexity(query)[1] == {"Q": 5 + (1 + 10) + 1 + 1}
+    assert complexity(query, variables={"skip": True})[1] == {"Q": 5 + (1 + 10)}
+
+
+def test_rejects_operations_over_the_budget():
+    # type: () -> None
+    query = """
+        query Small { me { name } }
+        query Big { me { friends(first: 100) { friends(first: 100) { name } } } }
+    """
+    errors, costs = complexity(query, max_complexity=1000)
+    assert costs == {"Small": 2, "Big": 1 + 1 + 100 * (1 + 100)}
+    assert [error.message for error in errors] == [
+        'Operation "Big" exceeds the maximum complexity of 1000.'
+    ]
+
+
+def test_negative_multiplier_arguments_use_the_default_multiplier():
+    # type: () -> None
+    query = """{
+        a: me { friends(first: 1000) { friends(first: 1000) { name } } }
+        b: me { friends(first: -1000) { friends(first: 1000) { name } } }
+    }"""
+    errors, costs = complexity(query, default_list_multiplier=10)
+    assert costs == {
+        None: 1 + 1 + 1000 * (1 + 1000) + 1 + 1 + 10 * (1 + 1000)
+    }
+    errors, costs = complexity(query, max_complexity=100)
+    assert [error.message for error in errors] == [
+        "Operation exceeds the maximum complexity of 100."
+    ]
+
+
+def test_fragments_are_costed_once_and_walks_stop_over_the_budget():
+    # type: () -> None
+    fragments = "".join(
+        "fragment F{} on User {{ friends(first: 2) {{ ...F{} ...F{} }} }}\n".format(
+            i, i + 1, i + 1
+        )
+        for i in range(40)
+    )
+    query = "{ me { ...F0 } }\n" + fragments + "fragment F40 on User { name }"
+    errors, costs = complexity(query)
+    assert not errors
+    cost = 1
+    for _ in range(40):
+        cost = 1 + 2 * 2 * cost
+    assert costs == {None: 1 + cost}
+
+    errors, costs = complexity(query, max_complexity=1000)
+    assert [error.message for error in errors] == [
+        "Operation exceeds the maximum complexity of 1000."
+    ]
+    assert 1000 < costs[None] <= 1 + cost
+
+
+def test_works_along_specified_rules():
+    # type: () -> None
+    document = parse("{ me { name } }")
+    rules = specified_rules + [partial(QueryComplexity, max_complexity=1)]
+    errors = validate(schema, document, rules)
+    assert len(errors) == 1
+    assert errors[0].message == (
+        "Operation exceeds the maximum complexity of 1."
+    )
@@ -62,3 +62,37 @@ def test_validates_using_a_custom_type_info():
         errors[2].message
         == 'Cannot query field "isHousetrained" on type "Dog". Did you mean "isHousetrained"?'
     )
+
+
+def test_stops_validation_after_max_errors():
+    ast = parse(
+        """
+      {
+        unknownA
+        unknownB
+        unknownC
+        unknownD
+      }
+    """
+    )
+
+    errors = validate(test_schema, ast)
+    assert len(errors) == 4
+
+    errors = validate(test_schema, ast, max_errors=2)
+    assert [error.message for error in errors] == [
+        'Cannot query field "unknownA" on type "QueryRoot".',
+        'Cannot query field "unknownB" on type "QueryRoot".',
+        "Too many validation errors, error limit reached. Validation aborted.",
+    ]
+
+
+def test_does_not_report_max_errors_when_under_the_limit():
+    ast = parse("{ unknownA unknownB }")
+
+    for max_errors in (2, 3):
+        errors = validate(test_schema, ast, max_errors=max_errors)
+        assert [error.message for error in errors] == [
+            'Cannot query field "unknownA" on type "QueryRoot".',
+            'Cannot query field "unknownB" on type "QueryRoot".',
+        ]
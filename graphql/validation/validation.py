@@ -1,5 +1,12 @@
+from ..error import GraphQLError
 from ..language.ast import FragmentDefinition, FragmentSpread, OperationDefinition
-from ..language.visitor import ParallelVisitor, TypeInfoVisitor, Visitor, visit
+from ..language.visitor import (
+    BREAK,
+    ParallelVisitor,
+    TypeInfoVisitor,
+    Visitor,
+    visit,
+)
 from ..type import GraphQLSchema
 from ..utils.type_info import TypeInfo
 from .rules import specified_rules
@@ -8,7 +15,6 @@ from .rules import specified_rules
 if False:  # flake8: noqa
     from typing import List, Union, Optional, Dict, Set, Any, Type
     from ..language.ast import Document, SelectionSet, Node
-    from ..error import GraphQLError
     from .rules.base import ValidationRule
     from ..type.definition import (
         GraphQLObjectType,
@@ -20,23 +26,52 @@ if False:  # flake8: noqa
     )
 
 
-def validate(schema, ast, rules=specified_rules):
-    # type: (GraphQLSchema, Document, List[Type[ValidationRule]]) -> List
+def validate(schema, ast, rules=specified_rules, max_errors=None):
+    # type: (GraphQLSchema, Document, List[Type[ValidationRule]], Optional[int]) -> List
+    """Returns the errors of the document. With `max_errors`, validation stops
+    at the first error past that many, returning the first `max_errors`
+    errors followed by an error telling that there were too many errors."""
     assert schema, "Must provide schema"
     assert ast, "Must provide document"
     assert isinstance(schema, GraphQLSchema)
     type_info = TypeInfo(schema)
-    return visit_using_rules(schema, type_info, ast, rules)
+    return visit_using_rules(schema, type_info, ast, rules, max_errors)
 
 
-def visit_using_rules(schema, type_info, ast, rules):
-    # type: (GraphQLSchema, TypeInfo, Document, List[Type[ValidationRule]]) -> List
-    context = ValidationContext(schema, ast, type_info)
+def visit_using_rules(schema, type_info, ast, rules, max_errors=None):
+    # type: (GraphQLSchema, TypeInfo, Document, List[Type[ValidationRule]], Optional[int]) -> List
+    context = ValidationContext(schema, ast, type_info, max_errors)
     visitors = [rule(context) for rule in rules]
-    visit(ast, TypeInfoVisitor(type_info, ParallelVisitor(visitors)))
+    visitor = ParallelVisitor(visitors)  # type: Visitor
+    if max_errors is not None:
+        visitor = ErrorLimitVisitor(context, visitor)
+    visit(ast, TypeInfoVisitor(type_info, visitor))
     return context.get_errors()
 
 
+class ErrorLimitVisitor(Visitor):
+    """Stops the traversal once the context has too many errors."""
+
+    __slots__ = "context", "visitor"
+
+    def __init__(self, context, visitor):
+        # type: (ValidationContext, Visitor) -> None
+        self.context = context
+        self.visitor = visitor
+
+    def enter(self, node, key, parent, path, ancestors):
+        # type: (Any, Any, Any, List, List) -> Any
+        if self.context.has_too_many_errors():
+            return BREAK
+        return self.visitor.enter(node, key, parent, path, ancestors)
+
+    def leave(self, node, key, parent, path, ancestors):
+        # type: (Any, Any, Any, List, List) -> Any
+        if self.context.has_too_many_errors():
+            return BREAK
+        return self.visitor.leave(node, key, parent, path, ancestors)
+
+
 class VariableUsage(object):
     __slots__ = "node", "type"
 
@@ -72,10 +107,11 @@ class ValidationContext(object):
         "_recursively_referenced_fragments",
         "_variable_usages",
         "_recursive_variable_usages",
+        "_max_errors",
     )
 
-    def __init__(self, schema, ast, type_info):
-        # type: (GraphQLSchema, Document, TypeInfo) -> None
+    def __init__(self, schema, ast, type_info, max_errors=None):
+        # type: (GraphQLSchema, Document, TypeInfo, Optional[int]) -> None
         self._schema = schema
         self._ast = ast
         self._type_info = type_info
@@ -89,9 +125,22 @@ class ValidationContext(object):
         self._recursive_variable_usages = (
             {}
         )  # type: Dict[OperationDefinition, List[VariableUsage]]
+        self._max_errors = max_errors
 
     def report_error(self, error):
-        self._errors.append(error)
+        if self._max_errors is None or len(self._errors) < self._max_errors:
+            self._errors.append(error)
+        elif len(self._errors) == self._max_errors:
+            self._errors.append(
+                GraphQLError(
+                    "Too many validation errors, error limit reached. "
+                    "Validation aborted."
+                )
+            )
+
+    def has_too_many_errors(self):
+        # type: () -> bool
+        return self._max_errors is not None and len(self._errors) > self._max_errors
 
     def get_errors(self):
         # type: () -> List
@@ -102,3 +102,48 @@ def test_asyncio_py35_executor_with_error():
         }
     ]
     assert result.data == {"a": "hey", "b": None}
+
+
+def test_asyncio_py35_loader_registry_batches_across_coroutines():
+    from promise import Promise
+    from promise.dataloader import DataLoader
+    from graphql.type import GraphQLList
+
+    load_calls = []
+
+    def batch_load(keys):
+        load_calls.append(keys)
+        return Promise.resolve([key * 2 for key in keys])
+
+    async def resolve_double(root, info):
+        await asyncio.sleep(0.001)
+        return await info.loaders["double"].load(root)
+
+    Type = GraphQLObjectType(
+        "Type",
+        {
+            "numbers": GraphQLField(
+                GraphQLList(
+                    GraphQLObjectType(
+                        "Number",
+                        {
+                            "double": GraphQLField(
+                                GraphQLString, resolver=resolve_double
+                            )
+                        },
+                    )
+                ),
+                resolver=lambda *_: [1, 2, 3],
+            )
+        },
+    )
+    schema = GraphQLSchema(
+        Type, loaders={"double": lambda context: DataLoader(batch_load)}
+    )
+
+    result = execute(schema, parse("{ numbers { double } }"), executor=AsyncioExecutor())
+    assert not result.errors
+    assert result.data == {
+        "numbers": [{"double": "2"}, {"double": "4"}, {"double": "6"}]
+    }
+    assert load_calls == [[1, 2, 3]]
@@ -0,0 +1,48 @@
+import asyncio
+
+from graphql.execution import IncrementalExecutionResult, execute
+from graphql.execution.executors.asyncio import AsyncioExecutor
+from graphql.language.parser import parse
+from graphql.type import (
+    GraphQLDeferDirective,
+    GraphQLField,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+    specified_directives,
+)
+
+
+def test_asyncio_defer_async_iteration():
+    async def resolve_slow(context, *_):
+        await asyncio.sleep(0.001)
+        return "slow"
+
+    def resolve_fast(context, *_):
+        return "fast"
+
+    Type = GraphQLObjectType(
+        "Type",
+        {
+            "fast": GraphQLField(GraphQLString, resolver=resolve_fast),
+            "slow": GraphQLField(GraphQLString, resolver=resolve_slow),
+        },
+    )
+    schema = GraphQLSchema(
+        Type, directives=specified_directives + [GraphQLDeferDirective]
+    )
+    ast = parse("query Example { fast ... @defer { slow } }")
+
+    async def main():
+        result = await execute(
+            schema, ast, executor=AsyncioExecutor(), return_promise=True
+        )
+        assert isinstance(result, IncrementalExecutionResult)
+        assert result.data == {"fast": "fast"}
+        patches = []
+        async for patch in result.subsequent_results:
+            patches.append(patch.to_dict())
+        return patches
+
+    patches = asyncio.get_event_loop().run_until_complete(main())
+    assert patches == [{"data": {"slow": "slow"}, "path": [], "hasNext": False}]